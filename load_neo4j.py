@@ -16,7 +16,11 @@ def load_all_documents():
     budgets_loaded = 0
     errors = []
 
-    # Process all JSON files in metadata directory
+    # Read all JSON files in metadata directory, grouped by type
+    invoice_docs = []
+    invoice_files = []
+    contract_docs = []
+    contract_files = []
     for json_file in metadata_dir.glob("*.json"):
         try:
             with open(json_file, 'r', encoding='utf-8') as f:
@@ -25,16 +29,12 @@ def load_all_documents():
             doc_type = document.get('document_type')
 
             if doc_type == 'invoice':
-                graph.create_invoice_node(document)
-                invoices_loaded += 1
-                if invoices_loaded % 100 == 0:
-                    print(f"  Loaded {invoices_loaded} invoices...")
+                invoice_docs.append(document)
+                invoice_files.append(json_file.name)
 
             elif doc_type == 'contract':
-                graph.create_contract_node(document)
-                contracts_loaded += 1
-                if contracts_loaded % 10 == 0:
-                    print(f"  Loaded {contracts_loaded} contracts...")
+                contract_docs.append(document)
+                contract_files.append(json_file.name)
 
             elif doc_type == 'budget':
                 # Budgets are already loaded, skip
@@ -43,6 +43,25 @@ def load_all_documents():
         except Exception as e:
             errors.append(f"{json_file.name}: {str(e)}")
 
+    # Write each type with batched UNWIND queries on one shared session;
+    # documents that fail are reported per file and not counted as loaded
+    with graph.session() as session:
+        try:
+            failures = graph.create_invoice_nodes(invoice_docs, session=session)
+            invoices_loaded = len(invoice_docs) - len(failures)
+            errors.extend(f"{invoice_files[i]}: {str(e)}" for i, e in failures)
+            print(f"  Loaded {invoices_loaded} invoices...")
+        except Exception as e:
+            errors.append(f"invoices: {str(e)}")
+
+        try:
+            failures = graph.create_contract_nodes(contract_docs, session=session)
+            contracts_loaded = len(contract_docs) - len(failures)
+            errors.extend(f"{contract_files[i]}: {str(e)}" for i, e in failures)
+            print(f"  Loaded {contracts_loaded} contracts...")
+        except Exception as e:
+            errors.append(f"contracts: {str(e)}")
+
     graph.close()
 
     # Print summary
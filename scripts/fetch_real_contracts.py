@@ -493,20 +493,24 @@ def ingest_contracts(contracts: list[dict], graph: FinancialGraph, dry_run: bool
     """Store parsed contracts in Neo4j, then link to matching invoices."""
     ok = skipped = 0
 
-    for data in contracts:
-        if dry_run:
+    if dry_run:
+        for data in contracts:
             print(f"  [DRY] {data['contract_id']} | {data['vendor'][:40]} | "
                   f"{data['start_date']} -> {data['end_date']} | {data['annual_value']:,.0f} EUR")
             ok += 1
-            continue
-        try:
-            graph.create_contract(data)
-            print(f"  [OK]  {data['contract_id']} | {data['vendor'][:40]:<40} | "
-                  f"{data['end_date']} | {data['annual_value']:>10,.0f} EUR")
-            ok += 1
-        except Exception as e:
-            print(f"  [ERR] {data['contract_id']}: {e}")
-            skipped += 1
+        return ok, skipped
+
+    # One session for all writes instead of a new one per contract
+    with graph.session() as session:
+        for data in contracts:
+            try:
+                graph.create_contract(data, session=session)
+                print(f"  [OK]  {data['contract_id']} | {data['vendor'][:40]:<40} | "
+                      f"{data['end_date']} | {data['annual_value']:>10,.0f} EUR")
+                ok += 1
+            except Exception as e:
+                print(f"  [ERR] {data['contract_id']}: {e}")
+                skipped += 1
 
     return ok, skipped
 
@@ -515,7 +519,7 @@ def link_contracts_to_invoices(graph: FinancialGraph):
     """Create GENERATES relationships between new contracts and matching invoices."""
     print("\n[LINK] Creating Contract->Invoice relationships by vendor name match...")
     try:
-        with graph.driver.session() as session:
+        with graph.session() as session:
             result = session.run("""
                 MATCH (c:Contract), (i:Invoice)
                 WHERE toLower(trim(i.vendor)) = toLower(trim(c.vendor))
@@ -15,7 +15,7 @@ from typing import List, Dict, Any, Optional
 
 from fastapi import FastAPI, HTTPException, Query, BackgroundTasks
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
 import uvicorn
 from pydantic import BaseModel, Field
 from pathlib import Path
@@ -24,7 +24,7 @@ from pathlib import Path
 from src.config import settings
 from src.rag.graph import FinancialGraph
 from src.rag.vectorstore import VectorStore
-from src.llm.groq_client import answer_question
+from src.llm.groq_client import answer_question, answer_question_stream, warm_up as warm_up_llm
 from src.memory.episodic import EpisodicMemory
 from src.intelligence.weak_signals import WeakSignalDetector
 from src.intelligence.decision_fusion import DecisionFusion
@@ -109,6 +109,7 @@ async def lifespan(app: FastAPI):
         graph=app.state.graph,
         vectorstore=app.state.vectorstore,
         llm_fn=answer_question,
+        llm_stream_fn=answer_question_stream,
         memory=app.state.memory,
         decision_fusion=app.state.decision_fusion,
         weak_signals=app.state.weak_signals,
@@ -126,11 +127,15 @@ async def lifespan(app: FastAPI):
 
     print("[SUCCESS] Connected to Neo4j and VectorStore")
 
+    # Pre-open the Groq connection pool so the first chat skips the TLS handshake
+    if settings.GROQ_API_KEY:
+        warm_up_llm()
+
     yield  # Application runs here
 
     # Shutdown
     print("[SHUTDOWN] Shutting down FINCENTER API...")
-    app.state.graph.close()
+    await app.state.graph.aclose()
     print("[SUCCESS] Closed all connections")
 
 
@@ -291,6 +296,7 @@ async def get_all_contracts():
     """
     try:
         query = """
+        WITH date() AS today
         MATCH (c:Contract)
         RETURN c.id AS contract_id,
                c.vendor AS vendor,
@@ -298,14 +304,11 @@ async def get_all_contracts():
                c.annual_value AS annual_value,
                c.auto_renewal AS auto_renewal,
                CASE WHEN c.end_date IS NOT NULL
-                    THEN duration.inDays(date(), c.end_date).days
+                    THEN duration.inDays(today, c.end_date).days
                     ELSE 9999 END AS days_until_expiry
         ORDER BY days_until_expiry
         """
-        with app.state.graph.driver.session() as session:
-            result = session.run(query)
-            contracts = [dict(r) for r in result]
-        return contracts
+        return app.state.graph.run_read(query)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error fetching contracts: {str(e)}")
 
@@ -350,9 +353,7 @@ async def get_contract_clauses(contract_id: str):
         ORDER BY cl.type
         """
 
-        with app.state.graph.driver.session() as session:
-            result = session.run(query, contract_id=contract_id)
-            clauses = [dict(record) for record in result]
+        clauses = app.state.graph.run_read(query, contract_id=contract_id)
 
         if not clauses:
             raise HTTPException(status_code=404, detail=f"No clauses found for contract '{contract_id}'")
@@ -713,6 +714,22 @@ async def chat(request: ChatRequest):
         raise HTTPException(status_code=500, detail=f"Chat error: {str(e)}")
 
 
+@app.post("/api/chat/stream", tags=["AI Chat"])
+def chat_stream(request: ChatRequest):
+    """
+    Same as /api/chat, but streams the answer as plain text while it is generated.
+
+    The financial context is gathered before the response starts, so only
+    LLM errors can occur mid-stream.
+    """
+    try:
+        chunks = app.state.rag.query_stream(request.question)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Chat error: {str(e)}")
+
+    return StreamingResponse(chunks, media_type="text/plain; charset=utf-8")
+
+
 # ============================================
 # RAG Orchestrator Endpoint
 # ============================================
@@ -22,6 +22,10 @@ class Settings(BaseSettings):
     NEO4J_USER: str = Field(default="neo4j")
     NEO4J_PASSWORD: str = Field(default="fincenter2024")
     NEO4J_DATABASE: str = Field(default="neo4j")
+    NEO4J_MAX_POOL_SIZE: int = Field(default=50)
+    NEO4J_MAX_CONNECTION_LIFETIME: int = Field(default=3600)  # seconds
+    NEO4J_CONNECTION_ACQUISITION_TIMEOUT: float = Field(default=30.0)  # seconds
+    NEO4J_FETCH_SIZE: int = Field(default=10000)  # records pulled per round trip
     
     # PostgreSQL
     POSTGRES_HOST: str = Field(default="localhost")
@@ -11,6 +11,7 @@ Examples:
 """
 
 import re
+import threading
 from typing import List, Dict, Any, Optional, Set, Tuple
 import logging
 
@@ -25,6 +26,20 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Precompiled patterns for the regex fallback extractor
+SIRET_PATTERN = re.compile(r'\b\d{14}\b')
+VAT_PATTERN = re.compile(r'\b[A-Z]{2}\d{11}\b')
+COMPANY_PATTERNS = [
+    re.compile(r'\b([A-ZÉÈÊË][A-Za-zéèêëàâùûôîïç\s&-]+)\s+(SA|SARL|SAS|SASU|EURL|SCI)\b', re.IGNORECASE),
+    re.compile(r'\b([A-Z][A-Za-z\s&-]+)\s+(Ltd|LLC|Inc|Corp|GmbH|AG)\b', re.IGNORECASE),
+]
+EMAIL_PATTERN = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+PHONE_PATTERN = re.compile(r'\b(?:0|\+33\s?)[1-9](?:[\s.-]?\d{2}){4}\b')
+
+# Loaded extractors per spaCy model (None when the model could not be loaded)
+_EXTRACTORS: Dict[str, Optional['NERExtractor']] = {}
+_EXTRACTORS_LOCK = threading.Lock()
+
 
 class NERExtractor:
     """Financial Named Entity Recognition extractor."""
@@ -225,11 +240,50 @@ class NERExtractor:
         return unique_entities
 
 
+def model_name_for_lang(lang: str) -> str:
+    """
+    Get the spaCy model used for a language code.
+
+    Args:
+        lang: Language code ('fr' for French, 'en' for English)
+
+    Returns:
+        spaCy model name
+    """
+    return 'fr_core_news_lg' if lang == 'fr' else 'en_core_web_lg'
+
+
+def get_extractor(model_name: str) -> Optional[NERExtractor]:
+    """
+    Get the shared extractor for a spaCy model, loading it on first use.
+
+    Loading a spaCy model takes seconds, so each process loads it once,
+    even when called from several threads. A failed load is remembered and
+    not retried.
+
+    Args:
+        model_name: spaCy model name
+
+    Returns:
+        NERExtractor, or None if spaCy or the model is unavailable
+    """
+    if model_name not in _EXTRACTORS:
+        with _EXTRACTORS_LOCK:
+            if model_name not in _EXTRACTORS:
+                try:
+                    _EXTRACTORS[model_name] = NERExtractor(model_name=model_name)
+                except Exception as e:
+                    logger.error(f"Error loading NER model, using regex extraction: {e}")
+                    _EXTRACTORS[model_name] = None
+
+    return _EXTRACTORS[model_name]
+
+
 def extract_financial_entities(text: str, lang: str = 'fr') -> List[Dict[str, Any]]:
     """
     Extract named entities from financial text.
 
-    Convenience function that creates an extractor and extracts entities.
+    Convenience function that uses the shared extractor for the language.
 
     Args:
         text: Text to analyze
@@ -243,10 +297,11 @@ def extract_financial_entities(text: str, lang: str = 'fr') -> List[Dict[str, An
         >>> for entity in entities:
         ...     print(f"{entity['text']} ({entity['type']})")
     """
-    model_name = 'fr_core_news_lg' if lang == 'fr' else 'en_core_web_lg'
+    extractor = get_extractor(model_name_for_lang(lang))
+    if extractor is None:
+        return extract_entities_with_regex(text)
 
     try:
-        extractor = NERExtractor(model_name=model_name)
         return extractor.extract_entities(text)
     except Exception as e:
         logger.error(f"Error extracting entities: {e}")
@@ -272,7 +327,7 @@ def extract_entities_with_regex(text: str) -> List[Dict[str, Any]]:
     entities = []
 
     # SIRET pattern (14 digits)
-    siret_matches = re.finditer(r'\b\d{14}\b', text)
+    siret_matches = SIRET_PATTERN.finditer(text)
     for match in siret_matches:
         entities.append({
             'text': match.group(),
@@ -284,7 +339,7 @@ def extract_entities_with_regex(text: str) -> List[Dict[str, Any]]:
         })
 
     # VAT number pattern (e.g., FR12345678901)
-    vat_matches = re.finditer(r'\b[A-Z]{2}\d{11}\b', text)
+    vat_matches = VAT_PATTERN.finditer(text)
     for match in vat_matches:
         entities.append({
             'text': match.group(),
@@ -296,13 +351,8 @@ def extract_entities_with_regex(text: str) -> List[Dict[str, Any]]:
         })
 
     # Company name patterns (simplified)
-    company_patterns = [
-        r'\b([A-ZÉÈÊË][A-Za-zéèêëàâùûôîïç\s&-]+)\s+(SA|SARL|SAS|SASU|EURL|SCI)\b',
-        r'\b([A-Z][A-Za-z\s&-]+)\s+(Ltd|LLC|Inc|Corp|GmbH|AG)\b',
-    ]
-
-    for pattern in company_patterns:
-        matches = re.finditer(pattern, text, re.IGNORECASE)
+    for pattern in COMPANY_PATTERNS:
+        matches = pattern.finditer(text)
         for match in matches:
             entities.append({
                 'text': match.group(),
@@ -314,7 +364,7 @@ def extract_entities_with_regex(text: str) -> List[Dict[str, Any]]:
             })
 
     # Email addresses
-    email_matches = re.finditer(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b', text)
+    email_matches = EMAIL_PATTERN.finditer(text)
     for match in email_matches:
         entities.append({
             'text': match.group(),
@@ -326,7 +376,7 @@ def extract_entities_with_regex(text: str) -> List[Dict[str, Any]]:
         })
 
     # Phone numbers (French format)
-    phone_matches = re.finditer(r'\b(?:0|\+33\s?)[1-9](?:[\s.-]?\d{2}){4}\b', text)
+    phone_matches = PHONE_PATTERN.finditer(text)
     for match in phone_matches:
         entities.append({
             'text': match.group(),
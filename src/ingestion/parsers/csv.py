@@ -0,0 +1,81 @@
+"""
+CSV Accounting Parser
+
+Parses accounting ledger CSV files into lists of row dictionaries.
+Uses PyArrow's multithreaded CSV reader when available, pandas otherwise.
+
+Examples:
+    >>> from pathlib import Path
+    >>> entries = parse_accounting_csv(Path("general_ledger.csv"))
+    >>> print(entries[0]['entry_id'])
+"""
+
+from pathlib import Path
+from typing import Dict, Any, List, Optional
+import logging
+
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+logger = logging.getLogger(__name__)
+
+# Bytes per block handed to each PyArrow reader thread
+ARROW_BLOCK_SIZE = 1 << 20
+
+# Files at least this large are memory-mapped instead of read through a buffer
+MMAP_THRESHOLD_BYTES = 1 << 20
+
+
+class CSVParseError(Exception):
+    """Exception raised when CSV parsing fails."""
+    pass
+
+
+def parse_accounting_csv(csv_path: Path, columns: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+    """
+    Parse an accounting CSV file into row dictionaries.
+
+    Args:
+        csv_path: Path to CSV file
+        columns: Only read these columns (default: all columns)
+
+    Returns:
+        One dictionary per row, keyed by column name. Missing values are None.
+
+    Raises:
+        CSVParseError: If file cannot be parsed
+
+    Examples:
+        >>> rows = parse_accounting_csv(Path("ledger.csv"), columns=['entry_id', 'debit'])
+        >>> print(rows[0])
+        {'entry_id': 'E1', 'debit': 10}
+    """
+    if not csv_path.exists():
+        raise CSVParseError(f"File not found: {csv_path}")
+
+    try:
+        if HAS_PYARROW:
+            if csv_path.stat().st_size >= MMAP_THRESHOLD_BYTES:
+                source = pa.memory_map(str(csv_path))
+            else:
+                source = pa.OSFile(str(csv_path))
+
+            with source:
+                table = pa_csv.read_csv(
+                    source,
+                    read_options=pa_csv.ReadOptions(block_size=ARROW_BLOCK_SIZE),
+                    convert_options=pa_csv.ConvertOptions(include_columns=columns)
+                )
+                return table.to_pylist()
+
+        df = pd.read_csv(csv_path, usecols=columns)
+        return df.astype(object).where(df.notna(), None).to_dict('records')
+
+    except Exception as e:
+        raise CSVParseError(f"Error reading {csv_path}: {e}")
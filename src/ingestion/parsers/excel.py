@@ -76,7 +76,7 @@ def parse_budget_excel(excel_path: Path, sheet_name: Optional[str] = None) -> pd
             else:
                 ws = wb.active
 
-        logger.info(f"Parsing sheet '{ws.title}' from {excel_path.name}")
+        logger.info("Parsing sheet '%s' from %s", ws.title, excel_path.name)
 
         # Unmerge cells and fill with top-left value
         merged_ranges = list(ws.merged_cells.ranges)
@@ -141,7 +141,7 @@ def parse_budget_excel(excel_path: Path, sheet_name: Optional[str] = None) -> pd
         df['source_file'] = str(excel_path)
         df['sheet_name'] = ws.title
 
-        logger.info(f"Parsed {len(df)} budget rows from {excel_path.name}")
+        logger.info("Parsed %d budget rows from %s", len(df), excel_path.name)
         return df
 
     except Exception as e:
@@ -334,6 +334,25 @@ def _detect_column_mapping(columns: List[str]) -> Dict[str, str]:
     return mapping
 
 
+def dataframe_to_records(df: pd.DataFrame) -> List[Dict[str, Any]]:
+    """
+    Convert a parsed budget DataFrame into one dictionary per row.
+
+    Same result as df.to_dict('records'), but each column is converted to
+    Python objects once with Series.tolist() and rows are zipped together,
+    instead of boxing every cell individually.
+
+    Args:
+        df: DataFrame returned by parse_budget_excel
+
+    Returns:
+        List of row dictionaries keyed by column name
+    """
+    columns = list(df.columns)
+    column_values = [df[col].tolist() for col in columns]
+    return [dict(zip(columns, row)) for row in zip(*column_values)]
+
+
 def _normalize_amount(value: Any) -> Optional[float]:
     """
     Normalize amount value to float.
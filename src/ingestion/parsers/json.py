@@ -11,16 +11,26 @@ Examples:
 """
 
 import json
+import mmap
 from pathlib import Path
 from typing import Dict, Any, List, Optional
 from datetime import datetime
 import logging
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 from src.ingestion.extractors.amounts import parse_amount, detect_currency
 from src.ingestion.extractors.dates import parse_date
 
 logger = logging.getLogger(__name__)
 
+# Files at least this large are memory-mapped instead of read into a buffer
+MMAP_THRESHOLD_BYTES = 1 << 20
+
 
 class JSONParseError(Exception):
     """Exception raised when JSON parsing fails."""
@@ -75,8 +85,7 @@ def parse_invoice_json(json_path: Path) -> Dict[str, Any]:
         'INV-2024-0001'
     """
     try:
-        with open(json_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        data = _load_json(json_path)
     except json.JSONDecodeError as e:
         raise JSONParseError(f"Invalid JSON in {json_path}: {e}")
     except FileNotFoundError:
@@ -196,7 +205,7 @@ def parse_invoice_json(json_path: Path) -> Dict[str, Any]:
     normalized['notes'] = data.get('notes') or data.get('comments')
     normalized['reference'] = data.get('reference') or data.get('po_number')
 
-    logger.info(f"Parsed invoice {normalized['invoice_id']} from {json_path.name}")
+    logger.info("Parsed invoice %s from %s", normalized['invoice_id'], json_path.name)
     return normalized
 
 
@@ -238,8 +247,7 @@ def parse_contract_json(json_path: Path) -> Dict[str, Any]:
         JSONParseError: If required fields are missing or JSON is invalid
     """
     try:
-        with open(json_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        data = _load_json(json_path)
     except json.JSONDecodeError as e:
         raise JSONParseError(f"Invalid JSON in {json_path}: {e}")
     except FileNotFoundError:
@@ -341,7 +349,7 @@ def parse_contract_json(json_path: Path) -> Dict[str, Any]:
     normalized['category'] = data.get('category') or data.get('type')
     normalized['notes'] = data.get('notes') or data.get('comments')
 
-    logger.info(f"Parsed contract {normalized['contract_id']} from {json_path.name}")
+    logger.info("Parsed contract %s from %s", normalized['contract_id'], json_path.name)
     return normalized
 
 
@@ -367,8 +375,7 @@ def parse_accounting_entry_json(json_path: Path) -> Dict[str, Any]:
         Normalized accounting entry dictionary
     """
     try:
-        with open(json_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        data = _load_json(json_path)
     except Exception as e:
         raise JSONParseError(f"Error reading {json_path}: {e}")
 
@@ -391,6 +398,36 @@ def parse_accounting_entry_json(json_path: Path) -> Dict[str, Any]:
 
 # Helper functions
 
+def _load_json(json_path: Path) -> Any:
+    """
+    Load a JSON file, decoding with orjson when available.
+
+    Files of MMAP_THRESHOLD_BYTES or more are memory-mapped and decoded
+    without copying them into a Python buffer first.
+
+    orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers can
+    catch the stdlib exception regardless of the backend.
+
+    Args:
+        json_path: Path to JSON file
+
+    Returns:
+        Decoded JSON data
+    """
+    if HAS_ORJSON:
+        with open(json_path, 'rb') as f:
+            if json_path.stat().st_size < MMAP_THRESHOLD_BYTES:
+                return orjson.loads(f.read())
+
+            # Large file: let orjson decode straight from the page cache
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                with memoryview(mapped) as view:
+                    return orjson.loads(view)
+
+    with open(json_path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
 def _parse_date_field(
     data: Dict[str, Any],
     field_names: List[str],
@@ -502,8 +539,7 @@ def parse_json_batch(json_paths: List[Path], document_type: str = 'auto') -> Lis
                     doc = parse_contract_json(json_path)
                 else:
                     # Try to detect from content
-                    with open(json_path, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
+                    data = _load_json(json_path)
                     if 'invoice_id' in data or 'vendor' in data:
                         doc = parse_invoice_json(json_path)
                     elif 'contract_id' in data or 'parties' in data:
@@ -71,12 +71,14 @@ def parse_invoice_pdf(
         raise PDFParseError(f"File not found: {pdf_path}")
 
     try:
-        # Extract text from PDF
+        # Extract text and tables from PDF
         if use_ocr or not HAS_PDFPLUMBER:
             text = _extract_text_with_ocr(pdf_path, lang)
             logger.info(f"Extracted text from {pdf_path.name} using OCR")
+            tables = _extract_tables_with_pdfplumber(pdf_path) if HAS_PDFPLUMBER else []
         else:
-            text = _extract_text_with_pdfplumber(pdf_path)
+            # Single pdfplumber pass so the document is only parsed once
+            text, tables = _extract_text_and_tables_with_pdfplumber(pdf_path)
 
             # If text is empty or too short, fall back to OCR
             if not text or len(text.strip()) < 50:
@@ -86,13 +88,10 @@ def parse_invoice_pdf(
                 else:
                     raise PDFParseError(f"No text extracted and OCR not available for {pdf_path}")
 
-        # Extract tables if available
-        tables = _extract_tables_with_pdfplumber(pdf_path) if HAS_PDFPLUMBER else []
-
         # Parse extracted text into structured data
         invoice = _parse_invoice_from_text(text, tables, pdf_path)
 
-        logger.info(f"Successfully parsed invoice from {pdf_path.name}")
+        logger.info("Successfully parsed invoice from %s", pdf_path.name)
         return invoice
 
     except Exception as e:
@@ -151,7 +150,7 @@ def _extract_text_with_ocr(pdf_path: Path, lang: str = 'fra') -> str:
             page_text = pytesseract.image_to_string(image, lang=lang)
             text += page_text + "\n"
 
-            logger.debug(f"OCR processed page {i + 1}/{len(images)} of {pdf_path.name}")
+            logger.debug("OCR processed page %d/%d of %s", i + 1, len(images), pdf_path.name)
 
         return text.strip()
 
@@ -181,7 +180,7 @@ def _extract_tables_with_pdfplumber(pdf_path: Path) -> List[List[List[str]]]:
                 if page_tables:
                     tables.extend(page_tables)
 
-        logger.debug(f"Extracted {len(tables)} tables from {pdf_path.name}")
+        logger.debug("Extracted %d tables from %s", len(tables), pdf_path.name)
         return tables
 
     except Exception as e:
@@ -189,6 +188,46 @@ def _extract_tables_with_pdfplumber(pdf_path: Path) -> List[List[List[str]]]:
         return []
 
 
+def _extract_text_and_tables_with_pdfplumber(pdf_path: Path) -> Tuple[str, List[List[List[str]]]]:
+    """
+    Extract text and tables from PDF in a single pdfplumber pass.
+
+    Each page is laid out once and used for both text and table extraction,
+    instead of opening and parsing the document twice.
+
+    Args:
+        pdf_path: Path to PDF file
+
+    Returns:
+        Tuple of (extracted text, list of tables)
+    """
+    if not HAS_PDFPLUMBER:
+        raise PDFParseError("pdfplumber not installed")
+
+    text_parts = []
+    tables = []
+    try:
+        with pdfplumber.open(pdf_path) as pdf:
+            for page in pdf.pages:
+                page_text = page.extract_text()
+                if page_text:
+                    text_parts.append(page_text)
+
+                try:
+                    page_tables = page.extract_tables()
+                except Exception as e:
+                    logger.error(f"Error extracting tables from {pdf_path}: {e}")
+                    continue
+                if page_tables:
+                    tables.extend(page_tables)
+
+    except Exception as e:
+        logger.error(f"Error extracting text with pdfplumber from {pdf_path}: {e}")
+
+    logger.debug("Extracted %d tables from %s", len(tables), pdf_path.name)
+    return "\n".join(text_parts).strip(), tables
+
+
 def _parse_invoice_from_text(
     text: str,
     tables: List[List[List[str]]],
@@ -15,14 +15,21 @@ Examples:
 """
 
 import argparse
+import hashlib
+import itertools
 import json
 import logging
+import os
+import queue
+import shelve
+import threading
+from collections import Counter, deque
+from contextlib import ExitStack
 from pathlib import Path
 from typing import Dict, Any, List, Optional
 from datetime import datetime
 import multiprocessing as mp
-from concurrent.futures import ProcessPoolExecutor, as_completed
-import pandas as pd
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, FIRST_COMPLETED, wait
 
 try:
     from tqdm import tqdm
@@ -31,10 +38,24 @@ except ImportError:
     HAS_TQDM = False
     logging.warning("tqdm not installed, progress bars disabled")
 
+try:
+    import orjson
+    HAS_ORJSON = True
+    ORJSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+except ImportError:
+    HAS_ORJSON = False
+
+try:
+    from blake3 import blake3
+    HAS_BLAKE3 = True
+except ImportError:
+    HAS_BLAKE3 = False
+
 from src.config import settings
 from src.ingestion.parsers.json import parse_invoice_json, parse_contract_json, parse_json_batch
-from src.ingestion.parsers.excel import parse_budget_excel, parse_multi_sheet_budget
-from src.ingestion.parsers.pdf import parse_invoice_pdf
+from src.ingestion.parsers.csv import parse_accounting_csv
+from src.ingestion.parsers.excel import parse_budget_excel, parse_multi_sheet_budget, dataframe_to_records
+from src.ingestion.parsers.pdf import parse_invoice_pdf, extract_all_text_from_pdf
 from src.ingestion.extractors.ner import extract_financial_entities
 from src.ingestion.validators import batch_validate, validate_invoice, validate_contract, validate_budget
 
@@ -49,6 +70,39 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Bytes hashed from each end of a file when fingerprinting it for the cache
+CACHE_SAMPLE_BYTES = 64 * 1024
+
+# Most recent per-file errors kept in the statistics
+MAX_ERRORS = 10000
+
+# Files submitted to the process pool per worker before waiting for results
+MAX_IN_FLIGHT_PER_WORKER = 4
+
+# Formats parsed on threads; everything else is parsed in worker processes
+THREAD_FORMATS = {'json', 'csv'}
+
+# Serialized documents buffered for the background writer thread
+WRITE_QUEUE_SIZE = 256
+
+# Invoice/contract documents buffered per batched graph write
+GRAPH_BATCH_SIZE = 1000
+
+# Document type -> stats counter
+TYPE_STATS_KEYS = {
+    'invoice': 'invoices',
+    'contract': 'contracts',
+    'budget': 'budgets',
+}
+
+# Input subdirectory -> (document type, accepted extensions)
+DISCOVERY_RULES = {
+    'invoices': ('invoice', {'.json', '.pdf'}),
+    'contracts': ('contract', {'.json', '.pdf'}),
+    'budgets': ('budget', {'.xlsx', '.xls'}),
+    'accounting': ('accounting', {'.csv', '.json'}),
+}
+
 
 class IngestionPipeline:
     """Main ingestion pipeline orchestrator."""
@@ -59,7 +113,8 @@ class IngestionPipeline:
         output_dir: Path,
         batch_size: int = 50,
         use_multiprocessing: bool = True,
-        max_workers: Optional[int] = None
+        max_workers: Optional[int] = None,
+        use_cache: bool = True
     ):
         """
         Initialize ingestion pipeline.
@@ -67,15 +122,17 @@ class IngestionPipeline:
         Args:
             input_dir: Root directory with source documents
             output_dir: Directory for processed data
-            batch_size: Number of documents per batch
+            batch_size: Number of documents per embedding batch
             use_multiprocessing: Enable parallel processing
             max_workers: Maximum worker processes (default: CPU count)
+            use_cache: Skip files unchanged since the previous run
         """
         self.input_dir = Path(input_dir)
         self.output_dir = Path(output_dir)
         self.batch_size = batch_size
         self.use_multiprocessing = use_multiprocessing
         self.max_workers = max_workers or mp.cpu_count()
+        self.use_cache = use_cache
 
         # Create output directories
         self.output_dir.mkdir(parents=True, exist_ok=True)
@@ -104,9 +161,41 @@ class IngestionPipeline:
             'invoices': 0,
             'contracts': 0,
             'budgets': 0,
-            'errors': []
+            'files_skipped_cached': 0,
+            'embedding_cache_hits': 0,
+            'embedding_cache_misses': 0,
+            'errors': deque(maxlen=MAX_ERRORS)
         }
 
+        # Per-run counters, merged into self.stats once ingestion finishes
+        self._counts = Counter()
+
+        # (file_info, doc_id, text, metadata) awaiting a batched embedding call
+        self._embed_queue = []
+
+        # Document type -> (file_info, document) awaiting a batched graph write
+        self._graph_queue = {'invoice': [], 'contract': []}
+
+        # Fingerprint cache, open during ingest()
+        self._cache = None
+
+        # Source path -> fingerprint of files parsed this run, saved to the
+        # cache by _commit_fingerprints once their deferred writes succeeded
+        self._pending_fingerprints = {}
+
+        # Source paths whose graph, embedding or output write failed this run
+        self._incomplete_files = set()
+
+        # Source path -> mtime_ns of its processed output, used while checking the cache
+        self._existing_outputs = {}
+
+        # Background writer for processed documents (running during ingest())
+        self._write_queue = None
+        self._writer = None
+
+        # (file_info, error) for documents the writer could not save
+        self._write_failures = deque()
+
     def ingest(self) -> Dict[str, Any]:
         """
         Run the complete ingestion pipeline.
@@ -128,24 +217,47 @@ class IngestionPipeline:
             logger.warning("No files found to process")
             return self.stats
 
-        # Process files in batches
-        batches = [all_files[i:i + self.batch_size] for i in range(0, len(all_files), self.batch_size)]
-
-        if HAS_TQDM:
-            progress_bar = tqdm(total=len(all_files), desc="Ingesting documents")
-        else:
-            progress_bar = None
+        self._cache = shelve.open(str(self.output_dir / ".cache")) if self.use_cache else None
+        self._start_writer()
+        try:
+            if self._cache is not None:
+                self._existing_outputs = self._scan_existing_outputs(all_files)
+                pending = [f for f in all_files if not self._is_unchanged(self._cache, f)]
+                self._existing_outputs = {}
+                self.stats['files_skipped_cached'] = len(all_files) - len(pending)
+                logger.info(f"Skipping {self.stats['files_skipped_cached']} unchanged files")
+                all_files = pending
+
+            if HAS_TQDM:
+                progress_bar = tqdm(total=len(all_files), desc="Ingesting documents")
+            else:
+                progress_bar = None
 
-        for batch in batches:
-            if self.use_multiprocessing and len(batch) > 1:
-                self._process_batch_parallel(batch, progress_bar)
+            if self.use_multiprocessing and len(all_files) > 1:
+                self._process_parallel(all_files, progress_bar)
             else:
-                self._process_batch_sequential(batch, progress_bar)
+                self._process_sequential(all_files, progress_bar)
+
+            self._flush_graph()
+            self._flush_embeddings()
+            self._stop_writer()
+            self._commit_fingerprints()
 
-        if progress_bar:
-            progress_bar.close()
+            if progress_bar:
+                progress_bar.close()
+        finally:
+            self._stop_writer()
+            self._pending_fingerprints.clear()
+            self._incomplete_files.clear()
+            if self._cache is not None:
+                self._cache.close()
+                self._cache = None
 
         # Generate final statistics
+        for key, count in self._counts.items():
+            self.stats[key] += count
+        self._counts.clear()
+
         end_time = datetime.now()
         duration = (end_time - start_time).total_seconds()
 
@@ -167,243 +279,408 @@ class IngestionPipeline:
         """
         Discover all processable files in input directory.
 
+        The input tree is walked once with os.scandir; each file is routed by
+        its top-level directory and extension using DISCOVERY_RULES.
+
         Returns:
             List of file metadata dictionaries
         """
         files = []
 
-        # Look for invoices
-        invoice_dir = self.input_dir / "invoices"
-        if invoice_dir.exists():
-            for file_path in invoice_dir.rglob("*"):
-                if file_path.is_file() and file_path.suffix.lower() in ['.json', '.pdf']:
-                    files.append({
-                        'path': file_path,
-                        'type': 'invoice',
-                        'format': file_path.suffix[1:].lower()
-                    })
-
-        # Look for contracts
-        contract_dir = self.input_dir / "contracts"
-        if contract_dir.exists():
-            for file_path in contract_dir.rglob("*"):
-                if file_path.is_file() and file_path.suffix.lower() in ['.json', '.pdf']:
-                    files.append({
-                        'path': file_path,
-                        'type': 'contract',
-                        'format': file_path.suffix[1:].lower()
-                    })
+        if not self.input_dir.is_dir():
+            return files
 
-        # Look for budgets
-        budget_dir = self.input_dir / "budgets"
-        if budget_dir.exists():
-            for file_path in budget_dir.rglob("*"):
-                if file_path.is_file() and file_path.suffix.lower() in ['.xlsx', '.xls']:
-                    files.append({
-                        'path': file_path,
-                        'type': 'budget',
-                        'format': file_path.suffix[1:].lower()
-                    })
+        with os.scandir(self.input_dir) as entries:
+            top_dirs = {entry.name: entry.path for entry in entries if entry.is_dir()}
 
-        # Look for accounting entries
-        accounting_dir = self.input_dir / "accounting"
-        if accounting_dir.exists():
-            for file_path in accounting_dir.rglob("*"):
-                if file_path.is_file() and file_path.suffix.lower() in ['.csv', '.json']:
+        for dir_name, (doc_type, extensions) in DISCOVERY_RULES.items():
+            if dir_name not in top_dirs:
+                continue
+            for entry in _walk(top_dirs[dir_name]):
+                ext = os.path.splitext(entry.name)[1].lower()
+                if ext in extensions:
                     files.append({
-                        'path': file_path,
-                        'type': 'accounting',
-                        'format': file_path.suffix[1:].lower()
+                        'path': Path(entry.path),
+                        'type': doc_type,
+                        'format': ext[1:],
+                        'size': entry.stat().st_size
                     })
 
         return files
 
-    def _process_batch_sequential(self, batch: List[Dict[str, Any]], progress_bar=None):
-        """Process batch of files sequentially."""
-        for file_info in batch:
+    def _is_unchanged(self, cache: shelve.Shelf, file_info: Dict[str, Any]) -> bool:
+        """
+        Check a file against its fingerprint from the previous run.
+
+        Matching size and mtime is treated as unchanged without reading the
+        file. Otherwise the first and last 64KB are hashed, so a file that was
+        only touched is still recognised. A file with no cache entry is skipped
+        when its processed output already exists and is newer than the source.
+        The computed fingerprint is stored in file_info['fingerprint'] so it
+        can be recorded once processing succeeds.
+
+        Args:
+            cache: Open fingerprint cache
+            file_info: File metadata dictionary
+
+        Returns:
+            True if the file can be skipped
+        """
+        file_path = file_info['path']
+        key = str(file_path)
+        stat = file_path.stat()
+        cached = cache.get(key)
+
+        if cached and cached[0] == stat.st_size and cached[1] == stat.st_mtime_ns:
+            return True
+
+        fingerprint = (stat.st_size, stat.st_mtime_ns, _sample_digest(file_path, stat.st_size))
+        file_info['fingerprint'] = fingerprint
+
+        if cached and cached[0] == fingerprint[0] and cached[2] == fingerprint[2]:
+            cache[key] = fingerprint
+            return True
+
+        # Not in the cache (e.g. output from an earlier run without it):
+        # trust a processed output that is newer than the source file
+        output_mtime = self._existing_outputs.get(key)
+        if cached is None and output_mtime is not None and output_mtime >= stat.st_mtime_ns:
+            cache[key] = fingerprint
+            return True
+
+        return False
+
+    def _scan_existing_outputs(self, files: List[Dict[str, Any]]) -> Dict[str, int]:
+        """
+        List processed documents already in the output directory.
+
+        Outputs are named after the source file stem only (see
+        _save_document), so an output is ambiguous when several discovered
+        files share a stem (e.g. a/report.json and b/report.pdf). Those
+        outputs are left out and the files are processed.
+
+        Args:
+            files: Discovered file metadata dictionaries
+
+        Returns:
+            Mapping of source file path to its output's mtime in nanoseconds
+        """
+        suffix = "_processed.json"
+        outputs = {}
+
+        with os.scandir(self.output_dir / "metadata") as entries:
+            for entry in entries:
+                if entry.name.endswith(suffix):
+                    outputs[entry.name[:-len(suffix)]] = entry.stat().st_mtime_ns
+
+        stem_counts = Counter(file_info['path'].stem for file_info in files)
+        return {
+            str(file_info['path']): outputs[file_info['path'].stem]
+            for file_info in files
+            if stem_counts[file_info['path'].stem] == 1 and file_info['path'].stem in outputs
+        }
+
+    def _process_sequential(self, files: List[Dict[str, Any]], progress_bar=None):
+        """Process files one after another in this process."""
+        for file_info in files:
             try:
                 self._process_file(file_info)
-                self.stats['files_processed'] += 1
+                self._record_success(file_info)
             except Exception as e:
-                logger.error(f"Error processing {file_info['path']}: {e}")
-                self.stats['files_failed'] += 1
-                self.stats['errors'].append({
-                    'file': str(file_info['path']),
-                    'error': str(e)
-                })
+                self._record_failure(file_info, e)
 
             if progress_bar:
                 progress_bar.update(1)
 
-    def _process_batch_parallel(self, batch: List[Dict[str, Any]], progress_bar=None):
-        """Process batch of files in parallel using ProcessPoolExecutor."""
-        with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
-            futures = {executor.submit(self._process_file, file_info): file_info for file_info in batch}
+    def _process_parallel(self, files: List[Dict[str, Any]], progress_bar=None):
+        """
+        Parse files concurrently and store results as they complete.
 
-            for future in as_completed(futures):
-                file_info = futures[future]
-                try:
-                    future.result()
-                    self.stats['files_processed'] += 1
-                except Exception as e:
-                    logger.error(f"Error processing {file_info['path']}: {e}")
-                    self.stats['files_failed'] += 1
-                    self.stats['errors'].append({
-                        'file': str(file_info['path']),
-                        'error': str(e)
-                    })
+        JSON and CSV files are parsed on a thread pool: orjson and PyArrow
+        do their work outside the GIL, and threads avoid pickling the parsed
+        document back to the parent. PDF and Excel parsing is pure-Python
+        heavy, so those files go to a process pool. A worker loads the NER
+        model the first time one of its files has text to extract from
+        (get_extractor caches it per process). A pool is only started if it
+        has files.
 
-                if progress_bar:
-                    progress_bar.update(1)
+        Within each pool files are dispatched largest first
+        (longest-processing-time-first) so big files do not end up as
+        stragglers. At most MAX_IN_FLIGHT_PER_WORKER * max_workers files are
+        submitted per pool at once to bound the memory held by pending results.
 
-    def _process_file(self, file_info: Dict[str, Any]):
+        Args:
+            files: File metadata dictionaries to process
+            progress_bar: Optional tqdm progress bar
         """
-        Process a single file.
+        ordered = sorted(files, key=lambda f: f.get('size', 0), reverse=True)
+        thread_files = [f for f in ordered if f['format'] in THREAD_FORMATS]
+        process_files = [f for f in ordered if f['format'] not in THREAD_FORMATS]
+        max_in_flight = MAX_IN_FLIGHT_PER_WORKER * self.max_workers
+
+        with ExitStack() as stack:
+            sources = []
+            if thread_files:
+                executor = stack.enter_context(ThreadPoolExecutor(max_workers=self.max_workers * 2))
+                sources.append((executor, iter(thread_files)))
+            if process_files:
+                executor = stack.enter_context(
+                    ProcessPoolExecutor(max_workers=self.max_workers)
+                )
+                sources.append((executor, iter(process_files)))
+
+            # future -> (file_info, index into sources)
+            futures = {}
+
+            def submit(source_index: int, count: int):
+                executor, queued = sources[source_index]
+                for file_info in itertools.islice(queued, count):
+                    futures[executor.submit(_parse_file, file_info)] = (file_info, source_index)
+
+            for source_index in range(len(sources)):
+                submit(source_index, max_in_flight)
+
+            while futures:
+                done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                completed = Counter()
+
+                for future in done:
+                    file_info, source_index = futures.pop(future)
+                    completed[source_index] += 1
+                    try:
+                        self._store_document(file_info, future.result())
+                        self._record_success(file_info)
+                    except Exception as e:
+                        self._record_failure(file_info, e)
+
+                    if progress_bar:
+                        progress_bar.update(1)
+
+                for source_index, count in completed.items():
+                    submit(source_index, count)
+
+    def _record_success(self, file_info: Dict[str, Any]):
+        """
+        Count a processed file and hold its fingerprint for the cache.
+
+        The fingerprint is only saved by _commit_fingerprints, after the
+        batched graph and embedding writes and the output writer finished,
+        so a file whose deferred write fails is processed again next run.
 
         Args:
             file_info: File metadata dictionary
         """
-        file_path = file_info['path']
-        doc_type = file_info['type']
-        file_format = file_info['format']
+        self._counts['files_processed'] += 1
 
-        logger.debug(f"Processing {doc_type} file: {file_path.name}")
+        if self._cache is not None and 'fingerprint' in file_info:
+            self._pending_fingerprints[str(file_info['path'])] = file_info['fingerprint']
 
-        # Parse document based on type and format
-        if doc_type == 'invoice':
-            if file_format == 'json':
-                document = parse_invoice_json(file_path)
-            elif file_format == 'pdf':
-                document = parse_invoice_pdf(file_path)
-            else:
-                raise ValueError(f"Unsupported invoice format: {file_format}")
-
-            # Validate
-            validation = validate_invoice(document)
-            if not validation.is_valid:
-                logger.warning(f"Invoice validation failed for {file_path.name}: {validation.errors}")
-
-            self.stats['invoices'] += 1
-
-        elif doc_type == 'contract':
-            if file_format == 'json':
-                document = parse_contract_json(file_path)
-            elif file_format == 'pdf':
-                # For now, extract text and treat as unstructured
-                from src.ingestion.parsers.pdf import extract_all_text_from_pdf
-                text = extract_all_text_from_pdf(file_path)
-                document = {
-                    'contract_id': file_path.stem,
-                    'source_file': str(file_path),
-                    'document_type': 'contract',
-                    'raw_text': text
-                }
-            else:
-                raise ValueError(f"Unsupported contract format: {file_format}")
+    def _mark_incomplete(self, file_info: Dict[str, Any]):
+        """Keep a file's fingerprint out of the cache because one of its writes failed."""
+        self._incomplete_files.add(str(file_info['path']))
 
-            # Validate
-            if 'raw_text' not in document:  # Only validate structured contracts
-                validation = validate_contract(document)
-                if not validation.is_valid:
-                    logger.warning(f"Contract validation failed for {file_path.name}: {validation.errors}")
+    def _commit_fingerprints(self):
+        """
+        Save the fingerprints of files whose writes all succeeded to the cache.
 
-            self.stats['contracts'] += 1
+        Incomplete files get an empty entry instead, so _is_unchanged does
+        not trust their (already written) processed output next run.
+        """
+        if self._cache is not None:
+            for key, fingerprint in self._pending_fingerprints.items():
+                self._cache[key] = () if key in self._incomplete_files else fingerprint
+        self._pending_fingerprints.clear()
+        self._incomplete_files.clear()
 
-        elif doc_type == 'budget':
-            if file_format in ['xlsx', 'xls']:
-                budget_df = parse_budget_excel(file_path)
-                # Convert to list of dictionaries for processing
-                document = {
-                    'source_file': str(file_path),
-                    'document_type': 'budget',
-                    'data': budget_df.to_dict('records')
-                }
-            else:
-                raise ValueError(f"Unsupported budget format: {file_format}")
-
-            self.stats['budgets'] += 1
-
-        elif doc_type == 'accounting':
-            if file_format == 'csv':
-                df = pd.read_csv(file_path)
-                document = {
-                    'source_file': str(file_path),
-                    'document_type': 'accounting',
-                    'data': df.to_dict('records')
-                }
-            else:
-                raise ValueError(f"Unsupported accounting format: {file_format}")
+    def _record_failure(self, file_info: Dict[str, Any], error: Exception):
+        """
+        Log a failed file and add it to the error statistics.
 
-        # Extract entities (if text available)
-        if 'raw_text' in document and document['raw_text']:
-            document['entities'] = extract_financial_entities(document['raw_text'])
+        Args:
+            file_info: File metadata dictionary
+            error: Exception raised while processing the file
+        """
+        logger.error(f"Error processing {file_info['path']}: {error}")
+        self._counts['files_failed'] += 1
+        self._mark_incomplete(file_info)
+        self.stats['errors'].append({
+            'file': str(file_info['path']),
+            'error': str(error)
+        })
+
+    def _process_file(self, file_info: Dict[str, Any]):
+        """
+        Process a single file.
+
+        Args:
+            file_info: File metadata dictionary
+        """
+        self._store_document(file_info, _parse_file(file_info))
+
+    def _store_document(self, file_info: Dict[str, Any], document: Dict[str, Any]):
+        """
+        Save a parsed document, add it to the graph and queue its embedding.
+
+        Always runs in the parent process so the graph driver, vector store
+        and statistics are never shared with pool workers.
+
+        Args:
+            file_info: File metadata dictionary
+            document: Document returned by _parse_file
+        """
+        file_path = file_info['path']
+
+        stats_key = TYPE_STATS_KEYS.get(file_info['type'])
+        if stats_key:
+            self._counts[stats_key] += 1
 
         # Save processed document
-        self._save_document(document, file_path)
+        self._save_document(document, file_info)
 
         # Add to graph (if available)
         if self.graph:
             try:
-                self._add_to_graph(document)
+                self._add_to_graph(document, file_info)
             except Exception as e:
                 logger.warning(f"Could not add {file_path.name} to graph: {e}")
+                self._mark_incomplete(file_info)
 
-        # Generate embeddings (if available)
+        # Queue embeddings (if available)
         if self.vectorstore:
-            try:
-                self._generate_embeddings(document)
-            except Exception as e:
-                logger.warning(f"Could not generate embeddings for {file_path.name}: {e}")
+            self._generate_embeddings(document, file_info)
 
-    def _save_document(self, document: Dict[str, Any], source_path: Path):
+    def _save_document(self, document: Dict[str, Any], file_info: Dict[str, Any]):
         """
         Save processed document to output directory.
 
+        The document is serialized here and handed to the background writer
+        thread when it is running, so file I/O overlaps with parsing. Write
+        errors in the writer are recorded as failures of the source file
+        when the writer stops.
+
         Args:
             document: Processed document dictionary
-            source_path: Original source file path
+            file_info: Source file metadata dictionary
         """
         # Create output filename
-        output_filename = source_path.stem + "_processed.json"
+        output_filename = file_info['path'].stem + "_processed.json"
         output_path = self.output_dir / "metadata" / output_filename
 
-        # Save as JSON
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(document, f, indent=2, default=str)
+        if self._writer is None or not self._writer.is_alive():
+            _write_json(output_path, document)
+        else:
+            self._write_queue.put((file_info, output_path, _dump_json(document)))
+
+    def _start_writer(self):
+        """Start the background thread that writes processed documents."""
+        self._write_queue = queue.Queue(maxsize=WRITE_QUEUE_SIZE)
+        self._writer = threading.Thread(target=self._writer_loop, name="ingestion-writer", daemon=True)
+        self._writer.start()
 
-        logger.debug(f"Saved processed document to {output_path}")
+    def _stop_writer(self):
+        """
+        Wait for queued documents to be written and stop the writer thread.
+
+        Files whose output could not be written are then moved from
+        processed to failed.
+        """
+        if self._writer is None:
+            return
+
+        # A writer that died cannot drain the sentinel; don't block on it
+        if self._writer.is_alive():
+            self._write_queue.put(None)
+            self._writer.join()
+        self._writer = None
+        self._write_queue = None
+
+        while self._write_failures:
+            file_info, error = self._write_failures.popleft()
+            self._counts['files_processed'] -= 1
+            self._record_failure(file_info, error)
+
+    def _writer_loop(self):
+        """Write serialized documents from the queue until a None sentinel arrives."""
+        while True:
+            item = self._write_queue.get()
+            if item is None:
+                return
+
+            file_info, output_path, data = item
+            try:
+                output_path.write_bytes(data)
+                logger.debug("Saved processed document to %s", output_path)
+            except Exception as e:
+                # Keep draining: a dead writer would block every later put()
+                logger.error(f"Could not save {output_path}: {e}")
+                self._write_failures.append((file_info, e))
 
-    def _add_to_graph(self, document: Dict[str, Any]):
+    def _add_to_graph(self, document: Dict[str, Any], file_info: Dict[str, Any]):
         """
         Add document to Neo4j graph.
 
         Args:
             document: Processed document dictionary
+            file_info: Source file metadata dictionary
         """
         if not self.graph:
             return
 
         doc_type = document.get('document_type')
 
-        if doc_type == 'invoice':
-            # Create invoice node and relationships
-            self.graph.create_invoice_node(document)
-
-        elif doc_type == 'contract':
-            # Create contract node and relationships
-            self.graph.create_contract_node(document)
+        if doc_type in self._graph_queue:
+            # Invoice and contract nodes are written GRAPH_BATCH_SIZE at a time by _flush_graph
+            self._graph_queue[doc_type].append((file_info, document))
+            if len(self._graph_queue[doc_type]) >= GRAPH_BATCH_SIZE:
+                self._flush_graph()
 
         elif doc_type == 'budget':
-            # Create budget nodes (one per department/category)
-            for budget_item in document.get('data', []):
-                self.graph.create_budget_node(budget_item)
+            # Create budget nodes (one per department/category) in batched writes
+            self.graph.create_budget_nodes(document.get('data', []))
+
+    def _flush_graph(self):
+        """
+        Write all queued invoice and contract documents to the graph in batched UNWIND writes.
+
+        A document the graph rejects only fails its own file (see
+        FinancialGraph._write_documents); the rest of the batch is written.
+        """
+        queued = self._graph_queue
+        self._graph_queue = {'invoice': [], 'contract': []}
+        if not self.graph or not any(queued.values()):
+            return
+
+        writers = {
+            'invoice': self.graph.create_invoice_nodes,
+            'contract': self.graph.create_contract_nodes,
+        }
+        with self.graph.session() as session:
+            for doc_type, entries in queued.items():
+                if not entries:
+                    continue
+                try:
+                    failures = writers[doc_type]([document for _, document in entries], session=session)
+                except Exception as e:
+                    logger.warning(f"Could not add {len(entries)} {doc_type} documents to graph: {e}")
+                    for file_info, _ in entries:
+                        self._mark_incomplete(file_info)
+                    continue
 
-    def _generate_embeddings(self, document: Dict[str, Any]):
+                for index, error in failures:
+                    file_info = entries[index][0]
+                    logger.warning(f"Could not add {file_info['path'].name} to graph: {error}")
+                    self._mark_incomplete(file_info)
+
+    def _generate_embeddings(self, document: Dict[str, Any], file_info: Dict[str, Any]):
         """
-        Generate vector embeddings for document.
+        Queue a document for embedding.
+
+        Embeddings are computed in batches of batch_size documents by
+        _flush_embeddings rather than one model call per document.
 
         Args:
             document: Processed document dictionary
+            file_info: Source file metadata dictionary
         """
         if not self.vectorstore:
             return
@@ -423,25 +700,208 @@ class IngestionPipeline:
         text = " ".join(text_parts)
 
         if text:
-            # Generate and store embedding
             doc_id = document.get('invoice_id') or document.get('contract_id') or document.get('source_file')
-            self.vectorstore.add_document(doc_id, text, metadata=document)
+            # The vector store keeps its own 500-char excerpt; don't copy the full text into its metadata
+            metadata = {key: value for key, value in document.items() if key != 'raw_text'}
+            self._embed_queue.append((file_info, doc_id, text, metadata))
+
+            if len(self._embed_queue) >= self.batch_size:
+                self._flush_embeddings()
+
+    def _flush_embeddings(self):
+        """Compute and store embeddings for all queued documents in one batch."""
+        if not self._embed_queue:
+            return
+
+        queue, self._embed_queue = self._embed_queue, []
+        file_infos, doc_ids, texts, metadatas = zip(*queue)
+
+        try:
+            computed = self.vectorstore.add_documents(list(doc_ids), list(texts), list(metadatas))
+        except Exception as e:
+            logger.warning(f"Could not generate embeddings for {len(queue)} documents: {e}")
+            for file_info in file_infos:
+                self._mark_incomplete(file_info)
+            return
+
+        self._counts['embedding_cache_misses'] += computed
+        self._counts['embedding_cache_hits'] += len(queue) - computed
 
     def _save_statistics(self):
         """Save ingestion statistics to file."""
         stats_path = self.output_dir / "ingestion_stats.json"
 
-        with open(stats_path, 'w', encoding='utf-8') as f:
-            json.dump(self.stats, f, indent=2, default=str)
+        _write_json(stats_path, {**self.stats, 'errors': list(self.stats['errors'])})
 
         logger.info(f"Saved ingestion statistics to {stats_path}")
 
 
+def _parse_contract_pdf(file_path: Path) -> Dict[str, Any]:
+    """Wrap the extracted text of a contract PDF as an unstructured contract document."""
+    return {
+        'contract_id': file_path.stem,
+        'source_file': str(file_path),
+        'document_type': 'contract',
+        'raw_text': extract_all_text_from_pdf(file_path)
+    }
+
+
+def _parse_budget_workbook(file_path: Path) -> Dict[str, Any]:
+    """Parse a budget workbook into a document with one record per row."""
+    budget_df = parse_budget_excel(file_path)
+    return {
+        'source_file': str(file_path),
+        'document_type': 'budget',
+        'data': dataframe_to_records(budget_df)
+    }
+
+
+def _parse_accounting_file(file_path: Path) -> Dict[str, Any]:
+    """Parse an accounting CSV into a document with one record per entry."""
+    return {
+        'source_file': str(file_path),
+        'document_type': 'accounting',
+        'data': parse_accounting_csv(file_path)
+    }
+
+
+# (document type, format) -> parser returning the document dictionary
+PARSERS = {
+    ('invoice', 'json'): parse_invoice_json,
+    ('invoice', 'pdf'): parse_invoice_pdf,
+    ('contract', 'json'): parse_contract_json,
+    ('contract', 'pdf'): _parse_contract_pdf,
+    ('budget', 'xlsx'): _parse_budget_workbook,
+    ('budget', 'xls'): _parse_budget_workbook,
+    ('accounting', 'csv'): _parse_accounting_file,
+}
+
+# Document type -> validator applied to structured documents
+VALIDATORS = {
+    'invoice': validate_invoice,
+    'contract': validate_contract,
+}
+
+
+def _parse_file(file_info: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Parse, validate and extract entities from a single file.
+
+    Module-level so it can be submitted to a ProcessPoolExecutor without
+    pickling the pipeline (and its graph/vector store handles).
+
+    Args:
+        file_info: File metadata dictionary
+
+    Returns:
+        Processed document dictionary
+
+    Raises:
+        ValueError: If the document type does not support the file format
+    """
+    file_path = file_info['path']
+    doc_type = file_info['type']
+    file_format = file_info['format']
+
+    logger.debug("Processing %s file: %s", doc_type, file_path.name)
+
+    parser = PARSERS.get((doc_type, file_format))
+    if parser is None:
+        raise ValueError(f"Unsupported {doc_type} format: {file_format}")
+
+    document = parser(file_path)
+
+    # Validate (contract PDFs are unstructured text, with nothing to check)
+    validator = VALIDATORS.get(doc_type)
+    if validator and not (doc_type == 'contract' and 'raw_text' in document):
+        validation = validator(document)
+        if not validation.is_valid:
+            logger.warning(f"{doc_type.capitalize()} validation failed for {file_path.name}: {validation.errors}")
+
+    # Extract entities (if text available)
+    if document.get('raw_text'):
+        document['entities'] = extract_financial_entities(document['raw_text'])
+
+    return document
+
+
+def _walk(root: str):
+    """
+    Recursively yield an os.DirEntry for every regular file under root.
+
+    Uses os.scandir so file/dir checks come from the cached directory entry
+    type instead of a stat call per file.
+
+    Args:
+        root: Directory to walk
+    """
+    stack = [root]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.is_file(follow_symlinks=False):
+                        yield entry
+        except OSError as e:
+            logger.warning(f"Cannot scan directory: {e}")
+
+
+def _sample_digest(file_path: Path, size: int) -> str:
+    """
+    Hash the first and last CACHE_SAMPLE_BYTES of a file.
+
+    Args:
+        file_path: File to hash
+        size: File size in bytes
+
+    Returns:
+        Hex digest (blake3 when available, otherwise blake2b)
+    """
+    hasher = blake3() if HAS_BLAKE3 else hashlib.blake2b()
+
+    with open(file_path, 'rb') as f:
+        hasher.update(f.read(CACHE_SAMPLE_BYTES))
+        if size > CACHE_SAMPLE_BYTES:
+            f.seek(max(size - CACHE_SAMPLE_BYTES, CACHE_SAMPLE_BYTES))
+            hasher.update(f.read(CACHE_SAMPLE_BYTES))
+
+    return hasher.hexdigest()
+
+
+def _dump_json(data: Any) -> bytes:
+    """
+    Serialize data as indented UTF-8 JSON, using orjson when available.
+
+    Args:
+        data: JSON-serializable data (non-native types are converted with str)
+
+    Returns:
+        Encoded JSON document
+    """
+    if HAS_ORJSON:
+        return orjson.dumps(data, option=ORJSON_OPTIONS, default=str)
+    return json.dumps(data, indent=2, default=str).encode('utf-8')
+
+
+def _write_json(output_path: Path, data: Any):
+    """
+    Write data as indented JSON, using orjson when available.
+
+    Args:
+        output_path: Destination file path
+        data: JSON-serializable data (non-native types are converted with str)
+    """
+    output_path.write_bytes(_dump_json(data))
+
+
 def ingest_directory(
     input_dir: Path,
     output_dir: Path,
     batch_size: int = 50,
-    use_multiprocessing: bool = True
+    use_multiprocessing: bool = True,
+    use_cache: bool = True
 ) -> Dict[str, Any]:
     """
     Ingest all documents from input directory.
@@ -449,8 +909,9 @@ def ingest_directory(
     Args:
         input_dir: Root directory with synthetic data
         output_dir: Where to save processed data
-        batch_size: Number of documents per batch
+        batch_size: Number of documents per embedding batch
         use_multiprocessing: Enable parallel processing
+        use_cache: Skip files unchanged since the previous run
 
     Returns:
         Dictionary with ingestion statistics (files_processed, errors, etc.)
@@ -464,7 +925,8 @@ def ingest_directory(
         input_dir=input_dir,
         output_dir=output_dir,
         batch_size=batch_size,
-        use_multiprocessing=use_multiprocessing
+        use_multiprocessing=use_multiprocessing,
+        use_cache=use_cache
     )
 
     return pipeline.ingest()
@@ -475,8 +937,9 @@ def main():
     parser = argparse.ArgumentParser(description="FINCENTER Ingestion Pipeline")
     parser.add_argument("--input", type=str, required=True, help="Input directory with source documents")
     parser.add_argument("--output", type=str, required=True, help="Output directory for processed data")
-    parser.add_argument("--batch-size", type=int, default=50, help="Batch size for processing")
+    parser.add_argument("--batch-size", type=int, default=50, help="Documents per embedding batch")
     parser.add_argument("--no-multiprocessing", action="store_true", help="Disable parallel processing")
+    parser.add_argument("--no-cache", action="store_true", help="Reprocess files even if unchanged")
     parser.add_argument("--debug", action="store_true", help="Enable debug logging")
     parser.add_argument("--log-file", type=str, help="Log file path")
 
@@ -503,7 +966,8 @@ def main():
         input_dir=Path(args.input),
         output_dir=Path(args.output),
         batch_size=args.batch_size,
-        use_multiprocessing=not args.no_multiprocessing
+        use_multiprocessing=not args.no_multiprocessing,
+        use_cache=not args.no_cache
     )
 
     print("\n" + "=" * 60)
@@ -511,6 +975,7 @@ def main():
     print("=" * 60)
     print(f"Files processed: {stats['files_processed']}")
     print(f"Files failed: {stats['files_failed']}")
+    print(f"Files skipped (unchanged): {stats['files_skipped_cached']}")
     print(f"Invoices: {stats['invoices']}")
     print(f"Contracts: {stats['contracts']}")
     print(f"Budgets: {stats['budgets']}")
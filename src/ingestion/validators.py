@@ -10,48 +10,174 @@ Examples:
 """
 
 from dataclasses import dataclass, field
-from typing import List, Dict, Any, Optional, Tuple
-from datetime import datetime
+from typing import List, Dict, Any, Iterator, NamedTuple, Optional, Tuple
+from datetime import datetime, timezone
 import logging
-from difflib import SequenceMatcher
+import os
+from bisect import bisect_left
+from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache, partial
+from operator import methodcaller
+
+import numpy as np
+
+try:
+    import fastjsonschema
+    HAS_FASTJSONSCHEMA = True
+except ImportError:
+    HAS_FASTJSONSCHEMA = False
+
+try:
+    from rapidfuzz import fuzz
+    HAS_RAPIDFUZZ = True
+except ImportError:
+    HAS_RAPIDFUZZ = False
 
 logger = logging.getLogger(__name__)
 
+# Fields that must be present and non-null per document type
+INVOICE_REQUIRED_FIELDS = ('invoice_id', 'vendor', 'total_ttc')
+CONTRACT_REQUIRED_FIELDS = ('contract_id', 'title', 'start_date', 'parties')
+BUDGET_REQUIRED_FIELDS = ('department', 'budget')
+
+# Common VAT rates in Europe, sorted for bisection
+COMMON_VAT_RATES = (0.0, 0.055, 0.10, 0.20, 0.21)
+VAT_RATE_TOLERANCE = 0.001
+
+# Shingle length for blocking duplicate candidates on names
+QGRAM_SIZE = 3
+
+# Distinct string pairs whose similarity is memoised per duplicate search
+STRING_SIMILARITY_CACHE_SIZE = 1 << 16
+
+# Batches larger than this are validated across worker processes
+PARALLEL_VALIDATION_THRESHOLD = 1000
+
+# Documents sent to a worker per task
+VALIDATION_CHUNK_SIZE = 128
+
+
+def _compile_required_validator(required_fields: Tuple[str, ...]):
+    """
+    Compile a JSON-schema validator checking that fields exist and are not null.
+
+    Args:
+        required_fields: Field names to require
+
+    Returns:
+        Compiled validator function, or None if fastjsonschema is not installed
+    """
+    if not HAS_FASTJSONSCHEMA:
+        return None
+
+    return fastjsonschema.compile({
+        'type': 'object',
+        'required': list(required_fields),
+        'properties': {name: {'not': {'type': 'null'}} for name in required_fields}
+    })
+
+
+INVOICE_REQUIRED_VALIDATOR = _compile_required_validator(INVOICE_REQUIRED_FIELDS)
+CONTRACT_REQUIRED_VALIDATOR = _compile_required_validator(CONTRACT_REQUIRED_FIELDS)
+BUDGET_REQUIRED_VALIDATOR = _compile_required_validator(BUDGET_REQUIRED_FIELDS)
+
 
 @dataclass
 class ValidationResult:
-    """Result of data validation."""
+    """
+    Result of data validation.
+
+    Messages are stored as (template, args) pairs and only %-formatted when
+    errors or warnings are read, so validating large batches does not pay
+    for strings nobody looks at.
+    """
     is_valid: bool
-    errors: List[str] = field(default_factory=list)
-    warnings: List[str] = field(default_factory=list)
     info: Dict[str, Any] = field(default_factory=dict)
+    _errors: List[Tuple[str, tuple]] = field(default_factory=list)
+    _warnings: List[Tuple[str, tuple]] = field(default_factory=list)
 
-    def add_error(self, message: str):
-        """Add an error message."""
-        self.errors.append(message)
+    def add_error(self, message: str, *args: Any):
+        """Add an error message, formatted later as message % args."""
+        self._errors.append((message, args))
         self.is_valid = False
 
-    def add_warning(self, message: str):
-        """Add a warning message."""
-        self.warnings.append(message)
+    def add_warning(self, message: str, *args: Any):
+        """Add a warning message, formatted later as message % args."""
+        self._warnings.append((message, args))
+
+    @property
+    def errors(self) -> List[str]:
+        """Formatted error messages."""
+        return [_format_message(message, args) for message, args in self._errors]
+
+    @property
+    def warnings(self) -> List[str]:
+        """Formatted warning messages."""
+        return [_format_message(message, args) for message, args in self._warnings]
+
+    @property
+    def error_count(self) -> int:
+        """Number of errors, without formatting them."""
+        return len(self._errors)
+
+    @property
+    def warning_count(self) -> int:
+        """Number of warnings, without formatting them."""
+        return len(self._warnings)
 
     def __str__(self) -> str:
         status = "VALID" if self.is_valid else "INVALID"
         parts = [f"Validation: {status}"]
 
-        if self.errors:
-            parts.append(f"Errors: {len(self.errors)}")
+        if self._errors:
+            parts.append(f"Errors: {self.error_count}")
             for error in self.errors:
                 parts.append(f"  - {error}")
 
-        if self.warnings:
-            parts.append(f"Warnings: {len(self.warnings)}")
+        if self._warnings:
+            parts.append(f"Warnings: {self.warning_count}")
             for warning in self.warnings:
                 parts.append(f"  - {warning}")
 
         return "\n".join(parts)
 
 
+def _format_message(message: str, args: tuple) -> str:
+    """Render a (template, args) validation message."""
+    return message % args if args else message
+
+
+def _check_required_fields(
+    document: Dict[str, Any],
+    required_fields: Tuple[str, ...],
+    validator,
+    result: ValidationResult
+):
+    """
+    Add an error to result for each required field that is missing or None.
+
+    The compiled schema validator confirms the common all-present case in one
+    call; the per-field loop only runs to report which fields failed.
+
+    Args:
+        document: Document dictionary
+        required_fields: Field names to require
+        validator: Compiled validator from _compile_required_validator, or None
+        result: ValidationResult to add errors to
+    """
+    if validator is not None:
+        try:
+            validator(document)
+            return
+        except fastjsonschema.JsonSchemaException:
+            pass
+
+    for field in required_fields:
+        if field not in document or document[field] is None:
+            result.add_error("Missing required field: %s", field)
+
+
 def validate_invoice(invoice: Dict[str, Any]) -> ValidationResult:
     """
     Validate invoice data quality.
@@ -77,58 +203,55 @@ def validate_invoice(invoice: Dict[str, Any]) -> ValidationResult:
     result = ValidationResult(is_valid=True)
 
     # Check required fields
-    required_fields = ['invoice_id', 'vendor', 'total_ttc']
-    for field in required_fields:
-        if field not in invoice or invoice[field] is None:
-            result.add_error(f"Missing required field: {field}")
+    _check_required_fields(invoice, INVOICE_REQUIRED_FIELDS, INVOICE_REQUIRED_VALIDATOR, result)
 
     # Validate invoice ID format
     if 'invoice_id' in invoice and invoice['invoice_id']:
         invoice_id = invoice['invoice_id']
         if len(str(invoice_id)) < 3:
-            result.add_warning(f"Invoice ID '{invoice_id}' seems too short")
+            result.add_warning("Invoice ID '%s' seems too short", invoice_id)
+
+    total_ttc = invoice.get('total_ttc')
+    total_ht = invoice.get('total_ht')
+    tax_rate = invoice.get('tax_rate')
 
     # Validate amounts
-    if 'total_ttc' in invoice and invoice['total_ttc'] is not None:
-        if invoice['total_ttc'] < 0:
-            result.add_error(f"Total TTC cannot be negative: {invoice['total_ttc']}")
-        elif invoice['total_ttc'] == 0:
+    if total_ttc is not None:
+        if total_ttc < 0:
+            result.add_error("Total TTC cannot be negative: %s", total_ttc)
+        elif total_ttc == 0:
             result.add_warning("Total TTC is zero")
 
-    if 'total_ht' in invoice and invoice['total_ht'] is not None:
-        if invoice['total_ht'] < 0:
-            result.add_error(f"Total HT cannot be negative: {invoice['total_ht']}")
+    if total_ht is not None:
+        if total_ht < 0:
+            result.add_error("Total HT cannot be negative: %s", total_ht)
 
     # Validate amount consistency
-    if all(k in invoice and invoice[k] is not None for k in ['total_ht', 'tax_rate', 'total_ttc']):
-        expected_ttc = round(invoice['total_ht'] * (1 + invoice['tax_rate']), 2)
-        actual_ttc = round(invoice['total_ttc'], 2)
+    if total_ht is not None and tax_rate is not None and total_ttc is not None:
+        expected_ttc = round(total_ht * (1 + tax_rate), 2)
+        actual_ttc = round(total_ttc, 2)
 
         if abs(expected_ttc - actual_ttc) > 0.1:  # Allow 0.1 rounding error
             result.add_warning(
-                f"Amount inconsistency: HT={invoice['total_ht']} * (1+{invoice['tax_rate']}) "
-                f"should equal {expected_ttc}, but TTC={actual_ttc}"
+                "Amount inconsistency: HT=%s * (1+%s) should equal %s, but TTC=%s",
+                total_ht, tax_rate, expected_ttc, actual_ttc
             )
 
     # Validate tax rate
-    if 'tax_rate' in invoice and invoice['tax_rate'] is not None:
-        tax_rate = invoice['tax_rate']
+    if tax_rate is not None:
         if tax_rate < 0 or tax_rate > 1:
-            result.add_error(f"Tax rate should be between 0 and 1 (got {tax_rate})")
+            result.add_error("Tax rate should be between 0 and 1 (got %s)", tax_rate)
 
-        # Common VAT rates in Europe
-        common_rates = [0.0, 0.055, 0.10, 0.20, 0.21]
-        if not any(abs(tax_rate - rate) < 0.001 for rate in common_rates):
-            result.add_warning(f"Unusual tax rate: {tax_rate} (expected one of {common_rates})")
+        if not _is_common_vat_rate(tax_rate):
+            result.add_warning("Unusual tax rate: %s (expected one of %s)", tax_rate, list(COMMON_VAT_RATES))
 
     # Validate dates
-    if 'date' in invoice and 'due_date' in invoice:
-        if invoice['date'] and invoice['due_date']:
-            if isinstance(invoice['date'], datetime) and isinstance(invoice['due_date'], datetime):
-                if invoice['due_date'] < invoice['date']:
-                    result.add_error(
-                        f"Due date ({invoice['due_date']}) cannot be before invoice date ({invoice['date']})"
-                    )
+    invoice_date = invoice.get('date')
+    due_date = invoice.get('due_date')
+    if invoice_date and due_date:
+        if isinstance(invoice_date, datetime) and isinstance(due_date, datetime):
+            if due_date < invoice_date:
+                result.add_error("Due date (%s) cannot be before invoice date (%s)", due_date, invoice_date)
 
     # Validate vendor information
     if 'vendor' in invoice:
@@ -150,15 +273,15 @@ def validate_invoice(invoice: Dict[str, Any]) -> ValidationResult:
     if 'items' in invoice and invoice['items']:
         for i, item in enumerate(invoice['items']):
             if not item.get('description'):
-                result.add_warning(f"Line item {i+1} missing description")
+                result.add_warning("Line item %s missing description", i + 1)
 
             if 'quantity' in item and item['quantity'] is not None:
                 if item['quantity'] <= 0:
-                    result.add_warning(f"Line item {i+1} has invalid quantity: {item['quantity']}")
+                    result.add_warning("Line item %s has invalid quantity: %s", i + 1, item['quantity'])
 
             if 'unit_price' in item and item['unit_price'] is not None:
                 if item['unit_price'] < 0:
-                    result.add_warning(f"Line item {i+1} has negative unit price: {item['unit_price']}")
+                    result.add_warning("Line item %s has negative unit price: %s", i + 1, item['unit_price'])
 
     result.info['document_type'] = invoice.get('document_type', 'invoice')
     result.info['invoice_id'] = invoice.get('invoice_id')
@@ -166,6 +289,22 @@ def validate_invoice(invoice: Dict[str, Any]) -> ValidationResult:
     return result
 
 
+def _is_common_vat_rate(tax_rate: float) -> bool:
+    """
+    Check whether a tax rate is within tolerance of a common VAT rate.
+
+    Args:
+        tax_rate: Tax rate as a fraction (e.g. 0.20)
+
+    Returns:
+        True if the nearest common rate is within VAT_RATE_TOLERANCE
+    """
+    pos = bisect_left(COMMON_VAT_RATES, tax_rate)
+    if pos < len(COMMON_VAT_RATES) and COMMON_VAT_RATES[pos] - tax_rate < VAT_RATE_TOLERANCE:
+        return True
+    return pos > 0 and tax_rate - COMMON_VAT_RATES[pos - 1] < VAT_RATE_TOLERANCE
+
+
 def validate_contract(contract: Dict[str, Any]) -> ValidationResult:
     """
     Validate contract data quality.
@@ -179,10 +318,7 @@ def validate_contract(contract: Dict[str, Any]) -> ValidationResult:
     result = ValidationResult(is_valid=True)
 
     # Required fields
-    required_fields = ['contract_id', 'title', 'start_date', 'parties']
-    for field in required_fields:
-        if field not in contract or contract[field] is None:
-            result.add_error(f"Missing required field: {field}")
+    _check_required_fields(contract, CONTRACT_REQUIRED_FIELDS, CONTRACT_REQUIRED_VALIDATOR, result)
 
     # Validate date sequence
     if 'start_date' in contract and 'end_date' in contract:
@@ -190,13 +326,14 @@ def validate_contract(contract: Dict[str, Any]) -> ValidationResult:
             if isinstance(contract['start_date'], datetime) and isinstance(contract['end_date'], datetime):
                 if contract['end_date'] < contract['start_date']:
                     result.add_error(
-                        f"End date ({contract['end_date']}) cannot be before start date ({contract['start_date']})"
+                        "End date (%s) cannot be before start date (%s)",
+                        contract['end_date'], contract['start_date']
                     )
 
     # Validate amount
     if 'amount' in contract and contract['amount'] is not None:
         if contract['amount'] < 0:
-            result.add_error(f"Contract amount cannot be negative: {contract['amount']}")
+            result.add_error("Contract amount cannot be negative: %s", contract['amount'])
         elif contract['amount'] == 0:
             result.add_warning("Contract amount is zero")
 
@@ -233,28 +370,29 @@ def validate_budget(budget: Dict[str, Any]) -> ValidationResult:
     result = ValidationResult(is_valid=True)
 
     # Required fields
-    required_fields = ['department', 'budget']
-    for field in required_fields:
-        if field not in budget or budget[field] is None:
-            result.add_error(f"Missing required field: {field}")
+    _check_required_fields(budget, BUDGET_REQUIRED_FIELDS, BUDGET_REQUIRED_VALIDATOR, result)
+
+    budget_amount = budget.get('budget')
+    actual = budget.get('actual')
+    variance = budget.get('variance')
 
     # Validate budget amount
-    if 'budget' in budget and budget['budget'] is not None:
-        if budget['budget'] < 0:
-            result.add_error(f"Budget amount cannot be negative: {budget['budget']}")
+    if budget_amount is not None:
+        if budget_amount < 0:
+            result.add_error("Budget amount cannot be negative: %s", budget_amount)
 
     # Validate actual amount
-    if 'actual' in budget and budget['actual'] is not None:
-        if budget['actual'] < 0:
-            result.add_warning(f"Actual amount is negative (possible refund?): {budget['actual']}")
+    if actual is not None:
+        if actual < 0:
+            result.add_warning("Actual amount is negative (possible refund?): %s", actual)
 
     # Validate variance consistency
-    if all(k in budget and budget[k] is not None for k in ['budget', 'actual', 'variance']):
-        expected_variance = budget['actual'] - budget['budget']
-        if abs(expected_variance - budget['variance']) > 0.01:
+    if budget_amount is not None and actual is not None and variance is not None:
+        expected_variance = actual - budget_amount
+        if abs(expected_variance - variance) > 0.01:
             result.add_error(
-                f"Variance inconsistency: {budget['actual']} - {budget['budget']} = {expected_variance}, "
-                f"but variance={budget['variance']}"
+                "Variance inconsistency: %s - %s = %s, but variance=%s",
+                actual, budget_amount, expected_variance, variance
             )
 
     result.info['document_type'] = 'budget'
@@ -271,6 +409,8 @@ def detect_duplicates(
     """
     Find duplicate documents using fuzzy matching.
 
+    Collects iter_duplicates into a list sorted by index pair.
+
     Args:
         documents: List of document dictionaries
         threshold: Similarity threshold (0-1, default 0.95)
@@ -288,33 +428,435 @@ def detect_duplicates(
         >>> print(len(duplicates))
         1
     """
+    duplicates = sorted(iter_duplicates(documents, threshold, key_fields))
+
+    for i, j, similarity in duplicates:
+        logger.info("Found duplicate documents: #%d and #%d (similarity: %.2f%%)", i, j, similarity * 100)
+
+    return duplicates
+
+
+def iter_duplicates(
+    documents: List[Dict[str, Any]],
+    threshold: float = 0.95,
+    key_fields: Optional[List[str]] = None
+) -> Iterator[Tuple[int, int, float]]:
+    """
+    Yield duplicate document pairs as they are found, in no particular order.
+
+    Comparisons run in three tiers: candidate pairs are first blocked on
+    amount and name fields (_candidate_pairs), pairs with identical key
+    values are accepted via a fingerprint match, and only the remaining
+    pairs are scored field by field.
+
+    Memory grows linearly with the number of documents, not with the
+    number of pairs. Built up front are the prepared key values,
+    fingerprints, the amount order and each name's q-gram set, plus the
+    q-gram prefix index when there is no amount field. While the pairs
+    are yielded, only one document's set of name partners is held at a
+    time. Candidate pairs and matches are generated lazily, so callers
+    that stream or count results never hold a list of pairs.
+
+    Args:
+        documents: List of document dictionaries
+        threshold: Similarity threshold (0-1, default 0.95)
+        key_fields: Fields to compare (default: vendor, amount, date)
+
+    Yields:
+        (index1, index2, similarity_score) tuples with index1 < index2
+    """
     if key_fields is None:
         key_fields = ['vendor', 'amount', 'total_ttc', 'date']
 
-    duplicates = []
+    # Build one accessor per key field and extract and normalize each
+    # document's values once, so pairs reuse the lower-cased strings
+    accessors = [_make_accessor(field) for field in key_fields]
+    values = [[_prepare_value(accessor(doc)) for accessor in accessors] for doc in documents]
+    fingerprints = [_fingerprint(doc_values) for doc_values in values]
+
+    # Batches repeat a few vendor names many times: score each distinct
+    # name pair once (the similarity is symmetric, so order the key)
+    cached_similarity = lru_cache(maxsize=STRING_SIMILARITY_CACHE_SIZE)(_string_similarity)
+
+    def string_similarity(text1: str, text2: str) -> float:
+        if text1 <= text2:
+            return cached_similarity(text1, text2)
+        return cached_similarity(text2, text1)
+
+    for i, j in _candidate_pairs(values, threshold):
+        if fingerprints[i] is not None and fingerprints[i] == fingerprints[j]:
+            similarity = 1.0
+        else:
+            similarity = _prepared_similarity(values[i], values[j], threshold, string_similarity)
+
+        if similarity >= threshold:
+            yield i, j, similarity
+
 
-    for i in range(len(documents)):
-        for j in range(i + 1, len(documents)):
-            similarity = _calculate_document_similarity(
-                documents[i],
-                documents[j],
-                key_fields
+def _candidate_pairs(values: List[List[Any]], threshold: float):
+    """
+    Yield the (i, j) index pairs, i < j, that can reach the threshold.
+
+    When fewer than 1 / (1 - threshold) fields are compared, every compared
+    field must score at least 1 - num_fields * (1 - threshold) for the
+    average to reach the threshold. Two blocking schemes use that bound:
+
+    - Amounts: numeric fields score 0 unless within 1% of each other, so
+      documents are sorted by the field with the most positive amounts and
+      only paired with neighbours within 1% (_amount_pairs).
+    - Names: the string field with the most values is shingled into q-grams
+      and pairs that cannot share enough q-grams for the minimum string
+      similarity are dropped (_gram_blocking).
+
+    Otherwise all pairs are yielded.
+
+    Args:
+        values: Prepared key-field values per document (see _prepare_value)
+        threshold: Similarity threshold (0-1)
+
+    Yields:
+        Index pairs to score
+    """
+    n = len(values)
+    num_fields = len(values[0]) if values else 0
+
+    # Negative amounts can push a field score above 1, which breaks the bound
+    has_negative = any(
+        _is_number(value) and value < 0
+        for doc_values in values for value in doc_values
+    )
+
+    if has_negative or num_fields * (1 - threshold) >= 1:
+        for i in range(n):
+            for j in range(i + 1, n):
+                yield i, j
+        return
+
+    # Small slack so float rounding never prunes a real duplicate
+    min_field_score = 1 - num_fields * (1 - threshold) - 1e-9
+
+    amount_field = _most_common_field(
+        values, lambda value: _is_number(value) and value > 0
+    )
+    string_field = _most_common_field(
+        values, lambda value: isinstance(value, _StringKey)
+    )
+
+    blocking = None
+    if string_field is not None:
+        blocking = _gram_blocking(values, string_field, min_field_score)
+
+    if amount_field is not None:
+        # Amount neighbours are few: check their names pair by pair rather
+        # than generating name candidates as well
+        for i, j in _amount_pairs(values, amount_field):
+            if blocking is None or blocking[1](i, j):
+                yield i, j
+    elif blocking is not None:
+        yield from blocking[0]()
+    else:
+        for i in range(n):
+            for j in range(i + 1, n):
+                yield i, j
+
+
+def _most_common_field(values: List[List[Any]], predicate) -> Optional[int]:
+    """
+    Return the index of the key field where predicate holds for the most documents.
+
+    Args:
+        values: Key-field values per document
+        predicate: Test applied to each value
+
+    Returns:
+        Field index, or None if no field matches at least two documents
+    """
+    num_fields = len(values[0]) if values else 0
+    counts = [
+        sum(1 for doc_values in values if predicate(doc_values[k]))
+        for k in range(num_fields)
+    ]
+    if not counts or max(counts) < 2:
+        return None
+    return counts.index(max(counts))
+
+
+def _amount_pairs(values: List[List[Any]], field: int):
+    """
+    Yield pairs whose amounts in a field are within 1% of each other.
+
+    Documents without a positive amount in the field are paired with every
+    other document.
+
+    Args:
+        values: Key-field values per document
+        field: Index of the amount field
+
+    Yields:
+        Index pairs (i, j) with i < j
+    """
+    n = len(values)
+    blocked = []
+    unblocked = []
+    for idx, doc_values in enumerate(values):
+        amount = doc_values[field]
+        if _is_number(amount) and amount > 0:
+            blocked.append((amount, idx))
+        else:
+            unblocked.append(idx)
+    blocked.sort()
+
+    # Neighbours within 1% in sorted amount order
+    for a in range(len(blocked)):
+        amount_a, idx_a = blocked[a]
+        b = a + 1
+        while b < len(blocked) and amount_a / blocked[b][0] > 0.99:
+            idx_b = blocked[b][1]
+            yield min(idx_a, idx_b), max(idx_a, idx_b)
+            b += 1
+
+    # Documents without a usable amount are compared against everything
+    unblocked_set = set(unblocked)
+    for idx in unblocked:
+        for other in range(n):
+            if other != idx and (other not in unblocked_set or other > idx):
+                yield min(idx, other), max(idx, other)
+
+
+def _gram_blocking(values: List[List[Any]], field: int, min_similarity: float):
+    """
+    Block documents on the q-grams of a string field.
+
+    Indel similarity s bounds the edit distance by (len_a + len_b) * (1 - s),
+    and a pair within edit distance k shares at least
+    max(len_a, len_b) - q + 1 - k * q q-grams, so pairs below that count (or
+    with incompatible lengths) cannot reach min_similarity.
+
+    Nothing is indexed up front: allowed(i, j) intersects the two documents'
+    q-gram profiles on demand, and candidates() only indexes a prefix of
+    each profile (see _gram_prefix_pairs). Documents whose value could match
+    some length without sharing a q-gram are paired with each other directly.
+
+    Args:
+        values: Prepared key-field values per document
+        field: Index of the string field
+        min_similarity: Minimum string similarity a duplicate pair needs
+
+    Returns:
+        (candidates() generator function, allowed(i, j) predicate), or None if
+        the field mixes plain strings and name dicts
+    """
+    n = len(values)
+    keys = [
+        doc_values[field] if isinstance(doc_values[field], _StringKey) else None
+        for doc_values in values
+    ]
+    if len({key.kind for key in keys if key is not None}) > 1:
+        return None
+
+    texts = {idx: key.text for idx, key in enumerate(keys) if key is not None}
+    unkeyed = [idx for idx, key in enumerate(keys) if key is None]
+    profiles = {idx: _gram_tokens(text) for idx, text in texts.items()}
+
+    def required(i: int, j: int) -> Optional[int]:
+        """Shared q-grams the pair needs, or None if their lengths rule it out."""
+        len_a, len_b = len(texts[i]), len(texts[j])
+        if not _lengths_compatible(len_a, len_b, min_similarity):
+            return None
+        return _required_shared_grams(len_a, len_b, min_similarity)
+
+    def allowed(i: int, j: int) -> bool:
+        if keys[i] is None or keys[j] is None:
+            return True
+        needed = required(i, j)
+        if needed is None:
+            return False
+        return needed <= 0 or len(profiles[i] & profiles[j]) >= needed
+
+    def candidates():
+        # Pairs that must share at least one q-gram
+        for i, j in _gram_prefix_pairs(texts, profiles, min_similarity):
+            needed = required(i, j)
+            if needed is not None and needed > 0 and len(profiles[i] & profiles[j]) >= needed:
+                yield i, j
+
+        # Documents that may match some partner without sharing any q-gram
+        lengths = {len(text) for text in texts.values()}
+        free = [
+            idx for idx, text in texts.items()
+            if any(
+                _lengths_compatible(len(text), other, min_similarity)
+                and _required_shared_grams(len(text), other, min_similarity) <= 0
+                for other in lengths
             )
+        ]
+        for a in range(len(free)):
+            for b in range(a + 1, len(free)):
+                i, j = free[a], free[b]
+                needed = required(i, j)
+                if needed is not None and needed <= 0:
+                    yield i, j
+
+        unkeyed_set = set(unkeyed)
+        for idx in unkeyed:
+            for other in range(n):
+                if other != idx and (other not in unkeyed_set or other > idx):
+                    yield min(idx, other), max(idx, other)
+
+    return candidates, allowed
+
+
+def _gram_prefix_pairs(
+    texts: Dict[int, str],
+    profiles: Dict[int, frozenset],
+    min_similarity: float
+) -> Iterator[Tuple[int, int]]:
+    """
+    Yield each pair (i, j), i < j, whose q-gram prefixes intersect.
 
-            if similarity >= threshold:
-                duplicates.append((i, j, similarity))
-                logger.info(
-                    f"Found duplicate documents: #{i} and #{j} "
-                    f"(similarity: {similarity:.2%})"
-                )
+    Prefix filtering: with every document's q-gram occurrences sorted in one
+    global order (rarest first), two documents sharing at least t occurrences
+    also share one among the first size - t + 1 of each. t is taken as the
+    smallest positive requirement over the lengths present, so every pair
+    needing at least one shared q-gram is yielded. Common grams ("sarl",
+    "fournisseur") sort last and mostly stay out of the index; only the
+    prefixes are indexed, and partners are collected one document at a time.
 
-    return duplicates
+    Args:
+        texts: Lower-cased string value per document index
+        profiles: _gram_tokens of each text
+        min_similarity: Minimum string similarity a duplicate pair needs
+
+    Yields:
+        Index pairs, each once
+    """
+    frequency = Counter(token for profile in profiles.values() for token in profile)
+    lengths = {len(text) for text in texts.values()}
+
+    prefixes = {}
+    index = defaultdict(list)
+    for idx in sorted(texts):
+        length = len(texts[idx])
+        min_required = min(
+            max(1, _required_shared_grams(length, other, min_similarity))
+            for other in lengths if _lengths_compatible(length, other, min_similarity)
+        )
+        tokens = sorted(profiles[idx], key=lambda token: (frequency[token], token))
+        prefix = tokens[:len(tokens) - min_required + 1]
+        prefixes[idx] = prefix
+        for token in prefix:
+            index[token].append(idx)
+
+    for i, prefix in prefixes.items():
+        partners = set()
+        for token in prefix:
+            postings = index[token]
+            # Postings are in index order: only look past i
+            partners.update(postings[bisect_left(postings, i + 1):])
+        for j in sorted(partners):
+            yield i, j
+
+
+class _StringKey(NamedTuple):
+    """A key-field value compared as text: kind ('str' or 'name') and lower-cased text."""
+    kind: str
+    text: str
+
+
+def _prepare_value(value: Any) -> Any:
+    """
+    Normalize a key-field value for comparison.
+
+    Strings and vendor-style dicts with a name become a _StringKey holding
+    the lower-cased text, so it is computed once per document instead of
+    once per pair; plain strings and name dicts are only compared with
+    their own kind. Dicts without a name are never compared and become
+    None. Other values are returned unchanged.
+    """
+    if isinstance(value, str):
+        return _StringKey('str', value.lower())
+    if isinstance(value, dict):
+        name = value.get('name', '')
+        return _StringKey('name', str(name).lower()) if name else None
+    return value
+
+
+def _qgrams(text: str) -> Counter:
+    """Count the QGRAM_SIZE-character substrings of a string."""
+    return Counter(text[k:k + QGRAM_SIZE] for k in range(len(text) - QGRAM_SIZE + 1))
+
+
+def _gram_tokens(text: str) -> frozenset:
+    """
+    Return a string's q-gram occurrences as (q-gram, occurrence number) pairs.
+
+    The intersection size of two such sets is the number of q-grams the
+    strings share, counting repeats (min of the two counts per q-gram).
+    """
+    return frozenset(
+        (gram, k) for gram, count in _qgrams(text).items() for k in range(count)
+    )
+
+
+def _lengths_compatible(len_a: int, len_b: int, min_similarity: float) -> bool:
+    """Check that strings of these lengths can reach min_similarity (LCS <= shorter length)."""
+    return 2 * min(len_a, len_b) >= min_similarity * (len_a + len_b)
+
+
+def _required_shared_grams(len_a: int, len_b: int, min_similarity: float) -> int:
+    """Minimum number of shared q-grams for strings of these lengths to reach min_similarity."""
+    max_distance = int((len_a + len_b) * (1 - min_similarity))
+    return max(len_a, len_b) - QGRAM_SIZE + 1 - QGRAM_SIZE * max_distance
+
+
+def _is_number(value: Any) -> bool:
+    """Check whether a value is compared numerically and is not NaN."""
+    return isinstance(value, (int, float)) and value == value
+
+
+def _fingerprint(doc_values: List[Any]) -> Optional[Tuple[Any, ...]]:
+    """
+    Build a hashable key such that equal keys imply a similarity of 1.0.
+
+    Numbers and dates are keyed by value and strings by their prepared
+    _StringKey. Fields that would not be compared are marked as skipped.
+
+    Args:
+        doc_values: Prepared key-field values of one document
+
+    Returns:
+        Fingerprint tuple, or None if no field would be compared
+    """
+    parts = []
+    compared = False
+
+    for value in doc_values:
+        if value is None:
+            parts.append(None)
+            continue
+
+        if isinstance(value, (int, float)):
+            if value != value:  # NaN never scores as equal
+                return None
+            parts.append(('num', value))
+        elif isinstance(value, datetime):
+            parts.append(('date', value))
+        elif isinstance(value, _StringKey):
+            parts.append(value)
+        else:
+            parts.append(('skip',))
+            continue
+
+        compared = True
+
+    return tuple(parts) if compared else None
 
 
 def _calculate_document_similarity(
     doc1: Dict[str, Any],
     doc2: Dict[str, Any],
-    key_fields: List[str]
+    key_fields: List[str],
+    threshold: Optional[float] = None
 ) -> float:
     """
     Calculate similarity between two documents.
@@ -323,16 +865,71 @@ def _calculate_document_similarity(
         doc1: First document
         doc2: Second document
         key_fields: Fields to compare
+        threshold: If given, return 0.0 as soon as the score provably
+            cannot reach it
 
     Returns:
         Similarity score (0-1)
     """
-    scores = []
+    return _values_similarity(
+        [_get_nested_value(doc1, field) for field in key_fields],
+        [_get_nested_value(doc2, field) for field in key_fields],
+        threshold
+    )
+
+
+def _values_similarity(
+    values1: List[Any],
+    values2: List[Any],
+    threshold: Optional[float] = None
+) -> float:
+    """
+    Calculate similarity between two documents' extracted key-field values.
 
-    for field in key_fields:
-        val1 = _get_nested_value(doc1, field)
-        val2 = _get_nested_value(doc2, field)
+    Args:
+        values1: Key-field values of the first document
+        values2: Key-field values of the second document, in the same order
+        threshold: Optional threshold enabling the early exit
 
+    Returns:
+        Similarity score (0-1), or 0.0 if the early exit was taken
+    """
+    return _prepared_similarity(
+        [_prepare_value(value) for value in values1],
+        [_prepare_value(value) for value in values2],
+        threshold
+    )
+
+
+def _prepared_similarity(
+    values1: List[Any],
+    values2: List[Any],
+    threshold: Optional[float] = None,
+    string_similarity=None
+) -> float:
+    """
+    Calculate similarity between two documents' prepared key-field values.
+
+    Numeric and date fields are scored first. String fields are deferred,
+    and when a threshold is given they are skipped entirely if even perfect
+    string matches could not lift the average to it.
+
+    Args:
+        values1: Prepared key-field values of the first document
+        values2: Prepared key-field values of the second document
+        threshold: Optional threshold enabling the early exit
+        string_similarity: Text scorer (default: _string_similarity)
+
+    Returns:
+        Similarity score (0-1), or 0.0 if the early exit was taken
+    """
+    if string_similarity is None:
+        string_similarity = _string_similarity
+
+    scores = []
+    deferred = []  # (position in scores, text1, text2)
+
+    for val1, val2 in zip(values1, values2):
         if val1 is None or val2 is None:
             continue
 
@@ -352,23 +949,100 @@ def _calculate_document_similarity(
             # Date comparison (exact match)
             scores.append(1.0 if val1 == val2 else 0.0)
 
-        elif isinstance(val1, str) and isinstance(val2, str):
-            # String comparison (fuzzy matching)
-            similarity = SequenceMatcher(None, val1.lower(), val2.lower()).ratio()
-            scores.append(similarity)
+        elif isinstance(val1, _StringKey) and isinstance(val2, _StringKey):
+            # String or vendor-name comparison (fuzzy matching), scored below
+            if val1.kind == val2.kind:
+                deferred.append((len(scores), val1.text, val2.text))
+                scores.append(None)
+
+    if deferred:
+        # String scores are at most 1, which bounds the achievable average
+        if threshold is not None and len(deferred) < len(scores):
+            known = sum(score for score in scores if score is not None)
+            if (known + len(deferred)) / len(scores) < threshold - 1e-9:
+                return 0.0
 
-        elif isinstance(val1, dict) and isinstance(val2, dict):
-            # For dict values (like vendor), compare name field
-            name1 = val1.get('name', '')
-            name2 = val2.get('name', '')
-            if name1 and name2:
-                similarity = SequenceMatcher(None, str(name1).lower(), str(name2).lower()).ratio()
-                scores.append(similarity)
+        for pos, text1, text2 in deferred:
+            scores[pos] = string_similarity(text1, text2)
 
     # Return average similarity across all compared fields
     return sum(scores) / len(scores) if scores else 0.0
 
 
+def _string_similarity(a: str, b: str) -> float:
+    """
+    Indel similarity ratio between two strings: 2 * LCS / (len(a) + len(b)).
+
+    Uses rapidfuzz's C++ implementation when installed, and the equivalent
+    bit-parallel LCS in pure Python otherwise, so scores do not depend on
+    which one is available.
+
+    Args:
+        a: First string
+        b: Second string
+
+    Returns:
+        Similarity ratio (0-1)
+    """
+    if HAS_RAPIDFUZZ:
+        return fuzz.ratio(a, b) / 100.0
+
+    total = len(a) + len(b)
+    if total == 0:
+        return 1.0
+
+    return 2 * _lcs_length(a, b) / total
+
+
+@lru_cache(maxsize=1024)
+def _char_masks(s: str) -> Dict[str, int]:
+    """
+    Build per-character bit masks: bit i of masks[c] is set if s[i] == c.
+
+    Cached because duplicate detection compares each string many times.
+    """
+    masks: Dict[str, int] = {}
+    bit = 1
+    for ch in s:
+        masks[ch] = masks.get(ch, 0) | bit
+        bit <<= 1
+    return masks
+
+
+def _lcs_length(a: str, b: str) -> int:
+    """
+    Length of the longest common subsequence of two strings.
+
+    Bit-parallel algorithm (Allison-Dix / Hyyrö): one DP row is packed into
+    a single integer and updated with a few bitwise operations per character
+    of b, instead of an inner loop over a.
+
+    Args:
+        a: First string
+        b: Second string
+
+    Returns:
+        LCS length
+    """
+    if len(a) > len(b):
+        a, b = b, a
+    if not a:
+        return 0
+
+    masks = _char_masks(a)
+    full = (1 << len(a)) - 1
+    row = full
+
+    for ch in b:
+        match = masks.get(ch)
+        if match:
+            u = row & match
+            row = ((row + u) | (row - u)) & full
+
+    # Each cleared bit marks one matched character
+    return len(a) - row.bit_count()
+
+
 def _get_nested_value(d: Dict[str, Any], key: str) -> Any:
     """
     Get value from dictionary, supporting nested keys with dot notation.
@@ -380,17 +1054,57 @@ def _get_nested_value(d: Dict[str, Any], key: str) -> Any:
     Returns:
         Value or None
     """
-    if '.' in key:
-        keys = key.split('.')
-        value = d
-        for k in keys:
-            if isinstance(value, dict):
-                value = value.get(k)
-            else:
-                return None
-        return value
-    else:
-        return d.get(key)
+    return _get_path_value(d, tuple(key.split('.')))
+
+
+def _make_accessor(key: str):
+    """
+    Build a function returning a document's value for a (dotted) key.
+
+    Equivalent to _get_nested_value(d, key), but the key is split once and
+    the common one- and two-level cases are specialised into direct
+    dict.get calls.
+
+    Args:
+        key: Key (can be nested like 'vendor.name')
+
+    Returns:
+        Callable taking a document and returning the value or None
+    """
+    path = tuple(key.split('.'))
+
+    if len(path) == 1:
+        return methodcaller('get', path[0])
+
+    if len(path) == 2:
+        outer, inner = path
+
+        def accessor(d: Dict[str, Any]) -> Any:
+            value = d.get(outer)
+            return value.get(inner) if isinstance(value, dict) else None
+
+        return accessor
+
+    return partial(_get_path_value, path=path)
+
+
+def _get_path_value(d: Dict[str, Any], path: Tuple[str, ...]) -> Any:
+    """
+    Get value from dictionary by following a pre-split key path.
+
+    Args:
+        d: Dictionary
+        path: Key components (e.g. ('vendor', 'name'))
+
+    Returns:
+        Value or None
+    """
+    value = d
+    for k in path:
+        if not isinstance(value, dict):
+            return None
+        value = value.get(k)
+    return value
 
 
 def detect_anomalies(documents: List[Dict[str, Any]], document_type: str = 'invoice') -> List[Dict[str, Any]]:
@@ -417,22 +1131,27 @@ def detect_anomalies(documents: List[Dict[str, Any]], document_type: str = 'invo
     anomalies = []
 
     if document_type == 'invoice':
-        # Check for unusual amounts
-        amounts = [doc.get('total_ttc') for doc in documents if doc.get('total_ttc')]
-        if len(amounts) > 3:
-            mean_amount = sum(amounts) / len(amounts)
-            std_amount = (sum((x - mean_amount) ** 2 for x in amounts) / len(amounts)) ** 0.5
-
-            for i, doc in enumerate(documents):
-                amount = doc.get('total_ttc')
-                if amount and abs(amount - mean_amount) > 3 * std_amount:
-                    anomalies.append({
-                        'index': i,
-                        'type': 'unusual_amount',
-                        'field': 'total_ttc',
-                        'value': amount,
-                        'message': f"Amount {amount} is unusual (mean: {mean_amount:.2f}, std: {std_amount:.2f})"
-                    })
+        # Check for unusual amounts (z-score over non-zero totals)
+        indices = [i for i, doc in enumerate(documents) if doc.get('total_ttc')]
+        if len(indices) > 3:
+            amounts = np.fromiter(
+                (documents[i]['total_ttc'] for i in indices),
+                dtype=np.float64,
+                count=len(indices)
+            )
+            mean_amount = float(amounts.mean())
+            std_amount = float(amounts.std())
+
+            for k in np.flatnonzero(np.abs(amounts - mean_amount) > 3 * std_amount):
+                i = indices[k]
+                amount = documents[i]['total_ttc']
+                anomalies.append({
+                    'index': i,
+                    'type': 'unusual_amount',
+                    'field': 'total_ttc',
+                    'value': amount,
+                    'message': f"Amount {amount} is unusual (mean: {mean_amount:.2f}, std: {std_amount:.2f})"
+                })
 
     return anomalies
 
@@ -461,13 +1180,13 @@ def validate_date_range(
 
     if start_date and end_date:
         if end_date < start_date:
-            result.add_error(f"End date ({end_date}) before start date ({start_date})")
+            result.add_error("End date (%s) before start date (%s)", end_date, start_date)
 
         days_diff = (end_date - start_date).days
         if days_diff > max_days:
-            result.add_warning(f"Date range ({days_diff} days) exceeds maximum ({max_days} days)")
+            result.add_warning("Date range (%s days) exceeds maximum (%s days)", days_diff, max_days)
         elif days_diff < 0:
-            result.add_error(f"Negative date range: {days_diff} days")
+            result.add_error("Negative date range: %s days", days_diff)
 
     return result
 
@@ -495,24 +1214,87 @@ def validate_amount_range(
         return result
 
     if amount < min_value:
-        result.add_error(f"Amount {amount} is below minimum {min_value}")
+        result.add_error("Amount %s is below minimum %s", amount, min_value)
 
     if max_value is not None and amount > max_value:
-        result.add_warning(f"Amount {amount} exceeds maximum {max_value}")
+        result.add_warning("Amount %s exceeds maximum %s", amount, max_value)
 
     return result
 
 
+# Document type -> validation function used by batch_validate
+DOCUMENT_VALIDATORS = {
+    'invoice': validate_invoice,
+    'contract': validate_contract,
+    'budget': validate_budget,
+}
+
+# Document type -> date fields coerced to datetime by batch_validate
+DOCUMENT_DATE_FIELDS = {
+    'invoice': ('date', 'due_date'),
+    'contract': ('start_date', 'end_date'),
+}
+
+
+def _naive_utc(value: datetime) -> datetime:
+    """Convert a timezone-aware datetime to naive UTC (naive values are returned as-is)."""
+    if value.tzinfo is None:
+        return value
+    return value.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+def _coerce_dates(document: Dict[str, Any], date_fields: Tuple[str, ...]) -> Dict[str, Any]:
+    """
+    Convert ISO-format date strings in the given fields to naive UTC datetimes.
+
+    Documents reloaded from processed JSON carry dates as strings, which
+    the validators' date checks would otherwise skip. Timezone-aware values
+    are converted to naive UTC so a document mixing aware and naive dates
+    can still be compared. The document is shallow-copied only when a field
+    is converted.
+
+    Args:
+        document: Document dictionary
+        date_fields: Fields that hold dates
+
+    Returns:
+        The document, or a copy with its dates normalized
+    """
+    coerced = document
+    for date_field in date_fields:
+        value = document.get(date_field)
+        if isinstance(value, str):
+            try:
+                parsed = _naive_utc(datetime.fromisoformat(value))
+            except ValueError:
+                continue
+        elif isinstance(value, datetime) and value.tzinfo is not None:
+            parsed = _naive_utc(value)
+        else:
+            continue
+        if coerced is document:
+            coerced = dict(document)
+        coerced[date_field] = parsed
+    return coerced
+
+
 def batch_validate(
     documents: List[Dict[str, Any]],
-    document_type: str = 'invoice'
+    document_type: str = 'invoice',
+    max_workers: Optional[int] = None
 ) -> Dict[str, Any]:
     """
     Validate a batch of documents and return summary.
 
+    ISO date strings are parsed before validation (the input documents are
+    not modified). Batches over PARALLEL_VALIDATION_THRESHOLD documents are
+    validated in a process pool; duplicate detection always runs in the
+    calling process on the original documents.
+
     Args:
         documents: List of documents to validate
         document_type: Type of documents
+        max_workers: Maximum worker processes (default: CPU count)
 
     Returns:
         Dictionary with validation summary
@@ -523,27 +1305,34 @@ def batch_validate(
         >>> print(summary['valid_count'])
         1
     """
-    results = []
+    validator = DOCUMENT_VALIDATORS.get(document_type)
+
+    # Parse date strings once up front so every date check sees datetimes
+    date_fields = DOCUMENT_DATE_FIELDS.get(document_type)
+    if date_fields:
+        to_validate = [_coerce_dates(doc, date_fields) for doc in documents]
+    else:
+        to_validate = documents
 
     # Validate each document
-    for doc in documents:
-        if document_type == 'invoice':
-            result = validate_invoice(doc)
-        elif document_type == 'contract':
-            result = validate_contract(doc)
-        elif document_type == 'budget':
-            result = validate_budget(doc)
-        else:
+    workers = max_workers or os.cpu_count() or 1
+    if validator is not None and workers > 1 and len(documents) > PARALLEL_VALIDATION_THRESHOLD:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(validator, to_validate, chunksize=VALIDATION_CHUNK_SIZE))
+    elif validator is not None:
+        results = [validator(doc) for doc in to_validate]
+    else:
+        results = []
+        for doc in documents:
             result = ValidationResult(is_valid=False)
-            result.add_error(f"Unknown document type: {document_type}")
-
-        results.append(result)
+            result.add_error("Unknown document type: %s", document_type)
+            results.append(result)
 
     # Calculate summary
     valid_count = sum(1 for r in results if r.is_valid)
     invalid_count = len(results) - valid_count
-    total_errors = sum(len(r.errors) for r in results)
-    total_warnings = sum(len(r.warnings) for r in results)
+    total_errors = sum(r.error_count for r in results)
+    total_warnings = sum(r.warning_count for r in results)
 
     # Detect duplicates
     duplicates = detect_duplicates(documents)
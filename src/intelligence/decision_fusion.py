@@ -5,8 +5,14 @@ Aggregates signals from all intelligence modules, ranks tactical decisions
 by priority score, and returns actionable recommendations.
 """
 
+import heapq
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, asdict
+from operator import attrgetter
 from typing import List, Dict, Any
 
+import numpy as np
+
 
 SEVERITY_WEIGHTS = {
     "critical": 3,
@@ -14,6 +20,45 @@ SEVERITY_WEIGHTS = {
     "info": 1,
 }
 
+# Sort key for ranking Decision objects
+_PRIORITY_KEY = attrgetter("priority_score")
+
+
+def _column(rows: List[Dict[str, Any]], key: str, default: float) -> np.ndarray:
+    """Extract a numeric field from raw graph rows, treating missing or falsy values as default."""
+    return np.fromiter(
+        (row.get(key, default) or default for row in rows),
+        dtype=np.float64,
+        count=len(rows),
+    )
+
+
+def _severity_weights(critical: np.ndarray, warning: np.ndarray) -> np.ndarray:
+    """Map critical/warning/other masks to SEVERITY_WEIGHTS (other rows score as info)."""
+    return np.where(
+        critical,
+        SEVERITY_WEIGHTS["critical"],
+        np.where(warning, SEVERITY_WEIGHTS["warning"], SEVERITY_WEIGHTS["info"]),
+    )
+
+
+def _scores(severity_weights: np.ndarray, financial_impact: np.ndarray, urgency) -> np.ndarray:
+    """Vectorised DecisionFusion._score over arrays of rows."""
+    return severity_weights * np.maximum(0.1, financial_impact) * urgency * 10
+
+
+@dataclass(slots=True)
+class Decision:
+    """A ranked tactical decision produced by one signal source."""
+    id: str
+    source: str
+    severity: str
+    title: str
+    description: str
+    recommended_action: str
+    financial_impact_eur: float
+    priority_score: float
+
 
 class DecisionFusion:
     """Aggregates and ranks tactical decisions from all intelligence sources."""
@@ -37,153 +82,166 @@ class DecisionFusion:
         """
         # Collect from each source, cap per-source to ensure diversity
         PER_SOURCE_CAP = 5
-        all_decisions: List[Dict[str, Any]] = []
+        all_decisions: List[Decision] = []
 
-        for source_fn in [
+        sources = [
             self._invoice_decisions,
             self._budget_decisions,
             self._contract_decisions,
             self._episodic_decisions,
             self._weak_signal_decisions,
-        ]:
-            items = source_fn()
-            items.sort(key=lambda d: d["priority_score"], reverse=True)
-            all_decisions += items[:PER_SOURCE_CAP]
+        ]
 
-        # Global sort and return top N
-        all_decisions.sort(key=lambda d: d["priority_score"], reverse=True)
-        return all_decisions[:limit]
+        # Sources are independent graph queries, so fetch them concurrently
+        with ThreadPoolExecutor(max_workers=len(sources)) as executor:
+            futures = [executor.submit(source_fn) for source_fn in sources]
+
+        for future in futures:
+            all_decisions.extend(heapq.nlargest(PER_SOURCE_CAP, future.result(), key=_PRIORITY_KEY))
+
+        # Global top N, converting to dicts only for those
+        top = heapq.nlargest(limit, all_decisions, key=_PRIORITY_KEY)
+        return [asdict(d) for d in top]
 
     # ============================================
     # Signal Sources
     # ============================================
 
-    def _budget_decisions(self) -> List[Dict[str, Any]]:
+    def _budget_decisions(self) -> List[Decision]:
         decisions = []
         try:
             budgets = self.graph.get_all_budgets_raw()
-            for b in budgets:
+            budget_amts = _column(budgets, "budget", 0)
+            actual_amts = _column(budgets, "actual", 0)
+
+            valid = budget_amts > 0
+            overruns = actual_amts - budget_amts
+            overrun_pcts = np.divide(
+                overruns, budget_amts, out=np.zeros_like(overruns), where=valid
+            ) * 100
+
+            critical = valid & (overrun_pcts > 20)
+            warning = valid & ~critical & (overrun_pcts > 5)
+
+            financial_impact = np.minimum(1.0, np.abs(overruns) / 500000)
+            urgency = 1.0
+            scores = _scores(_severity_weights(critical, warning), financial_impact, urgency)
+
+            for i in np.flatnonzero(critical | warning):
+                b = budgets[i]
                 budget_amt = b.get("budget", 0) or 0
                 actual_amt = b.get("actual", 0) or 0
-                if budget_amt <= 0:
-                    continue
                 overrun = actual_amt - budget_amt
-                overrun_pct = overrun / budget_amt * 100 if budget_amt else 0
-
-                if overrun_pct > 20:
-                    severity = "critical"
-                elif overrun_pct > 5:
-                    severity = "warning"
-                else:
-                    continue
+                severity = "critical" if critical[i] else "warning"
 
-                financial_impact = min(1.0, abs(overrun) / 500000)
-                urgency = 1.0
-                score = self._score(severity, financial_impact, urgency)
-
-                decisions.append({
-                    "id": f"budget_overrun_{b.get('department', 'dept')}",
-                    "source": "Budget",
-                    "severity": severity,
-                    "title": f"Budget overrun: {b.get('department', '?')}",
-                    "description": (
+                decisions.append(Decision(
+                    id=f"budget_overrun_{b.get('department', 'dept')}",
+                    source="Budget",
+                    severity=severity,
+                    title=f"Budget overrun: {b.get('department', '?')}",
+                    description=(
                         f"Department '{b.get('department', '?')}' actual spend "
                         f"({actual_amt:,.0f} EUR) exceeds budget ({budget_amt:,.0f} EUR) "
-                        f"by {overrun_pct:.1f}%."
+                        f"by {overrun_pcts[i]:.1f}%."
                     ),
-                    "recommended_action": (
+                    recommended_action=(
                         "Review discretionary spending and freeze non-critical purchases. "
                         "Request variance explanation from department head."
                     ),
-                    "financial_impact_eur": round(abs(overrun), 2),
-                    "priority_score": round(score, 1),
-                })
+                    financial_impact_eur=round(abs(overrun), 2),
+                    priority_score=round(float(scores[i]), 1),
+                ))
         except Exception:
             pass
         return decisions
 
-    def _invoice_decisions(self) -> List[Dict[str, Any]]:
+    def _invoice_decisions(self) -> List[Decision]:
         decisions = []
         try:
             invoices = self.graph.get_all_invoices_raw()
-            for inv in invoices:
-                days = inv.get("days_overdue", 0) or 0
-                if days <= 0:
-                    continue
-                if days >= 60:
-                    severity = "critical"
-                elif days >= 30:
-                    severity = "warning"
-                else:
-                    continue
+            days_overdue = _column(invoices, "days_overdue", 0)
+            amounts = _column(invoices, "amount", 0)
 
+            critical = days_overdue >= 60
+            warning = ~critical & (days_overdue >= 30)
+
+            financial_impact = np.minimum(1.0, amounts / 100000)
+            urgency = 1 + np.minimum(days_overdue / 100, 1.0)
+            scores = _scores(_severity_weights(critical, warning), financial_impact, urgency)
+
+            for i in np.flatnonzero(critical | warning):
+                inv = invoices[i]
+                days = inv.get("days_overdue", 0) or 0
                 amount = inv.get("amount", 0) or 0
-                financial_impact = min(1.0, amount / 100000)
-                urgency = 1 + min(days / 100, 1.0)
-                score = self._score(severity, financial_impact, urgency)
-
-                decisions.append({
-                    "id": f"overdue_invoice_{inv.get('invoice_id', 'inv')}",
-                    "source": "Invoice",
-                    "severity": severity,
-                    "title": f"Overdue invoice: {inv.get('vendor', '?')}",
-                    "description": (
+                severity = "critical" if critical[i] else "warning"
+
+                decisions.append(Decision(
+                    id=f"overdue_invoice_{inv.get('invoice_id', 'inv')}",
+                    source="Invoice",
+                    severity=severity,
+                    title=f"Overdue invoice: {inv.get('vendor', '?')}",
+                    description=(
                         f"Invoice from '{inv.get('vendor', '?')}' for {amount:,.0f} EUR "
                         f"is {days} days overdue."
                     ),
-                    "recommended_action": (
+                    recommended_action=(
                         "Contact vendor to resolve payment. "
                         "Escalate to finance director if > 90 days."
                     ),
-                    "financial_impact_eur": round(amount, 2),
-                    "priority_score": round(score, 1),
-                })
+                    financial_impact_eur=round(amount, 2),
+                    priority_score=round(float(scores[i]), 1),
+                ))
         except Exception:
             pass
         return decisions
 
-    def _contract_decisions(self) -> List[Dict[str, Any]]:
+    def _contract_decisions(self) -> List[Decision]:
         decisions = []
         try:
             contracts = self.graph.get_all_contracts_raw()
-            for c in contracts:
-                days_left = c.get("days_until_expiry", 999) or 999
-                if days_left > 90 or days_left < 0:
-                    continue
+            days_left = _column(contracts, "days_until_expiry", 999)
+            annual_values = _column(contracts, "annual_value", 0)
 
-                if days_left <= 30:
+            expiring = (days_left >= 0) & (days_left <= 90)
+            critical = expiring & (days_left <= 30)
+            warning = expiring & ~critical & (days_left <= 60)
+
+            financial_impact = np.minimum(1.0, annual_values / 500000)
+            urgency = 1 + (90 - days_left) / 100
+            scores = _scores(_severity_weights(critical, warning), financial_impact, urgency)
+
+            for i in np.flatnonzero(expiring):
+                c = contracts[i]
+                days = c.get("days_until_expiry", 999) or 999
+                annual_value = c.get("annual_value", 0) or 0
+                if critical[i]:
                     severity = "critical"
-                elif days_left <= 60:
+                elif warning[i]:
                     severity = "warning"
                 else:
                     severity = "info"
 
-                annual_value = c.get("annual_value", 0) or 0
-                financial_impact = min(1.0, annual_value / 500000)
-                urgency = 1 + (90 - days_left) / 100
-                score = self._score(severity, financial_impact, urgency)
-
-                decisions.append({
-                    "id": f"expiring_contract_{c.get('contract_id', 'ctr')}",
-                    "source": "Contract",
-                    "severity": severity,
-                    "title": f"Contract expiring: {c.get('vendor', '?')}",
-                    "description": (
+                decisions.append(Decision(
+                    id=f"expiring_contract_{c.get('contract_id', 'ctr')}",
+                    source="Contract",
+                    severity=severity,
+                    title=f"Contract expiring: {c.get('vendor', '?')}",
+                    description=(
                         f"Contract with '{c.get('vendor', '?')}' (value: {annual_value:,.0f} EUR/yr) "
-                        f"expires in {days_left} days."
+                        f"expires in {days} days."
                     ),
-                    "recommended_action": (
+                    recommended_action=(
                         "Initiate renewal negotiations immediately. "
                         "Benchmark against market rates before signing."
                     ),
-                    "financial_impact_eur": round(annual_value, 2),
-                    "priority_score": round(score, 1),
-                })
+                    financial_impact_eur=round(annual_value, 2),
+                    priority_score=round(float(scores[i]), 1),
+                ))
         except Exception:
             pass
         return decisions
 
-    def _episodic_decisions(self) -> List[Dict[str, Any]]:
+    def _episodic_decisions(self) -> List[Decision]:
         decisions = []
         try:
             patterns = self.graph.get_episodic_memories()
@@ -192,21 +250,21 @@ class DecisionFusion:
                     continue
                 severity = "warning" if p.get("confidence", 0) >= 0.75 else "info"
                 score = self._score(severity, p.get("confidence", 0.5), 1.0)
-                decisions.append({
-                    "id": f"episodic_{p['id']}",
-                    "source": "Episodic Memory",
-                    "severity": severity,
-                    "title": f"Recurring pattern: {p.get('type', '?')} — {p.get('subject', '?')}",
-                    "description": p.get("description", ""),
-                    "recommended_action": "Review historical trend and take preventive action.",
-                    "financial_impact_eur": 0,
-                    "priority_score": round(score, 1),
-                })
+                decisions.append(Decision(
+                    id=f"episodic_{p['id']}",
+                    source="Episodic Memory",
+                    severity=severity,
+                    title=f"Recurring pattern: {p.get('type', '?')} — {p.get('subject', '?')}",
+                    description=p.get("description", ""),
+                    recommended_action="Review historical trend and take preventive action.",
+                    financial_impact_eur=0,
+                    priority_score=round(score, 1),
+                ))
         except Exception:
             pass
         return decisions
 
-    def _weak_signal_decisions(self) -> List[Dict[str, Any]]:
+    def _weak_signal_decisions(self) -> List[Decision]:
         decisions = []
         try:
             signals = self.graph.get_weak_signals(only_active=True)
@@ -216,22 +274,22 @@ class DecisionFusion:
                     continue
                 severity = "critical" if score_val >= 7 else "warning"
                 priority = self._score(severity, min(score_val / 10, 1.0), 1.2)
-                decisions.append({
-                    "id": f"weak_signal_{ws['id']}",
-                    "source": "Weak Signal",
-                    "severity": severity,
-                    "title": f"Financial stress cluster detected (score: {score_val})",
-                    "description": (
+                decisions.append(Decision(
+                    id=f"weak_signal_{ws['id']}",
+                    source="Weak Signal",
+                    severity=severity,
+                    title=f"Financial stress cluster detected (score: {score_val})",
+                    description=(
                         "Multiple correlated weak signals indicate hidden financial stress. "
                         "Individual signals are below alert threshold but combined score is high."
                     ),
-                    "recommended_action": (
+                    recommended_action=(
                         "Conduct holistic financial review. "
                         "Cross-check all flagged entities with management."
                     ),
-                    "financial_impact_eur": 0,
-                    "priority_score": round(priority, 1),
-                })
+                    financial_impact_eur=0,
+                    priority_score=round(priority, 1),
+                ))
         except Exception:
             pass
         return decisions
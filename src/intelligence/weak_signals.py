@@ -8,7 +8,17 @@ hidden financial stress that would not trigger individual alerts.
 import hashlib
 import json
 from datetime import datetime
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
+
+import numpy as np
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+from src.memory.cache import TTLCache, cached_query
 
 
 # Signal weights
@@ -23,6 +33,73 @@ SIGNAL_WEIGHTS = {
 STRESS_THRESHOLD = 4  # combined weight >= 4 → alert raised
 
 
+def _dump_signals(signals: List[Dict[str, Any]]) -> str:
+    """Serialize a signal list for the signals_json property, using orjson when available."""
+    if HAS_ORJSON:
+        return orjson.dumps(signals).decode()
+    return json.dumps(signals)
+
+
+def _load_signals(signals_json: Any) -> List[Dict[str, Any]]:
+    """Parse a stored signals_json value, using orjson when available."""
+    if not signals_json:
+        return []
+    if HAS_ORJSON:
+        return orjson.loads(signals_json)
+    return json.loads(signals_json)
+
+
+def _add_signals(
+    signals: Dict[str, List[Any]],
+    signal_type: str,
+    subjects: List[Any],
+    details: List[str]
+):
+    """Append one signal per (subject, detail) pair to the parallel signal lists."""
+    signals["types"].extend([signal_type] * len(subjects))
+    signals["subjects"].extend(subjects)
+    signals["details"].extend(details)
+    signals["weights"].extend([SIGNAL_WEIGHTS[signal_type]] * len(subjects))
+
+
+def _signal_dicts(signals: Dict[str, List[Any]]) -> List[Dict[str, Any]]:
+    """Materialize the parallel signal lists as one record per signal."""
+    return [
+        {"type": signal_type, "subject": subject, "detail": detail, "weight": weight}
+        for signal_type, subject, detail, weight in zip(
+            signals["types"], signals["subjects"], signals["details"], signals["weights"]
+        )
+    ]
+
+
+def _column(rows: List[Dict[str, Any]], key: str, default: float) -> np.ndarray:
+    """Extract a numeric field as a float array (missing or None -> default)."""
+    return np.fromiter(
+        (row.get(key) or default for row in rows), dtype=float, count=len(rows)
+    )
+
+
+def _overrun_pct(budget_arr: np.ndarray, actual_arr: np.ndarray) -> np.ndarray:
+    """Percentage over budget per row (0 where there is no positive budget)."""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(budget_arr > 0, (actual_arr - budget_arr) / budget_arr * 100, 0.0)
+
+
+def _filter_budget_overrun(overrun_arr: np.ndarray) -> np.ndarray:
+    """Mask of budgets overspent by 5–15% (overrun_arr from _overrun_pct)."""
+    return (overrun_arr >= 5) & (overrun_arr <= 15)
+
+
+def _filter_overdue(days_arr: np.ndarray) -> np.ndarray:
+    """Mask of invoices 15–30 days overdue."""
+    return (days_arr >= 15) & (days_arr <= 30)
+
+
+def _filter_contract_expiry(days_arr: np.ndarray) -> np.ndarray:
+    """Mask of contracts expiring in 61–90 days."""
+    return (days_arr >= 61) & (days_arr <= 90)
+
+
 class WeakSignalDetector:
     """Detects hidden financial stress by correlating weak signals."""
 
@@ -32,26 +109,55 @@ class WeakSignalDetector:
             graph: FinancialGraph instance
         """
         self.graph = graph
+        self._cache = TTLCache()
+        # Data fingerprint and result of the last completed run
+        self._last_fingerprint: Optional[str] = None
+        self._last_result: List[Dict[str, Any]] = []
 
     def run_detection(self) -> List[Dict[str, Any]]:
         """
         Run weak signal detection across all data sources.
 
+        Skipped (returning the previous result) when the graph data has not
+        changed since the last completed run.
+
         Returns:
             List of WeakSignal records that were created/updated
         """
-        signals_found = self._collect_signals()
-        if not signals_found:
+        # Analyze fresh rows so they match the fingerprint recorded below
+        self.graph.clear_cache()
+        try:
+            fingerprint = self.graph.get_data_fingerprint(include_patterns=True)
+        except Exception:
+            fingerprint = None
+        if fingerprint is not None and fingerprint == self._last_fingerprint:
+            return self._last_result
+
+        failed_sources: List[str] = []
+        result = self._detect_and_store(failed_sources)
+        # Only remember runs that saw every source so failures are retried
+        if not failed_sources:
+            self._last_fingerprint = fingerprint
+            self._last_result = result
+        return result
+
+    def _detect_and_store(self, failed_sources: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        """Collect signals and persist the cluster if it crosses STRESS_THRESHOLD."""
+        signals = self._collect_signals(failed_sources)
+        if not signals["types"]:
             return []
 
-        score = sum(s["weight"] for s in signals_found)
+        score = sum(signals["weights"])
         if score < STRESS_THRESHOLD:
             return []
 
         # Use a stable content-based ID so re-runs don't create duplicates
+        # (kept on stdlib json so IDs of stored clusters do not change)
         content = json.dumps(sorted(
-            [f"{s['type']}:{s['subject']}" for s in signals_found]
+            f"{signal_type}:{subject}"
+            for signal_type, subject in zip(signals["types"], signals["subjects"])
         ))
+        signals_found = _signal_dicts(signals)
         signal_id = "ws_" + hashlib.md5(content.encode()).hexdigest()[:12]
 
         # Check if this exact cluster already exists (unacknowledged)
@@ -62,97 +168,112 @@ class WeakSignalDetector:
         signal_data = {
             "id": signal_id,
             "score": score,
-            "signals_json": json.dumps(signals_found),
+            "signals_json": _dump_signals(signals_found),
             "detected_at": datetime.utcnow().isoformat(),
             "acknowledged": False,
         }
         self.graph.create_weak_signal_node(signal_data)
+        self._cache.clear()
         return [signal_data]
 
-    def _collect_signals(self) -> List[Dict[str, Any]]:
-        """Gather all individual weak signals from live data."""
-        signals = []
+    def _collect_signals(self, failed_sources: Optional[List[str]] = None) -> Dict[str, List[Any]]:
+        """
+        Gather all individual weak signals from live data.
+
+        A source whose query fails is logged and left out.
+
+        Args:
+            failed_sources: If given, the names of failed sources are appended
+
+        Returns:
+            Parallel lists keyed by "types", "subjects", "details" and "weights",
+            one entry per signal (see _signal_dicts for the record form)
+        """
+        signals: Dict[str, List[Any]] = {"types": [], "subjects": [], "details": [], "weights": []}
+
+        def source_failed(source: str, error: Exception):
+            print(f"Weak signal warning: {source} query failed: {error}")
+            if failed_sources is not None:
+                failed_sources.append(source)
 
         # 1. Budget slightly over (5–15%)
         try:
             budgets = self.graph.get_all_budgets_raw()
-            for b in budgets:
-                budget_amt = b.get("budget", 0) or 0
-                actual_amt = b.get("actual", 0) or 0
-                if budget_amt > 0:
-                    overrun_pct = (actual_amt - budget_amt) / budget_amt * 100
-                    if 5 <= overrun_pct <= 15:
-                        signals.append({
-                            "type": "budget_slightly_over",
-                            "subject": b.get("department", "?"),
-                            "detail": f"{overrun_pct:.1f}% over budget",
-                            "weight": SIGNAL_WEIGHTS["budget_slightly_over"],
-                        })
-        except Exception:
-            pass
+            budget_arr = _column(budgets, "budget", 0)
+            actual_arr = _column(budgets, "actual", 0)
+            overrun = _overrun_pct(budget_arr, actual_arr)
+            rows = np.nonzero(_filter_budget_overrun(overrun))[0].tolist()
+            _add_signals(
+                signals, "budget_slightly_over",
+                [budgets[i].get("department", "?") for i in rows],
+                [f"{overrun[i]:.1f}% over budget" for i in rows],
+            )
+        except Exception as e:
+            source_failed("budgets", e)
 
         # 2. Invoices 15-30 days overdue
         try:
             invoices = self.graph.get_all_invoices_raw()
-            for inv in invoices:
-                days = inv.get("days_overdue", 0) or 0
-                if 15 <= days <= 30:
-                    signals.append({
-                        "type": "invoice_moderately_overdue",
-                        "subject": inv.get("vendor", "?"),
-                        "detail": f"{days} days overdue",
-                        "weight": SIGNAL_WEIGHTS["invoice_moderately_overdue"],
-                    })
-        except Exception:
-            pass
+            days_arr = _column(invoices, "days_overdue", 0)
+            matches = [invoices[i] for i in np.nonzero(_filter_overdue(days_arr))[0].tolist()]
+            _add_signals(
+                signals, "invoice_moderately_overdue",
+                [inv.get("vendor", "?") for inv in matches],
+                [f"{inv.get('days_overdue')} days overdue" for inv in matches],
+            )
+        except Exception as e:
+            source_failed("invoices", e)
 
         # 3. Contracts expiring 61-90 days
         try:
             contracts = self.graph.get_all_contracts_raw()
-            for c in contracts:
-                days_left = c.get("days_until_expiry", 999) or 999
-                if 61 <= days_left <= 90:
-                    signals.append({
-                        "type": "contract_expiring_medium",
-                        "subject": c.get("vendor", "?"),
-                        "detail": f"{days_left} days until expiry",
-                        "weight": SIGNAL_WEIGHTS["contract_expiring_medium"],
-                    })
-        except Exception:
-            pass
+            days_arr = _column(contracts, "days_until_expiry", 999)
+            matches = [contracts[i] for i in np.nonzero(_filter_contract_expiry(days_arr))[0].tolist()]
+            _add_signals(
+                signals, "contract_expiring_medium",
+                [c.get("vendor", "?") for c in matches],
+                [f"{c.get('days_until_expiry')} days until expiry" for c in matches],
+            )
+        except Exception as e:
+            source_failed("contracts", e)
 
         # 4. Episodic patterns (new_episodic_pattern weight = 2)
         try:
             patterns = self.graph.get_episodic_memories()
             if patterns:
-                signals.append({
-                    "type": "new_episodic_pattern",
-                    "subject": "System",
-                    "detail": f"{len(patterns)} learned patterns active",
-                    "weight": SIGNAL_WEIGHTS["new_episodic_pattern"],
-                })
-        except Exception:
-            pass
+                _add_signals(
+                    signals, "new_episodic_pattern",
+                    ["System"], [f"{len(patterns)} learned patterns active"],
+                )
+        except Exception as e:
+            source_failed("episodic patterns", e)
 
         return signals
 
     def detect_signals(self) -> List[Dict[str, Any]]:
         """Return current signals as a live computation (no DB write). Used by orchestrator."""
         signals = self._collect_signals()
-        if not signals:
+        if not signals["types"]:
             return []
-        score = sum(s["weight"] for s in signals)
+        score = sum(signals["weights"])
         if score < STRESS_THRESHOLD:
             return []
-        return [{"score": score, "signals": [f"{s['subject']} — {s['detail']}" for s in signals]}]
+        return [{
+            "score": score,
+            "signals": [
+                f"{subject} — {detail}"
+                for subject, detail in zip(signals["subjects"], signals["details"])
+            ],
+        }]
 
+    @cached_query
     def get_active_signals(self) -> List[Dict[str, Any]]:
-        """Return all active (unacknowledged) weak signal clusters."""
+        """Return all active (unacknowledged) weak signal clusters (cached briefly)."""
         raw = self.graph.get_weak_signals(only_active=True)
         result = []
         for r in raw:
             try:
-                signals_list = json.loads(r.get("signals_json", "[]"))
+                signals_list = _load_signals(r.get("signals_json"))
             except Exception:
                 signals_list = []
             result.append({
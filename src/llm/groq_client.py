@@ -5,22 +5,30 @@ Provides natural language Q&A over financial data using
 the Groq API with Llama-3.3-70B-Versatile model.
 """
 
+import atexit
+import hashlib
+import threading
+from typing import Iterator
+
+import httpx
 from groq import Groq
 from src.config import settings
+from src.memory.cache import TTLCache
 
-_client: Groq | None = None
-
+try:
+    import h2  # noqa: F401 -- enables HTTP/2 in httpx
+    HAS_H2 = True
+except ImportError:
+    HAS_H2 = False
 
-def get_client() -> Groq:
-    """Return a shared Groq client (lazy singleton)."""
-    global _client
-    if _client is None:
-        _client = Groq(api_key=settings.GROQ_API_KEY)
-    return _client
+# Keep-alive pool shared by every Groq request
+HTTP_LIMITS = httpx.Limits(max_keepalive_connections=32, keepalive_expiry=60)
+HTTP_TIMEOUT_SECONDS = 60.0
 
+# Answers kept for repeated (context, question) pairs
+ANSWER_CACHE_SIZE = 256
 
-def build_system_prompt(context: str) -> str:
-    return f"""You are FINCENTER's financial intelligence assistant.
+_SYSTEM_HEADER = """You are FINCENTER's financial intelligence assistant.
 You answer questions about invoices, contracts, budgets, and financial analytics
 based exclusively on the data provided in the context below.
 
@@ -31,23 +39,79 @@ Rules:
 - Never make up figures.
 
 --- FINANCIAL DATA CONTEXT ---
-{context}
---- END CONTEXT ---"""
+"""
 
+_SYSTEM_FOOTER = "\n--- END CONTEXT ---"
 
-def answer_question(question: str, context: str) -> str:
+_answer_cache = TTLCache(maxsize=ANSWER_CACHE_SIZE, ttl=settings.CACHE_TTL_SECONDS)
+
+_client: Groq | None = None
+_client_lock = threading.Lock()
+
+
+def get_client() -> Groq:
+    """Return a shared Groq client backed by a persistent connection pool (lazy singleton)."""
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                http_client = httpx.Client(
+                    http2=HAS_H2,
+                    timeout=HTTP_TIMEOUT_SECONDS,
+                    limits=HTTP_LIMITS,
+                )
+                atexit.register(http_client.close)
+                _client = Groq(api_key=settings.GROQ_API_KEY, http_client=http_client)
+    return _client
+
+
+def warm_up():
+    """Open a pooled connection to Groq in the background so the first question skips the handshake."""
+    def _ping():
+        try:
+            get_client().models.list()
+        except Exception:
+            pass
+
+    threading.Thread(target=_ping, name="groq-warm-up", daemon=True).start()
+
+
+def build_system_prompt(context: str) -> str:
+    """Wrap the financial context in the fixed assistant instructions."""
+    return "".join((_SYSTEM_HEADER, context, _SYSTEM_FOOTER))
+
+
+def _answer_key(question: str, context: str) -> str:
+    """Cache key for an answer: SHA-256 of the context and question."""
+    digest = hashlib.sha256(context.encode("utf-8"))
+    digest.update(b"\0")
+    digest.update(question.encode("utf-8"))
+    return digest.hexdigest()
+
+
+def answer_question_stream(question: str, context: str) -> Iterator[str]:
     """
-    Send a question + financial context to Groq and return the answer.
+    Send a question + financial context to Groq and yield the answer as it is generated.
 
     Args:
         question: The user's natural language question.
         context:  Relevant financial data as a formatted string.
 
-    Returns:
-        The model's answer as a plain string.
+    Identical (context, question) pairs are answered from a short-lived cache
+    when CACHE_ENABLED is set; a cached answer is yielded as a single fragment.
+
+    Yields:
+        Answer text fragments in order (empty deltas are skipped).
     """
+    key = _answer_key(question, context) if settings.CACHE_ENABLED else None
+    if key is not None:
+        cached = _answer_cache.get(key)
+        if cached is not None:
+            yield cached
+            return
+
     client = get_client()
-    completion = client.chat.completions.create(
+    stream = client.chat.completions.create(
         model=settings.GROQ_MODEL,
         messages=[
             {"role": "system", "content": build_system_prompt(context)},
@@ -55,5 +119,30 @@ def answer_question(question: str, context: str) -> str:
         ],
         max_tokens=settings.GROQ_MAX_TOKENS,
         temperature=0.2,
+        stream=True,
     )
-    return completion.choices[0].message.content
+    parts = []
+    for chunk in stream:
+        if not chunk.choices:
+            continue
+        content = chunk.choices[0].delta.content
+        if content:
+            parts.append(content)
+            yield content
+
+    if key is not None:
+        _answer_cache.set(key, "".join(parts))
+
+
+def answer_question(question: str, context: str) -> str:
+    """
+    Send a question + financial context to Groq and return the answer.
+
+    Args:
+        question: The user's natural language question.
+        context:  Relevant financial data as a formatted string.
+
+    Returns:
+        The model's answer as a plain string.
+    """
+    return "".join(answer_question_stream(question, context))
@@ -0,0 +1,85 @@
+"""
+FINCENTER Query Result Cache
+
+Small thread-safe LRU cache with per-entry expiry, used to avoid re-running
+the same Neo4j read queries on every chat turn or dashboard refresh.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from functools import wraps
+from typing import Any, Hashable
+
+from src.config import settings
+
+# Default number of cached results per cache
+DEFAULT_MAXSIZE = 128
+
+# Default seconds a cached result stays valid
+DEFAULT_TTL_SECONDS = 30.0
+
+_MISSING = object()
+
+
+class TTLCache:
+    """LRU cache whose entries expire ttl seconds after being stored."""
+
+    def __init__(self, maxsize: int = DEFAULT_MAXSIZE, ttl: float = DEFAULT_TTL_SECONDS):
+        """
+        Args:
+            maxsize: Maximum number of entries kept (least recently used evicted first)
+            ttl: Seconds before an entry expires
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.RLock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value for key, or default if missing or expired."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any):
+        """Store value under key, evicting the least recently used entry if full."""
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self):
+        """Drop all entries (call after writes that change cached results)."""
+        with self._lock:
+            self._data.clear()
+
+
+def cached_query(method):
+    """
+    Cache a method's result in the instance's `_cache` TTLCache.
+
+    The key is the method name plus its arguments, which must be hashable.
+    Cached results are shared between callers and must not be mutated.
+    Disabled when CACHE_ENABLED is false, like FinancialGraph's read cache.
+    """
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if not settings.CACHE_ENABLED:
+            return method(self, *args, **kwargs)
+        key = (method.__name__, args, tuple(sorted(kwargs.items())))
+        value = self._cache.get(key, _MISSING)
+        if value is _MISSING:
+            value = method(self, *args, **kwargs)
+            self._cache.set(key, value)
+        return value
+
+    return wrapper
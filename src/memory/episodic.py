@@ -6,9 +6,41 @@ EpisodicMemory nodes. These patterns enrich the AI chat context and feed
 the decision fusion and recommendation engines.
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import List, Dict, Any, Optional
-from collections import defaultdict
+
+import numpy as np
+
+from src.memory.cache import TTLCache, cached_query
+
+
+# Average invoice must exceed the monthly contract value by this factor
+OVERBILLING_RATIO = 1.10
+
+# A budget period is overspent when actual exceeds budget by this factor
+OVERSPEND_RATIO = 1.05
+
+# Average days overdue above which a vendor is a late payment pattern
+LATE_PAYMENT_DAYS = 30
+
+# Minimum invoices or budget periods backing a pattern
+MIN_EVIDENCE = 2
+
+# Patterns included in the AI chat context
+CONTEXT_PATTERN_LIMIT = 8
+
+
+def _safe_id(subject: Any) -> str:
+    """Format a pattern subject for use in a node id (spaces become underscores)."""
+    return str(subject).replace(" ", "_")
+
+
+def _column(rows: List[Dict[str, Any]], key: str) -> np.ndarray:
+    """Extract a numeric field as a float array (missing or None -> 0)."""
+    return np.fromiter(
+        (row.get(key) or 0 for row in rows), dtype=float, count=len(rows)
+    )
 
 
 class EpisodicMemory:
@@ -20,6 +52,10 @@ class EpisodicMemory:
             graph: FinancialGraph instance
         """
         self.graph = graph
+        self._cache = TTLCache()
+        # Data fingerprint and pattern count of the last complete run
+        self._last_fingerprint: Optional[str] = None
+        self._last_count = 0
 
     # ============================================
     # Pattern Detection
@@ -29,72 +65,109 @@ class EpisodicMemory:
         """
         Run all pattern detectors and persist results to Neo4j.
 
+        Skipped (returning the previous count) when the graph data has not
+        changed since the last complete run.
+
         Returns:
             Number of patterns detected/updated
         """
+        # Rows cached up to READ_CACHE_TTL_SECONDS ago could predate the
+        # fingerprint (other processes write too), so read everything fresh
+        self.graph.clear_cache()
+        fingerprint = self._fetch("data fingerprint", self.graph.get_data_fingerprint)
+        if fingerprint is not None and fingerprint == self._last_fingerprint:
+            return self._last_count
+
+        # Aggregate server-side; only budgets (seasonal spike) come back row by row.
+        # The queries are independent graph round-trips, so run them concurrently.
+        # Each source is fetched on its own, so one failing query only
+        # leaves out the detectors that need it.
+        queries = {
+            "vendor invoice stats": lambda: self.graph.get_vendor_invoice_stats(min_amount=0),
+            "vendor contract monthly": self.graph.get_vendor_contract_monthly,
+            "department overspend stats": lambda: self.graph.get_department_overspend_stats(
+                overspend_ratio=OVERSPEND_RATIO, min_periods=MIN_EVIDENCE
+            ),
+            "vendor overdue stats": lambda: self.graph.get_vendor_overdue_stats(
+                min_invoices=MIN_EVIDENCE
+            ),
+            "budgets": self.graph.get_all_budgets_raw,
+        }
+        with ThreadPoolExecutor(max_workers=len(queries)) as executor:
+            (invoice_stats, contract_monthly, overspend_stats,
+             overdue_stats, budgets) = executor.map(self._fetch, queries, queries.values())
+
+        detectors = [
+            (self._detect_vendor_overbilling, (invoice_stats, contract_monthly)),
+            (self._detect_department_overspend, (overspend_stats,)),
+            (self._detect_late_payment_pattern, (overdue_stats,)),
+            (self._detect_seasonal_spike, (budgets,)),
+        ]
+
         patterns = []
+        complete = True
+        for detect, data in detectors:
+            if any(rows is None for rows in data):
+                complete = False
+                continue
+            try:
+                patterns += detect(*data)
+            except Exception as e:
+                print(f"Episodic memory warning: {detect.__name__} failed: {e}")
+                complete = False
+
+        # One timestamp for the whole run, bound once as a query parameter
+        last_updated = datetime.utcnow().isoformat()
         try:
-            patterns += self._detect_vendor_overbilling()
-        except Exception:
-            pass
-        try:
-            patterns += self._detect_department_overspend()
-        except Exception:
-            pass
-        try:
-            patterns += self._detect_late_payment_pattern()
-        except Exception:
-            pass
-        try:
-            patterns += self._detect_seasonal_spike()
+            self.graph.create_episodic_memory_nodes(patterns, last_updated=last_updated)
         except Exception:
-            pass
-
-        now = datetime.utcnow().isoformat()
-        for p in patterns:
-            p["last_updated"] = now
-            try:
-                self.graph.create_episodic_memory_node(p)
-            except Exception:
-                pass
+            # Retry one by one so a single bad pattern does not drop the rest
+            for pattern in patterns:
+                try:
+                    self.graph.create_episodic_memory_nodes([pattern], last_updated=last_updated)
+                except Exception as e:
+                    print(f"Episodic memory warning: could not store {pattern.get('id')}: {e}")
+                    complete = False
+        self._cache.clear()
 
+        # Only remember fully successful runs so failures are retried
+        if complete:
+            self._last_fingerprint = fingerprint
+            self._last_count = len(patterns)
         return len(patterns)
 
-    def _detect_vendor_overbilling(self) -> List[Dict[str, Any]]:
+    @staticmethod
+    def _fetch(source: str, query_fn) -> Optional[List[Dict[str, Any]]]:
+        """Run a graph query, logging and returning None if it fails."""
+        try:
+            return query_fn()
+        except Exception as e:
+            print(f"Episodic memory warning: {source} query failed: {e}")
+            return None
+
+    def _detect_vendor_overbilling(
+        self,
+        invoice_stats: List[Dict[str, Any]],
+        contract_monthly: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
         """Detect vendors whose invoices consistently exceed contract values."""
-        invoices = self.graph.get_all_invoices_raw()
-        contracts = self.graph.get_all_contracts_raw()
-
-        # Build monthly avg contract value per vendor
-        contract_monthly: Dict[str, float] = {}
-        for c in contracts:
-            vendor = c.get("vendor", "UNKNOWN")
-            annual = c.get("annual_value", 0) or 0
-            monthly = annual / 12
-            if vendor in contract_monthly:
-                contract_monthly[vendor] += monthly
-            else:
-                contract_monthly[vendor] = monthly
-
-        # Build avg invoice amount per vendor
-        vendor_invoices: Dict[str, List[float]] = defaultdict(list)
-        for inv in invoices:
-            vendor = inv.get("vendor", "UNKNOWN")
-            amount = inv.get("amount", 0) or 0
-            if amount > 0:
-                vendor_invoices[vendor].append(amount)
+        monthly_by_vendor = {
+            row["vendor"]: row.get("monthly") or 0 for row in contract_monthly
+        }
 
         patterns = []
-        for vendor, amounts in vendor_invoices.items():
-            if len(amounts) < 2:
+        for row in invoice_stats:
+            vendor = row["vendor"]
+            count = row.get("invoice_count") or 0
+            if count < MIN_EVIDENCE:
                 continue
-            avg_invoice = sum(amounts) / len(amounts)
-            monthly_contract = contract_monthly.get(vendor, 0)
-            if monthly_contract > 0 and avg_invoice > monthly_contract * 1.10:
+            avg_invoice = row.get("avg_amount") or 0
+            monthly_contract = monthly_by_vendor.get(vendor, 0)
+            if monthly_contract > 0 and avg_invoice > monthly_contract * OVERBILLING_RATIO:
                 ratio = avg_invoice / monthly_contract
-                confidence = min(0.95, 0.5 + len(amounts) * 0.05)
+                confidence = min(0.95, 0.5 + count * 0.05)
                 patterns.append({
-                    "id": f"vendor_overbilling_{vendor}".replace(" ", "_"),
+                    "id": f"vendor_overbilling_{_safe_id(vendor)}",
                     "type": "vendor_overbilling",
                     "subject": vendor,
                     "description": (
@@ -103,107 +176,85 @@ class EpisodicMemory:
                         f"by {(ratio - 1) * 100:.1f}%."
                     ),
                     "confidence": round(confidence, 2),
-                    "evidence_count": len(amounts),
+                    "evidence_count": count,
                     "acknowledged": False,
                 })
         return patterns
 
-    def _detect_department_overspend(self) -> List[Dict[str, Any]]:
+    def _detect_department_overspend(self, overspend_stats: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Detect departments that consistently overspend their budget."""
-        budgets = self.graph.get_all_budgets_raw()
-
-        dept_years: Dict[str, List[Dict]] = defaultdict(list)
-        for b in budgets:
-            dept = b.get("department", "UNKNOWN")
-            dept_years[dept].append(b)
-
         patterns = []
-        for dept, records in dept_years.items():
-            if dept == "UNKNOWN":
+        for row in overspend_stats:
+            dept = row["department"]
+            count = row.get("periods") or 0
+            if dept == "UNKNOWN" or count < MIN_EVIDENCE:
                 continue
-            overspend_years = [
-                r for r in records
-                if r.get("budget", 0) and
-                r.get("actual", 0) > r.get("budget", 0) * 1.05
-            ]
-            if len(overspend_years) >= 2:
-                avg_overrun = sum(
-                    (r["actual"] - r["budget"]) / r["budget"] * 100
-                    for r in overspend_years
-                ) / len(overspend_years)
-                confidence = min(0.95, 0.4 + len(overspend_years) * 0.15)
-                patterns.append({
-                    "id": f"dept_overspend_{dept}".replace(" ", "_"),
-                    "type": "department_overspend",
-                    "subject": dept,
-                    "description": (
-                        f"Department '{dept}' overspent by an average of {avg_overrun:.1f}% "
-                        f"across {len(overspend_years)} budget periods."
-                    ),
-                    "confidence": round(confidence, 2),
-                    "evidence_count": len(overspend_years),
-                    "acknowledged": False,
-                })
+            avg_overrun = row.get("avg_overrun_pct") or 0
+            confidence = min(0.95, 0.4 + count * 0.15)
+            patterns.append({
+                "id": f"dept_overspend_{_safe_id(dept)}",
+                "type": "department_overspend",
+                "subject": dept,
+                "description": (
+                    f"Department '{dept}' overspent by an average of {avg_overrun:.1f}% "
+                    f"across {count} budget periods."
+                ),
+                "confidence": round(confidence, 2),
+                "evidence_count": count,
+                "acknowledged": False,
+            })
         return patterns
 
-    def _detect_late_payment_pattern(self) -> List[Dict[str, Any]]:
+    def _detect_late_payment_pattern(self, overdue_stats: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Detect vendors with chronically overdue invoices."""
-        invoices = self.graph.get_all_invoices_raw()
-
-        vendor_overdue: Dict[str, List[int]] = defaultdict(list)
-        for inv in invoices:
-            if inv.get("status") == "UNPAID":
-                days = inv.get("days_overdue", 0) or 0
-                if days > 0:
-                    vendor_overdue[inv.get("vendor", "UNKNOWN")].append(days)
-
         patterns = []
-        for vendor, overdue_list in vendor_overdue.items():
-            if len(overdue_list) < 2:
+        for row in overdue_stats:
+            vendor = row["vendor"]
+            count = row.get("overdue_count") or 0
+            if count < MIN_EVIDENCE:
                 continue
-            avg_days = sum(overdue_list) / len(overdue_list)
-            if avg_days > 30:
-                confidence = min(0.90, 0.4 + len(overdue_list) * 0.05)
+            avg_days = row.get("avg_days_overdue") or 0
+            if avg_days > LATE_PAYMENT_DAYS:
+                confidence = min(0.90, 0.4 + count * 0.05)
                 patterns.append({
-                    "id": f"late_payment_{vendor}".replace(" ", "_"),
+                    "id": f"late_payment_{_safe_id(vendor)}",
                     "type": "late_payment_pattern",
                     "subject": vendor,
                     "description": (
                         f"Vendor '{vendor}' invoices are on average {avg_days:.0f} days overdue "
-                        f"across {len(overdue_list)} unpaid invoices."
+                        f"across {count} unpaid invoices."
                     ),
                     "confidence": round(confidence, 2),
-                    "evidence_count": len(overdue_list),
+                    "evidence_count": count,
                     "acknowledged": False,
                 })
         return patterns
 
-    def _detect_seasonal_spike(self) -> List[Dict[str, Any]]:
+    def _detect_seasonal_spike(self, budgets: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Detect if Q4 spending is consistently highest."""
-        budgets = self.graph.get_all_budgets_raw()
-
         if not budgets:
             return []
 
         # Use budget year as proxy — look for high-actual records
-        total_actual = sum(b.get("actual", 0) or 0 for b in budgets)
+        actual = _column(budgets, "actual")
+        total_actual = actual.sum()
         if total_actual == 0:
             return []
 
-        avg_actual = total_actual / len(budgets) if budgets else 0
-        high_spend = [b for b in budgets if (b.get("actual") or 0) > avg_actual * 1.2]
+        avg_actual = total_actual / len(budgets)
+        high_spend = int(np.count_nonzero(actual > avg_actual * 1.2))
 
-        if len(high_spend) >= 3:
+        if high_spend >= 3:
             return [{
                 "id": "seasonal_spike_q4",
                 "type": "seasonal_spike",
                 "subject": "All Departments",
                 "description": (
-                    f"Detected {len(high_spend)} budget periods with spending "
+                    f"Detected {high_spend} budget periods with spending "
                     f">20% above average, suggesting seasonal expenditure spikes."
                 ),
                 "confidence": 0.65,
-                "evidence_count": len(high_spend),
+                "evidence_count": high_spend,
                 "acknowledged": False,
             }]
         return []
@@ -212,10 +263,12 @@ class EpisodicMemory:
     # Query Interface
     # ============================================
 
+    @cached_query
     def get_patterns(self, pattern_type: Optional[str] = None) -> List[Dict[str, Any]]:
-        """Return all stored patterns, optionally filtered by type."""
+        """Return all stored patterns, optionally filtered by type (cached briefly)."""
         return self.graph.get_episodic_memories(pattern_type)
 
+    @cached_query
     def get_context_for_ai(self) -> str:
         """
         Return a text summary of top patterns for injecting into AI chat context.
@@ -223,12 +276,12 @@ class EpisodicMemory:
         Returns:
             Multi-line string describing learned patterns
         """
-        patterns = self.get_patterns()
+        patterns = self.graph.get_top_patterns(limit=CONTEXT_PATTERN_LIMIT)
         if not patterns:
             return ""
 
         lines = ["LEARNED FINANCIAL PATTERNS (Episodic Memory):"]
-        for p in patterns[:8]:
+        for p in patterns:
             lines.append(
                 f"  [{p['type'].upper()} | confidence={p['confidence']:.0%}] "
                 f"{p['description']}"
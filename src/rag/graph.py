@@ -5,9 +5,187 @@ This module handles all interactions with the Neo4j graph database,
 including creating nodes, relationships, and querying the financial knowledge graph.
 """
 
-from typing import List, Dict, Any, Optional
-from neo4j import GraphDatabase
+import copy
+import hashlib
+import inspect
+import math
+import re
+from contextlib import contextmanager
+from functools import lru_cache, wraps
+from typing import List, Dict, Any, AsyncContextManager, Callable, ContextManager, Iterator, Optional, Tuple
+import numpy as np
+from neo4j import READ_ACCESS, WRITE_ACCESS, AsyncGraphDatabase, AsyncSession, GraphDatabase, Session
 from src.config import settings
+from src.memory.cache import TTLCache
+
+# Most rows sent in one query when the server splits them into transactions
+MAX_ROWS_PER_QUERY = 100_000
+
+# Read results cached per label set (entries per cache, seconds valid)
+READ_CACHE_MAXSIZE = 512
+READ_CACHE_TTL_SECONDS = 60.0
+
+_MISSING = object()
+
+# Leading numeric portion of an amount string (handles "67100.10 EUR" etc.)
+_AMOUNT_RE = re.compile(r'[-+]?\d*\.?\d+')
+
+# Thousands separators dropped from contract value strings ("1 200,000 EUR")
+_AMOUNT_STRIP = str.maketrans('', '', ', ')
+
+# First four-digit run in a budget source file name, taken as its year
+_YEAR_RE = re.compile(r'(\d{4})')
+
+# Contract party roles that identify the vendor
+_PROVIDER_ROLES = frozenset({'PROVIDER', 'VENDOR', 'SUPPLIER'})
+
+
+def _record_dicts(result) -> List[Dict[str, Any]]:
+    """
+    Materialize a query result as one dict per record.
+
+    Zips the result keys with each record's values, which is several times
+    cheaper than dict(record) (that looks every key up by name).
+    """
+    keys = result.keys()
+    return [dict(zip(keys, record)) for record in result]
+
+
+def _record_dict(record) -> Optional[Dict[str, Any]]:
+    """Convert a single record (or None) to a dict, like _record_dicts."""
+    if record is None:
+        return None
+    return dict(zip(record.keys(), record))
+
+
+def _single_record_dict(result) -> Optional[Dict[str, Any]]:
+    """Materialize the first record of a result as a dict (None when empty)."""
+    return _record_dict(result.single())
+
+
+async def _async_record_dicts(result) -> List[Dict[str, Any]]:
+    """Async driver counterpart of _record_dicts."""
+    keys = await result.keys()
+    return [dict(zip(keys, record)) async for record in result]
+
+
+async def _async_single_record_dict(result) -> Optional[Dict[str, Any]]:
+    """Async driver counterpart of _single_record_dict."""
+    return _record_dict(await result.single())
+
+
+def _run_tx(tx, query: str, params: Dict[str, Any], transform):
+    """Transaction function: run one query and transform its result inside the transaction."""
+    return transform(tx.run(query, params))
+
+
+async def _async_run_tx(tx, query: str, params: Dict[str, Any], transform):
+    """Async counterpart of _run_tx."""
+    return await transform(await tx.run(query, params))
+
+
+def _date_part(value: Any) -> str:
+    """Return the date part of a date/datetime value, or '' when missing."""
+    return str(value).split()[0] if value else ''
+
+
+def _numeric_columns(rows: List[Dict[str, Any]], **defaults: Any) -> Dict[str, np.ndarray]:
+    """
+    Turn row dicts into one NumPy column per key.
+
+    Missing and falsy values take the key's default, whose type picks the
+    column dtype (float64 for floats, int64 for ints).
+    """
+    return {
+        key: np.fromiter(
+            ((row.get(key) or default) for row in rows),
+            dtype=np.float64 if isinstance(default, float) else np.int64,
+            count=len(rows)
+        )
+        for key, default in defaults.items()
+    }
+
+
+def _parse_amount(value: Any) -> float:
+    """Parse the leading number of an amount value, 0.0 when there is none."""
+    if value is None:
+        return 0.0
+    # Spreadsheet cells usually arrive as numbers already (NaN when empty)
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return float(value) if math.isfinite(value) else 0.0
+    return _parse_amount_text(str(value))
+
+
+@lru_cache(maxsize=1024)
+def _parse_amount_text(text: str) -> float:
+    """String path of _parse_amount, cached since amount strings repeat across quarters."""
+    m = _AMOUNT_RE.match(text.replace(',', '').strip())
+    return float(m.group()) if m else 0.0
+
+
+def _copy_result(value: Any) -> Any:
+    """Copy a cached read result so callers can mutate what they get back."""
+    if isinstance(value, (list, dict)):
+        # Deep: rows may hold nested lists/maps (collect(), map projections)
+        return copy.deepcopy(value)
+    return value
+
+
+def _cached_read(*labels: str):
+    """
+    Cache a FinancialGraph read per argument tuple.
+
+    Entries expire after READ_CACHE_TTL_SECONDS and are dropped as soon as a
+    write through FinancialGraph touches any of the given node labels (see
+    _invalidate). Disabled when CACHE_ENABLED is false.
+
+    Args:
+        labels: Node labels the query reads
+    """
+    def decorator(method):
+        def lookup(self, args, kwargs):
+            cache = self._read_cache(labels)
+            key = (method.__name__, args, tuple(sorted(kwargs.items())))
+            return cache, key, cache.get(key, _MISSING)
+
+        if inspect.iscoroutinefunction(method):
+            @wraps(method)
+            async def async_wrapper(self, *args, **kwargs):
+                if not settings.CACHE_ENABLED:
+                    return await method(self, *args, **kwargs)
+                cache, key, value = lookup(self, args, kwargs)
+                if value is _MISSING:
+                    value = await method(self, *args, **kwargs)
+                    cache.set(key, value)
+                return _copy_result(value)
+
+            return async_wrapper
+
+        @wraps(method)
+        def wrapper(self, *args, **kwargs):
+            if not settings.CACHE_ENABLED:
+                return method(self, *args, **kwargs)
+            cache, key, value = lookup(self, args, kwargs)
+            if value is _MISSING:
+                value = method(self, *args, **kwargs)
+                cache.set(key, value)
+            return _copy_result(value)
+
+        return wrapper
+
+    return decorator
+
+
+@lru_cache(maxsize=None)
+def _transactional_query(body: str, tx_clause: str) -> str:
+    """Wrap a per-row write in CALL { ... } <tx_clause>, built once per body."""
+    return f"""
+        UNWIND $rows AS row
+        CALL {{
+            WITH row
+            {body}
+        }} {tx_clause} OF $tx_rows ROWS
+        """
 
 
 class FinancialGraph:
@@ -15,19 +193,178 @@ class FinancialGraph:
     
     def __init__(self):
         """Initialize connection to Neo4j."""
-        self.driver = GraphDatabase.driver(
-            settings.NEO4J_URI,
-            auth=(settings.NEO4J_USER, settings.NEO4J_PASSWORD)
-        )
-        self._create_constraints()
+        self.driver = GraphDatabase.driver(settings.NEO4J_URI, **self._driver_config())
+        # Async driver for the API read methods, created on first use
+        self._async_driver = None
+        self._read_caches: Dict[Tuple[str, ...], TTLCache] = {}
+        self._tx_clause = None
+        # Probe once without retries: an unreachable server must not stall
+        # API or pipeline startup before their fallbacks can run
+        try:
+            self.driver.verify_connectivity()
+        except Exception as e:
+            print(f"Neo4j connectivity warning: {e}")
+        else:
+            self._create_constraints_and_indexes()
+            self._tx_clause = self._detect_batch_tx_clause()
     
+    @staticmethod
+    def _driver_config() -> Dict[str, Any]:
+        """Auth and connection pool settings shared by the sync and async drivers."""
+        return {
+            'auth': (settings.NEO4J_USER, settings.NEO4J_PASSWORD),
+            'max_connection_pool_size': settings.NEO4J_MAX_POOL_SIZE,
+            'max_connection_lifetime': settings.NEO4J_MAX_CONNECTION_LIFETIME,
+            'connection_acquisition_timeout': settings.NEO4J_CONNECTION_ACQUISITION_TIMEOUT,
+            'keep_alive': True,
+        }
+
     def close(self):
         """Close the database connection."""
         if self.driver:
             self.driver.close()
+
+    async def aclose(self):
+        """Close the async driver (if it was used) and the database connection."""
+        if self._async_driver is not None:
+            await self._async_driver.close()
+            self._async_driver = None
+        self.close()
+
+    def session(self, access_mode: str = WRITE_ACCESS) -> Session:
+        """
+        Open a session on the configured database.
+
+        Pass it as `session=` to the create_* methods to run many writes on
+        one session. Sessions are not thread-safe; use one per thread.
+
+        All sessions share the driver's bookmark manager, so a read routed
+        to a cluster reader still sees writes made through other sessions.
+
+        Args:
+            access_mode: READ_ACCESS to route to readers, WRITE_ACCESS (default)
+                to route to the leader
+
+        Examples:
+            >>> with graph.session() as session:
+            ...     for doc in documents:
+            ...         graph.create_invoice_node(doc, session=session)
+        """
+        return self.driver.session(
+            database=settings.NEO4J_DATABASE,
+            default_access_mode=access_mode,
+            bookmark_manager=self.driver.execute_query_bookmark_manager,
+            fetch_size=settings.NEO4J_FETCH_SIZE
+        )
+
+    def _read_cache(self, labels: Tuple[str, ...]) -> TTLCache:
+        """Return the read cache shared by queries over these labels."""
+        cache = self._read_caches.get(labels)
+        if cache is None:
+            cache = self._read_caches.setdefault(
+                labels, TTLCache(maxsize=READ_CACHE_MAXSIZE, ttl=READ_CACHE_TTL_SECONDS)
+            )
+        return cache
+
+    def clear_cache(self):
+        """
+        Drop all cached read results.
+
+        Writes through FinancialGraph invalidate the affected labels on
+        their own; call this after changing the graph some other way
+        (scripts, Neo4j Browser) to see the change before the TTL expires.
+        """
+        for cache in list(self._read_caches.values()):
+            cache.clear()
+
+    def _invalidate(self, *labels: str):
+        """Drop cached reads over any of the given labels (call after writes)."""
+        for cached_labels, cache in list(self._read_caches.items()):
+            if any(label in cached_labels for label in labels):
+                cache.clear()
+
+    @contextmanager
+    def _session(
+        self,
+        session: Optional[Session] = None,
+        access_mode: str = WRITE_ACCESS
+    ) -> Iterator[Session]:
+        """Yield the caller's session if given, otherwise a new one closed on exit."""
+        if session is not None:
+            yield session
+            return
+        with self.session(access_mode) as new_session:
+            yield new_session
+
+    def _read_session(self) -> ContextManager[Session]:
+        """Open a session routed to cluster readers, for read-only queries."""
+        return self._session(access_mode=READ_ACCESS)
+
+    def _async_read_session(self) -> AsyncContextManager[AsyncSession]:
+        """
+        Open an async-driver session routed to cluster readers.
+
+        Used by the `async def` reads so API handlers await the query
+        instead of blocking the event loop. The driver is created on first
+        use, in the running loop, so sync-only callers never open it.
+        """
+        if self._async_driver is None:
+            self._async_driver = AsyncGraphDatabase.driver(
+                settings.NEO4J_URI, **self._driver_config()
+            )
+        return self._async_driver.session(
+            database=settings.NEO4J_DATABASE,
+            default_access_mode=READ_ACCESS,
+            fetch_size=settings.NEO4J_FETCH_SIZE
+        )
     
-    def _create_constraints(self):
-        """Create uniqueness constraints on key properties."""
+
+    def _read(self, query: str, **params: Any) -> List[Dict[str, Any]]:
+        """
+        Run a read-only query and return its rows as dicts.
+
+        Uses a managed read transaction on a reader session, so the driver
+        retries it on transient errors and cluster leader changes.
+        """
+        with self._read_session() as session:
+            return session.execute_read(_run_tx, query, params, _record_dicts)
+
+    def _read_one(self, query: str, **params: Any) -> Optional[Dict[str, Any]]:
+        """Like _read, but return only the first row (None when there is none)."""
+        with self._read_session() as session:
+            return session.execute_read(_run_tx, query, params, _single_record_dict)
+
+    def run_read(self, query: str, **params: Any) -> List[Dict[str, Any]]:
+        """
+        Run an ad-hoc read-only Cypher query and return its rows as dicts.
+
+        For callers outside this class (API endpoints, RAG traversals) that
+        would otherwise open a session and convert records themselves.
+        Results are not cached.
+        """
+        return self._read(query, **params)
+
+    def run_read_one(self, query: str, **params: Any) -> Optional[Dict[str, Any]]:
+        """Like run_read, but return only the first row (None when there is none)."""
+        return self._read_one(query, **params)
+
+    async def _aread(self, query: str, **params: Any) -> List[Dict[str, Any]]:
+        """Async driver counterpart of _read."""
+        async with self._async_read_session() as session:
+            return await session.execute_read(_async_run_tx, query, params, _async_record_dicts)
+
+    async def _aread_one(self, query: str, **params: Any) -> Optional[Dict[str, Any]]:
+        """Async driver counterpart of _read_one."""
+        async with self._async_read_session() as session:
+            return await session.execute_read(_async_run_tx, query, params, _async_single_record_dict)
+
+    def _write(self, query: str, **params: Any):
+        """Run a single write query as a managed (retried) write transaction."""
+        with self._session() as session:
+            session.execute_write(_run_tx, query, params, lambda result: result.consume())
+
+    def _create_constraints_and_indexes(self):
+        """Create uniqueness constraints on key properties and indexes on lookup properties."""
         constraints = [
             "CREATE CONSTRAINT IF NOT EXISTS FOR (c:Contract) REQUIRE c.id IS UNIQUE",
             "CREATE CONSTRAINT IF NOT EXISTS FOR (i:Invoice) REQUIRE i.id IS UNIQUE",
@@ -40,18 +377,81 @@ class FinancialGraph:
             "CREATE CONSTRAINT IF NOT EXISTS FOR (s:Scenario) REQUIRE s.id IS UNIQUE",
             "CREATE CONSTRAINT IF NOT EXISTS FOR (p:Prediction) REQUIRE p.id IS UNIQUE",
         ]
+
+        # Properties matched, filtered or range-scanned on by the queries
+        # (the Budget composite backs the MERGE key in create_budget_nodes)
+        indexes = [
+            "CREATE INDEX IF NOT EXISTS FOR (i:Invoice) ON (i.vendor)",
+            "CREATE INDEX IF NOT EXISTS FOR (i:Invoice) ON (i.status)",
+            "CREATE INDEX IF NOT EXISTS FOR (i:Invoice) ON (i.status, i.due_date)",
+            "CREATE INDEX IF NOT EXISTS FOR (c:Contract) ON (c.end_date)",
+            "CREATE INDEX IF NOT EXISTS FOR (c:Contract) ON (c.vendor)",
+            "CREATE INDEX IF NOT EXISTS FOR (b:Budget) ON (b.department)",
+            "CREATE INDEX IF NOT EXISTS FOR (b:Budget) ON (b.year)",
+            "CREATE INDEX IF NOT EXISTS FOR (b:Budget) ON (b.department, b.year, b.category)",
+            "CREATE INDEX IF NOT EXISTS FOR (cl:Clause) ON (cl.type)",
+            "CREATE INDEX IF NOT EXISTS FOR (m:EpisodicMemory) ON (m.type)",
+            "CREATE INDEX IF NOT EXISTS FOR (w:WeakSignal) ON (w.acknowledged)",
+            "CREATE INDEX IF NOT EXISTS FOR (r:Recommendation) ON (r.priority_score)",
+            "CREATE INDEX IF NOT EXISTS FOR (p:Prediction) ON (p.entity_type)",
+        ]
         
-        with self.driver.session() as session:
-            for constraint in constraints:
+        statements = constraints + indexes
+        with self._session() as session:
+            # All statements are idempotent, so commit them together in one
+            # transaction; only if that fails, retry one by one to find and
+            # skip the offending statement
+            try:
+                with session.begin_transaction() as tx:
+                    for statement in statements:
+                        tx.run(statement)
+                    tx.commit()
+                return
+            except Exception:
+                pass
+
+            for statement in statements:
                 try:
-                    session.run(constraint)
+                    session.run(statement).consume()
                 except Exception as e:
                     print(f"Constraint creation warning: {e}")
     
+    def _detect_batch_tx_clause(self) -> Optional[str]:
+        """
+        Pick how the server can split large UNWIND writes into transactions.
+
+        Returns:
+            "IN CONCURRENT TRANSACTIONS" (Neo4j 5.21+), "IN TRANSACTIONS" (4.4+),
+            or None when batches must be sent as separate queries
+        """
+        query = """
+        CALL dbms.components() YIELD name, versions
+        WHERE name = 'Neo4j Kernel'
+        RETURN versions[0] AS version
+        """
+        # Auto-commit query: a managed read would be retried for up to 30s
+        try:
+            with self._read_session() as session:
+                record = session.run(query).single()
+        except Exception as e:
+            print(f"Server version check warning: {e}")
+            return None
+
+        parts = re.findall(r"\d+", record["version"] if record else "")
+        if len(parts) < 2:
+            return None
+        version = (int(parts[0]), int(parts[1]))
+        if version >= (5, 21):
+            return "IN CONCURRENT TRANSACTIONS"
+        if version >= (4, 4):
+            return "IN TRANSACTIONS"
+        return None
+
     # ============================================
     # Budget Operations
     # ============================================
     
+    @_cached_read("Budget")
     async def get_budget_variance(self, department: str) -> Optional[Dict[str, Any]]:
         """
         Get budget variance for a department.
@@ -71,14 +471,9 @@ class FinancialGraph:
                (b.actual - b.budget) / b.budget * 100 AS variance_percent
         """
         
-        with self.driver.session() as session:
-            result = session.run(query, department=department)
-            record = result.single()
-            
-            if record:
-                return dict(record)
-            return None
+        return await self._aread_one(query, department=department)
     
+    @_cached_read("Budget")
     async def get_budget_summary(self, year: int) -> List[Dict[str, Any]]:
         """
         Get budget summary for all departments in a year.
@@ -102,14 +497,13 @@ class FinancialGraph:
         ORDER BY department
         """
         
-        with self.driver.session() as session:
-            result = session.run(query, year=year)
-            return [dict(record) for record in result]
+        return await self._aread(query, year=year)
     
     # ============================================
     # Invoice Operations
     # ============================================
     
+    @_cached_read("Invoice")
     async def get_overdue_invoices(self, days_overdue: int = 0) -> List[Dict[str, Any]]:
         """
         Get all overdue invoices.
@@ -121,12 +515,12 @@ class FinancialGraph:
             List of overdue invoices
         """
         query = """
+        WITH date() AS today
         MATCH (i:Invoice)
         WHERE i.status = 'UNPAID'
-          AND i.due_date IS NOT NULL
-          AND i.due_date < date()
-          AND duration.inDays(i.due_date, date()).days >= $days
-        WITH i, duration.inDays(i.due_date, date()).days AS raw_days
+          AND i.due_date < today
+          AND i.due_date <= today - duration({days: $days})
+        WITH i, duration.inDays(i.due_date, today).days AS raw_days
         RETURN i.id AS invoice_id,
                toString(i.date) AS date,
                i.vendor AS vendor,
@@ -136,10 +530,9 @@ class FinancialGraph:
         ORDER BY days_overdue DESC
         """
 
-        with self.driver.session() as session:
-            result = session.run(query, days=days_overdue)
-            return [dict(record) for record in result]
+        return await self._aread(query, days=days_overdue)
     
+    @_cached_read("Invoice")
     async def get_invoice(self, invoice_id: str) -> Optional[Dict[str, Any]]:
         """
         Get details for a specific invoice.
@@ -159,18 +552,13 @@ class FinancialGraph:
                i.status AS status
         """
         
-        with self.driver.session() as session:
-            result = session.run(query, invoice_id=invoice_id)
-            record = result.single()
-            
-            if record:
-                return dict(record)
-            return None
+        return await self._aread_one(query, invoice_id=invoice_id)
     
     # ============================================
     # Contract Operations
     # ============================================
     
+    @_cached_read("Contract")
     async def get_expiring_contracts(self, days_ahead: int = 90) -> List[Dict[str, Any]]:
         """
         Get contracts expiring within specified days.
@@ -182,23 +570,22 @@ class FinancialGraph:
             List of expiring contracts
         """
         query = """
+        WITH date() AS today
         MATCH (c:Contract)
-        WHERE c.end_date IS NOT NULL
-          AND c.end_date > date()
-          AND c.end_date <= date() + duration({days: $days})
+        WHERE c.end_date > today
+          AND c.end_date <= today + duration({days: $days})
         RETURN c.id AS contract_id,
                c.vendor AS vendor,
                toString(c.end_date) AS end_date,
                c.annual_value AS annual_value,
                c.auto_renewal AS auto_renewal,
-               duration.inDays(date(), c.end_date).days AS days_until_expiry
+               duration.inDays(today, c.end_date).days AS days_until_expiry
         ORDER BY days_until_expiry
         """
         
-        with self.driver.session() as session:
-            result = session.run(query, days=days_ahead)
-            return [dict(record) for record in result]
+        return await self._aread(query, days=days_ahead)
     
+    @_cached_read("Contract", "Clause")
     async def search_contracts_by_clause(self, clause_type: str) -> List[Dict[str, Any]]:
         """
         Find contracts with specific clause type.
@@ -216,14 +603,13 @@ class FinancialGraph:
                cl.description AS clause_description
         """
         
-        with self.driver.session() as session:
-            result = session.run(query, clause_type=clause_type)
-            return [dict(record) for record in result]
+        return await self._aread(query, clause_type=clause_type)
     
     # ============================================
     # Analytics Operations
     # ============================================
     
+    @_cached_read("Client", "Contract", "Invoice")
     async def analyze_client_payment_patterns(self, client: str) -> Optional[Dict[str, Any]]:
         """
         Analyze payment patterns for a specific client.
@@ -245,94 +631,248 @@ class FinancialGraph:
                COUNT(*) AS total_invoices
         """
         
-        with self.driver.session() as session:
-            result = session.run(query, client=client)
-            record = result.single()
-            
-            if record:
-                return dict(record)
-            return None
+        return await self._aread_one(query, client=client)
     
     # ============================================
     # Graph Creation (for ingestion)
     # ============================================
     
-    def create_invoice(self, invoice_data: Dict[str, Any]):
+    def create_invoice(self, invoice_data: Dict[str, Any], session: Optional[Session] = None):
         """Create an invoice node in the graph."""
-        # Extract just the date part from datetime strings
-        date_str = str(invoice_data['date']).split()[0] if invoice_data.get('date') else ''
-        due_date_str = str(invoice_data['due_date']).split()[0] if invoice_data.get('due_date') else ''
+        self.create_invoices([invoice_data], session=session)
 
-        query = """
-        MERGE (i:Invoice {id: $id})
-        SET i.date = CASE WHEN $date <> '' THEN date($date) ELSE null END,
-            i.due_date = CASE WHEN $due_date <> '' THEN date($due_date) ELSE null END,
-            i.vendor = $vendor,
-            i.amount = $amount,
-            i.status = $status
-        RETURN i
-        """
-
-        with self.driver.session() as session:
-            session.run(query,
-                id=invoice_data['id'],
-                date=date_str,
-                due_date=due_date_str,
-                vendor=invoice_data['vendor'],
-                amount=invoice_data['amount'],
-                status=invoice_data['status']
-            )
+    def create_invoices(
+        self,
+        invoices: List[Dict[str, Any]],
+        batch_size: int = 1000,
+        session: Optional[Session] = None
+    ):
+        """
+        Create or update many invoice nodes in batched UNWIND writes.
+
+        Args:
+            invoices: Invoice dicts with id, date, due_date, vendor, amount and status
+            batch_size: Rows per transaction
+            session: Session to run on (default: a new one)
+        """
+        rows = [self._invoice_row(invoice) for invoice in invoices]
+        self._write_invoice_rows(rows, batch_size, session)
+
+    def _write_invoice_rows(self, rows: List[Dict[str, Any]], batch_size: int, session: Optional[Session]):
+        """MERGE already-normalized invoice rows (see _invoice_row)."""
+        body = """
+        MERGE (i:Invoice {id: row.id})
+        SET i.date = CASE WHEN row.date <> '' THEN date(row.date) ELSE null END,
+            i.due_date = CASE WHEN row.due_date <> '' THEN date(row.due_date) ELSE null END,
+            i.vendor = row.vendor,
+            i.amount = row.amount,
+            i.status = row.status,
+            i.updated_at = timestamp()
+        """
+        rows = self._unique_rows(rows, 'id')
+        try:
+            self._run_in_transactions(body, rows, batch_size, session)
+        finally:
+            # Batches committed before a failure are visible too
+            self._invalidate("Invoice")
+
+    @staticmethod
+    def _invoice_row(invoice_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Normalize an invoice dict into UNWIND query parameters."""
+        return {
+            'id': invoice_data['id'],
+            'date': _date_part(invoice_data.get('date')),
+            'due_date': _date_part(invoice_data.get('due_date')),
+            'vendor': invoice_data['vendor'],
+            'amount': invoice_data['amount'],
+            'status': invoice_data['status'],
+        }
     
-    def create_contract(self, contract_data: Dict[str, Any]):
+    def create_contract(self, contract_data: Dict[str, Any], session: Optional[Session] = None):
         """Create a contract node in the graph."""
-        # Extract just the date part from datetime strings
-        start_date_str = str(contract_data['start_date']).split()[0] if contract_data.get('start_date') else ''
-        end_date_str = str(contract_data['end_date']).split()[0] if contract_data.get('end_date') else ''
+        self.create_contracts([contract_data], session=session)
 
-        query = """
-        MERGE (c:Contract {id: $id})
-        SET c.type = $type,
-            c.vendor = $vendor,
-            c.start_date = CASE WHEN $start_date <> '' THEN date($start_date) ELSE null END,
-            c.end_date = CASE WHEN $end_date <> '' THEN date($end_date) ELSE null END,
-            c.annual_value = $annual_value,
-            c.auto_renewal = $auto_renewal
-        RETURN c
-        """
-
-        with self.driver.session() as session:
-            session.run(query,
-                id=contract_data['id'],
-                type=contract_data['type'],
-                vendor=contract_data['vendor'],
-                start_date=start_date_str,
-                end_date=end_date_str,
-                annual_value=contract_data['annual_value'],
-                auto_renewal=contract_data['auto_renewal']
-            )
+    def create_contracts(
+        self,
+        contracts: List[Dict[str, Any]],
+        batch_size: int = 1000,
+        session: Optional[Session] = None
+    ):
+        """
+        Create or update many contract nodes in batched UNWIND writes.
+
+        Args:
+            contracts: Contract dicts with id, type, vendor, start_date, end_date,
+                annual_value and auto_renewal
+            batch_size: Rows per transaction
+            session: Session to run on (default: a new one)
+        """
+        rows = [self._contract_row(contract) for contract in contracts]
+        self._write_contract_rows(rows, batch_size, session)
+
+    def _write_contract_rows(self, rows: List[Dict[str, Any]], batch_size: int, session: Optional[Session]):
+        """MERGE already-normalized contract rows (see _contract_row)."""
+        body = """
+        MERGE (c:Contract {id: row.id})
+        SET c.type = row.type,
+            c.vendor = row.vendor,
+            c.start_date = CASE WHEN row.start_date <> '' THEN date(row.start_date) ELSE null END,
+            c.end_date = CASE WHEN row.end_date <> '' THEN date(row.end_date) ELSE null END,
+            c.annual_value = row.annual_value,
+            c.auto_renewal = row.auto_renewal,
+            c.updated_at = timestamp()
+        """
+        rows = self._unique_rows(rows, 'id')
+        try:
+            self._run_in_transactions(body, rows, batch_size, session)
+        finally:
+            # Batches committed before a failure are visible too
+            self._invalidate("Contract")
+
+    @staticmethod
+    def _contract_row(contract_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Normalize a contract dict into UNWIND query parameters."""
+        return {
+            'id': contract_data['id'],
+            'type': contract_data['type'],
+            'vendor': contract_data['vendor'],
+            'start_date': _date_part(contract_data.get('start_date')),
+            'end_date': _date_part(contract_data.get('end_date')),
+            'annual_value': contract_data['annual_value'],
+            'auto_renewal': contract_data['auto_renewal'],
+        }
     
-    def link_contract_to_invoice(self, contract_id: str, invoice_id: str):
+    def link_contract_to_invoice(self, contract_id: str, invoice_id: str, session: Optional[Session] = None):
         """Create relationship between contract and invoice."""
+        self.link_contracts_to_invoices([(contract_id, invoice_id)], session=session)
+
+    def link_contracts_to_invoices(
+        self,
+        pairs: List[Tuple[str, str]],
+        batch_size: int = 1000,
+        session: Optional[Session] = None
+    ):
+        """
+        Create GENERATES relationships for many (contract_id, invoice_id) pairs.
+
+        Args:
+            pairs: (contract_id, invoice_id) tuples
+            batch_size: Rows sent per query
+            session: Session to run on (default: a new one)
+        """
         query = """
-        MATCH (c:Contract {id: $contract_id})
-        MATCH (i:Invoice {id: $invoice_id})
+        UNWIND $rows AS row
+        MATCH (c:Contract {id: row.contract_id})
+        MATCH (i:Invoice {id: row.invoice_id})
         MERGE (c)-[:GENERATES]->(i)
         """
+        rows = [
+            {'contract_id': contract_id, 'invoice_id': invoice_id}
+            for contract_id, invoice_id in pairs
+        ]
+        self._run_batched(query, rows, batch_size, session)
+        self._invalidate("Contract", "Invoice")
+
+    def _run_batched(
+        self,
+        query: str,
+        rows: List[Dict[str, Any]],
+        batch_size: int,
+        session: Optional[Session] = None,
+        **params
+    ):
+        """
+        Run an UNWIND $rows query once per batch_size rows on one session.
+
+        Each result is consumed before the next batch is sent, so a failing
+        batch raises from its own call instead of from the next query on the
+        shared session (or not at all when it is the last one).
+        """
+        if not rows:
+            return
+
+        with self._session(session) as session:
+            for i in range(0, len(rows), batch_size):
+                session.run(query, rows=rows[i:i + batch_size], **params).consume()
+
+    def _run_in_transactions(
+        self,
+        body: str,
+        rows: List[Dict[str, Any]],
+        batch_size: int,
+        session: Optional[Session] = None
+    ):
+        """
+        Apply a per-row write to many rows, batch_size rows per transaction.
+
+        When the server supports it, the rows are sent in one query and
+        wrapped in CALL { ... } IN [CONCURRENT] TRANSACTIONS, so Neo4j commits
+        (and on 5.21+ runs) the batches itself. That requires an auto-commit
+        transaction, which session.run provides. Rows must not repeat a MERGE
+        key, since concurrent batches would race to create it.
+
+        Args:
+            body: Cypher applied to each `row`
+            rows: Row parameter dicts
+            batch_size: Rows per transaction
+            session: Session to run on (default: a new one)
+        """
+        tx_clause = getattr(self, "_tx_clause", None)
+        if tx_clause is None:
+            self._run_batched(f"UNWIND $rows AS row {body}", rows, batch_size, session)
+            return
+
+        query = _transactional_query(body, tx_clause)
+        self._run_batched(query, rows, MAX_ROWS_PER_QUERY, session, tx_rows=batch_size)
 
-        with self.driver.session() as session:
-            session.run(query, contract_id=contract_id, invoice_id=invoice_id)
+    @staticmethod
+    def _unique_rows(rows: List[Dict[str, Any]], *key_fields: str) -> List[Dict[str, Any]]:
+        """Drop rows repeating a MERGE key, keeping the last (as sequential MERGEs would)."""
+        unique = {tuple(row[f] for f in key_fields): row for row in rows}
+        return list(unique.values())
 
     # ============================================
     # Node Creation Methods (called by ingestion pipeline)
     # ============================================
 
-    def create_invoice_node(self, document: Dict[str, Any]):
+    def create_invoice_node(self, document: Dict[str, Any], session: Optional[Session] = None):
         """
         Create invoice node from ingestion pipeline document.
 
         Args:
             document: Parsed invoice document with metadata
+            session: Session to run on (default: a new one)
         """
+        failures = self.create_invoice_nodes([document], session=session)
+        if failures:
+            raise failures[0][1]
+
+    def create_invoice_nodes(
+        self,
+        documents: List[Dict[str, Any]],
+        batch_size: int = 1000,
+        session: Optional[Session] = None
+    ) -> List[Tuple[int, Exception]]:
+        """
+        Create invoice nodes for many ingestion pipeline documents in batched writes.
+
+        A malformed document only loses itself (see _write_documents).
+
+        Args:
+            documents: Parsed invoice documents with metadata
+            batch_size: Rows sent per query
+            session: Session to run on (default: a new one)
+
+        Returns:
+            (index into documents, error) for each document that was not written
+        """
+        return self._write_documents(
+            documents, self._invoice_document_row, self._write_invoice_rows, batch_size, session
+        )
+
+    @staticmethod
+    def _invoice_document_row(document: Dict[str, Any]) -> Dict[str, Any]:
+        """Normalize an ingestion pipeline invoice document into UNWIND query parameters."""
         # Check if data is nested or at top level
         data = document.get('data', document)
 
@@ -340,23 +880,107 @@ class FinancialGraph:
         vendor = data.get('vendor', {})
         vendor_name = vendor.get('name', 'UNKNOWN') if isinstance(vendor, dict) else str(vendor)
 
-        invoice_data = {
+        return {
             'id': data.get('invoice_id', 'UNKNOWN'),
-            'date': str(data.get('date', '')),
-            'due_date': str(data.get('due_date', '')),
+            'date': _date_part(data.get('date')),
+            'due_date': _date_part(data.get('due_date')),
             'vendor': vendor_name,
             'amount': float(data.get('total_ttc', 0)),
             'status': data.get('status', 'UNPAID')
         }
-        self.create_invoice(invoice_data)
 
-    def create_contract_node(self, document: Dict[str, Any]):
+    def create_contract_node(self, document: Dict[str, Any], session: Optional[Session] = None):
         """
         Create contract node from ingestion pipeline document.
 
         Args:
             document: Parsed contract document with metadata
+            session: Session to run on (default: a new one)
         """
+        failures = self.create_contract_nodes([document], session=session)
+        if failures:
+            raise failures[0][1]
+
+    def create_contract_nodes(
+        self,
+        documents: List[Dict[str, Any]],
+        batch_size: int = 1000,
+        session: Optional[Session] = None
+    ) -> List[Tuple[int, Exception]]:
+        """
+        Create contract nodes for many ingestion pipeline documents in batched writes.
+
+        A malformed document only loses itself (see _write_documents).
+
+        Args:
+            documents: Parsed contract documents with metadata
+            batch_size: Rows sent per query
+            session: Session to run on (default: a new one)
+
+        Returns:
+            (index into documents, error) for each document that was not written
+        """
+        return self._write_documents(
+            documents, self._contract_document_row, self._write_contract_rows, batch_size, session
+        )
+
+    def _write_documents(
+        self,
+        documents: List[Dict[str, Any]],
+        to_row: Callable[[Dict[str, Any]], Dict[str, Any]],
+        write_rows: Callable[[List[Dict[str, Any]], int, Session], None],
+        batch_size: int,
+        session: Optional[Session] = None
+    ) -> List[Tuple[int, Exception]]:
+        """
+        Normalize and write pipeline documents, isolating the ones that fail.
+
+        Each document is normalized on its own, so one that cannot be (e.g.
+        total_ttc is None) is reported and skipped. The rest are written
+        batch_size rows at a time; when a batch is rejected by the server
+        (e.g. an unparseable date), its rows are retried one by one so only
+        the offending rows are lost.
+
+        Args:
+            documents: Parsed pipeline documents
+            to_row: Document -> UNWIND row normalizer
+            write_rows: Writer for a list of normalized rows
+            batch_size: Rows sent per query
+            session: Session to run on (default: a new one)
+
+        Returns:
+            (index into documents, error) for each document that was not
+            written, in document order
+        """
+        failures = []
+        rows = []
+        indexes = []
+        for index, document in enumerate(documents):
+            try:
+                rows.append(to_row(document))
+            except Exception as e:
+                failures.append((index, e))
+            else:
+                indexes.append(index)
+
+        with self._session(session) as session:
+            for start in range(0, len(rows), batch_size):
+                batch = rows[start:start + batch_size]
+                try:
+                    write_rows(batch, batch_size, session)
+                except Exception:
+                    for row, index in zip(batch, indexes[start:start + batch_size]):
+                        try:
+                            write_rows([row], batch_size, session)
+                        except Exception as e:
+                            failures.append((index, e))
+
+        failures.sort(key=lambda failure: failure[0])
+        return failures
+
+    @staticmethod
+    def _contract_document_row(document: Dict[str, Any]) -> Dict[str, Any]:
+        """Normalize an ingestion pipeline contract document into UNWIND query parameters."""
         # Check if data is nested or at top level
         data = document.get('data', document)
 
@@ -365,12 +989,13 @@ class FinancialGraph:
         parties = data.get('parties', [])
         if isinstance(parties, list) and len(parties) > 0:
             # Find the provider party
-            for party in parties:
-                if isinstance(party, dict):
-                    role = party.get('role', '').upper()
-                    if role in ['PROVIDER', 'VENDOR', 'SUPPLIER']:
-                        vendor_name = party.get('name', 'UNKNOWN')
-                        break
+            vendor_name = next(
+                (
+                    party.get('name', 'UNKNOWN') for party in parties
+                    if isinstance(party, dict) and party.get('role', '').upper() in _PROVIDER_ROLES
+                ),
+                'UNKNOWN'
+            )
             # If no provider found, use first party
             if vendor_name == 'UNKNOWN' and isinstance(parties[0], dict):
                 vendor_name = parties[0].get('name', 'UNKNOWN')
@@ -382,22 +1007,21 @@ class FinancialGraph:
         annual_value = data.get('annual_value', data.get('amount', 0))
         # Parse string amounts
         if isinstance(annual_value, str):
-            annual_value = annual_value.replace(',', '').replace(' ', '').replace('EUR', '')
+            annual_value = annual_value.translate(_AMOUNT_STRIP).replace('EUR', '')
             try:
                 annual_value = float(annual_value)
             except ValueError:
                 annual_value = 0
 
-        contract_data = {
+        return {
             'id': data.get('contract_id', 'UNKNOWN'),
             'type': data.get('type', data.get('category', 'SERVICE')),
             'vendor': vendor_name,
-            'start_date': str(data.get('start_date', '')),
-            'end_date': str(data.get('end_date', '')),
+            'start_date': _date_part(data.get('start_date')),
+            'end_date': _date_part(data.get('end_date')),
             'annual_value': float(annual_value) if annual_value else 0,
             'auto_renewal': data.get('auto_renewal', data.get('auto_renew', False))
         }
-        self.create_contract(contract_data)
 
     # ============================================
     # EpisodicMemory Node Operations
@@ -405,21 +1029,71 @@ class FinancialGraph:
 
     def create_episodic_memory_node(self, pattern_data: Dict[str, Any]):
         """Create or update an EpisodicMemory node."""
+        self.create_episodic_memory_nodes([pattern_data])
+
+    def create_episodic_memory_nodes(
+        self,
+        patterns: List[Dict[str, Any]],
+        batch_size: int = 1000,
+        last_updated: Optional[str] = None
+    ):
+        """
+        Create or update many EpisodicMemory nodes with one UNWIND query per batch.
+
+        Args:
+            patterns: Pattern dicts with id, type, subject, description,
+                confidence, evidence_count and optionally last_updated
+            batch_size: Rows sent per query
+            last_updated: Timestamp for patterns without their own last_updated
+        """
         query = """
-        MERGE (m:EpisodicMemory {id: $id})
-        SET m.type = $type,
-            m.subject = $subject,
-            m.description = $description,
-            m.confidence = $confidence,
-            m.evidence_count = $evidence_count,
-            m.last_updated = $last_updated
-        RETURN m
-        """
-        with self.driver.session() as session:
-            session.run(query, **pattern_data)
+        UNWIND $rows AS row
+        MERGE (m:EpisodicMemory {id: row.id})
+        SET m.type = row.type,
+            m.subject = row.subject,
+            m.description = row.description,
+            m.confidence = row.confidence,
+            m.evidence_count = row.evidence_count,
+            m.last_updated = coalesce(row.last_updated, $last_updated)
+        """
+        self._run_batched(query, patterns, batch_size, last_updated=last_updated)
+        self._invalidate("EpisodicMemory")
 
+    @_cached_read("EpisodicMemory")
     def get_episodic_memories(self, pattern_type: Optional[str] = None) -> List[Dict[str, Any]]:
         """Return stored episodic memory patterns."""
+        # Two constant queries rather than "$type IS NULL OR m.type = $type",
+        # so the typed one can seek the EpisodicMemory.type index
+        if pattern_type:
+            query = """
+            MATCH (m:EpisodicMemory {type: $type})
+            RETURN m.id AS id, m.type AS type, m.subject AS subject,
+                   m.description AS description, m.confidence AS confidence,
+                   m.evidence_count AS evidence_count, m.last_updated AS last_updated
+            ORDER BY m.confidence DESC
+            """
+        else:
+            query = """
+            MATCH (m:EpisodicMemory)
+            RETURN m.id AS id, m.type AS type, m.subject AS subject,
+                   m.description AS description, m.confidence AS confidence,
+                   m.evidence_count AS evidence_count, m.last_updated AS last_updated
+            ORDER BY m.confidence DESC
+            """
+        return self._read(query, type=pattern_type)
+
+    def get_top_patterns(self, limit: int = 8, pattern_type: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Return the highest-confidence episodic memory patterns.
+
+        Args:
+            limit: Maximum number of patterns returned
+            pattern_type: Only return patterns of this type
+
+        Returns:
+            Pattern rows ordered by confidence, as in get_episodic_memories
+        """
+        # Split like get_episodic_memories so the typed query uses the index
         if pattern_type:
             query = """
             MATCH (m:EpisodicMemory {type: $type})
@@ -427,10 +1101,8 @@ class FinancialGraph:
                    m.description AS description, m.confidence AS confidence,
                    m.evidence_count AS evidence_count, m.last_updated AS last_updated
             ORDER BY m.confidence DESC
+            LIMIT $limit
             """
-            with self.driver.session() as session:
-                result = session.run(query, type=pattern_type)
-                return [dict(r) for r in result]
         else:
             query = """
             MATCH (m:EpisodicMemory)
@@ -438,10 +1110,9 @@ class FinancialGraph:
                    m.description AS description, m.confidence AS confidence,
                    m.evidence_count AS evidence_count, m.last_updated AS last_updated
             ORDER BY m.confidence DESC
+            LIMIT $limit
             """
-            with self.driver.session() as session:
-                result = session.run(query)
-                return [dict(r) for r in result]
+        return self._read(query, type=pattern_type, limit=limit)
 
     # ============================================
     # WeakSignal Node Operations
@@ -457,9 +1128,10 @@ class FinancialGraph:
             w.acknowledged = $acknowledged
         RETURN w
         """
-        with self.driver.session() as session:
-            session.run(query, **signal_data)
+        self._write(query, **signal_data)
+        self._invalidate("WeakSignal")
 
+    @_cached_read("WeakSignal")
     def get_weak_signals(self, only_active: bool = True) -> List[Dict[str, Any]]:
         """Return active weak signal clusters."""
         query = """
@@ -469,9 +1141,7 @@ class FinancialGraph:
                w.detected_at AS detected_at, w.acknowledged AS acknowledged
         ORDER BY w.score DESC
         """
-        with self.driver.session() as session:
-            result = session.run(query, only_active=only_active)
-            return [dict(r) for r in result]
+        return self._read(query, only_active=only_active)
 
     # ============================================
     # Recommendation Node Operations
@@ -492,9 +1162,10 @@ class FinancialGraph:
             r.acknowledged = $acknowledged
         RETURN r
         """
-        with self.driver.session() as session:
-            session.run(query, **rec_data)
+        self._write(query, **rec_data)
+        self._invalidate("Recommendation")
 
+    @_cached_read("Recommendation")
     def get_recommendations(self, limit: int = 20) -> List[Dict[str, Any]]:
         """Return top recommendations sorted by priority."""
         query = """
@@ -507,15 +1178,13 @@ class FinancialGraph:
         ORDER BY r.priority_score DESC
         LIMIT $limit
         """
-        with self.driver.session() as session:
-            result = session.run(query, limit=limit)
-            return [dict(r) for r in result]
+        return self._read(query, limit=limit)
 
     def acknowledge_recommendation(self, rec_id: str):
         """Mark a recommendation as acknowledged."""
         query = "MATCH (r:Recommendation {id: $id}) SET r.acknowledged = true"
-        with self.driver.session() as session:
-            session.run(query, id=rec_id)
+        self._write(query, id=rec_id)
+        self._invalidate("Recommendation")
 
     # ============================================
     # Prediction Node Operations (Feedback Loop)
@@ -535,11 +1204,14 @@ class FinancialGraph:
             p.reindexed = $reindexed
         RETURN p
         """
-        with self.driver.session() as session:
-            session.run(query, **pred_data)
+        self._write(query, **pred_data)
+        self._invalidate("Prediction")
 
+    @_cached_read("Prediction")
     def get_predictions(self, entity_type: Optional[str] = None) -> List[Dict[str, Any]]:
         """Return prediction records."""
+        # Split like get_episodic_memories so the typed query uses the
+        # Prediction.entity_type index
         if entity_type:
             query = """
             MATCH (p:Prediction {entity_type: $entity_type})
@@ -549,9 +1221,6 @@ class FinancialGraph:
                    p.timestamp AS timestamp, p.reindexed AS reindexed
             ORDER BY p.timestamp DESC
             """
-            with self.driver.session() as session:
-                result = session.run(query, entity_type=entity_type)
-                return [dict(r) for r in result]
         else:
             query = """
             MATCH (p:Prediction)
@@ -561,29 +1230,28 @@ class FinancialGraph:
                    p.timestamp AS timestamp, p.reindexed AS reindexed
             ORDER BY p.timestamp DESC
             """
-            with self.driver.session() as session:
-                result = session.run(query)
-                return [dict(r) for r in result]
+        return self._read(query, entity_type=entity_type)
 
     # ============================================
     # Raw Data Access Helpers (for intelligence modules)
     # ============================================
+    # These return every node; callers that only need totals or per-group
+    # figures should use the Aggregate Queries below instead.
 
+    @_cached_read("Invoice")
     def get_all_invoices_raw(self) -> List[Dict[str, Any]]:
         """Return all invoices with raw fields for analysis."""
         query = """
+        WITH date() AS today
         MATCH (i:Invoice)
-        WITH i, CASE WHEN i.due_date IS NOT NULL
-                     THEN duration.inDays(i.due_date, date()).days
-                     ELSE 0 END AS raw_days
+        WITH i, coalesce(duration.inDays(i.due_date, today).days, 0) AS raw_days
         RETURN i.id AS invoice_id, i.vendor AS vendor, i.amount AS amount,
                i.status AS status,
                CASE WHEN raw_days > 365 THEN 365 ELSE raw_days END AS days_overdue
         """
-        with self.driver.session() as session:
-            result = session.run(query)
-            return [dict(r) for r in result]
+        return self._read(query)
 
+    @_cached_read("Budget")
     def get_all_budgets_raw(self) -> List[Dict[str, Any]]:
         """Return all budget nodes for analysis."""
         query = """
@@ -591,39 +1259,312 @@ class FinancialGraph:
         RETURN b.department AS department, b.year AS year,
                b.budget AS budget, b.actual AS actual, b.variance AS variance
         """
-        with self.driver.session() as session:
-            result = session.run(query)
-            return [dict(r) for r in result]
+        return self._read(query)
 
+    @_cached_read("Contract")
     def get_all_contracts_raw(self) -> List[Dict[str, Any]]:
         """Return all contracts with days_until_expiry for analysis."""
         query = """
+        WITH date() AS today
         MATCH (c:Contract)
         RETURN c.id AS contract_id, c.vendor AS vendor,
                c.annual_value AS annual_value,
-               CASE WHEN c.end_date IS NOT NULL
-                    THEN duration.inDays(date(), c.end_date).days
-                    ELSE 999 END AS days_until_expiry
+               coalesce(duration.inDays(today, c.end_date).days, 999) AS days_until_expiry
+        """
+        return self._read(query)
+
+    def get_all_invoices_arrays(self) -> Dict[str, np.ndarray]:
+        """Return invoice amount and days_overdue as NumPy columns (see get_all_invoices_raw)."""
+        return _numeric_columns(self.get_all_invoices_raw(), amount=0.0, days_overdue=0)
+
+    def get_all_budgets_arrays(self) -> Dict[str, np.ndarray]:
+        """Return budget and actual amounts as NumPy columns (see get_all_budgets_raw)."""
+        return _numeric_columns(self.get_all_budgets_raw(), budget=0.0, actual=0.0)
+
+    def get_all_contracts_arrays(self) -> Dict[str, np.ndarray]:
+        """Return annual_value and days_until_expiry as NumPy columns (see get_all_contracts_raw)."""
+        return _numeric_columns(self.get_all_contracts_raw(), annual_value=0.0, days_until_expiry=999)
+
+    # ============================================
+    # Aggregate Queries (for intelligence modules)
+    # ============================================
+
+    def get_vendor_invoice_stats(self, min_amount: float = 0) -> List[Dict[str, Any]]:
+        """
+        Return invoice count and average amount per vendor.
+
+        Args:
+            min_amount: Only count invoices with amount strictly above this
+
+        Returns:
+            Rows with vendor, invoice_count and avg_amount, ordered by vendor
+        """
+        query = """
+        MATCH (i:Invoice)
+        WHERE i.amount > $min_amount
+        RETURN i.vendor AS vendor, count(i) AS invoice_count, avg(i.amount) AS avg_amount
+        ORDER BY vendor
+        """
+        return self._read(query, min_amount=min_amount)
+
+    def get_vendor_contract_monthly(self) -> List[Dict[str, Any]]:
+        """
+        Return the combined monthly contract value per vendor.
+
+        Returns:
+            Rows with vendor and monthly (sum of annual_value / 12)
+        """
+        query = """
+        MATCH (c:Contract)
+        RETURN c.vendor AS vendor, sum(coalesce(c.annual_value, 0)) / 12.0 AS monthly
+        """
+        return self._read(query)
+
+    def get_department_overspend_stats(
+        self,
+        overspend_ratio: float = 1.05,
+        min_periods: int = 1
+    ) -> List[Dict[str, Any]]:
+        """
+        Return overspent budget periods per department.
+
+        Args:
+            overspend_ratio: A period counts when actual > budget * overspend_ratio
+            min_periods: Only return departments with at least this many periods
+
+        Returns:
+            Rows with department, periods and avg_overrun_pct, ordered by department
+        """
+        query = """
+        MATCH (b:Budget)
+        WHERE b.budget <> 0 AND b.actual > b.budget * $overspend_ratio
+        WITH b.department AS department, count(b) AS periods,
+             avg((b.actual - b.budget) / b.budget * 100) AS avg_overrun_pct
+        WHERE periods >= $min_periods
+        RETURN department, periods, avg_overrun_pct
+        ORDER BY department
+        """
+        return self._read(query, overspend_ratio=overspend_ratio, min_periods=min_periods)
+
+    @_cached_read("Budget")
+    def get_budget_overrun_stats(self) -> List[Dict[str, Any]]:
+        """
+        Return the number of over-budget periods and the total overrun per department.
+
+        A period is over budget when actual > budget, with missing amounts
+        counted as 0. Departments with no overrun are included with zeros.
+
+        Returns:
+            Rows with department, over_periods and total_overrun, ordered by department
+        """
+        query = """
+        MATCH (b:Budget)
+        WITH b.department AS department,
+             coalesce(b.actual, 0) - coalesce(b.budget, 0) AS overrun
+        RETURN department,
+               sum(CASE WHEN overrun > 0 THEN 1 ELSE 0 END) AS over_periods,
+               sum(CASE WHEN overrun > 0 THEN overrun ELSE 0 END) AS total_overrun
+        ORDER BY department
+        """
+        return self._read(query)
+
+    @_cached_read("Budget")
+    def get_department_budget_totals(self) -> List[Dict[str, Any]]:
+        """
+        Return budget and actual totals across all years per department.
+
+        Missing amounts count as 0. A period is over budget when actual > budget.
+
+        Returns:
+            Rows with department, periods, budget, actual and periods_over,
+            ordered by department
+        """
+        query = """
+        MATCH (b:Budget)
+        WITH b.department AS department,
+             coalesce(b.budget, 0) AS budget, coalesce(b.actual, 0) AS actual
+        RETURN department,
+               count(*) AS periods,
+               sum(budget) AS budget,
+               sum(actual) AS actual,
+               sum(CASE WHEN actual > budget THEN 1 ELSE 0 END) AS periods_over
+        ORDER BY department
+        """
+        return self._read(query)
+
+    @_cached_read("Invoice")
+    def get_overdue_invoice_summary(self, limit: int = 5) -> Dict[str, Any]:
+        """
+        Return the overdue invoice count, outstanding total and most overdue invoices.
+
+        Days overdue are capped at 365, as in get_all_invoices_raw.
+
+        Args:
+            limit: Maximum number of invoices returned
+
+        Returns:
+            Dict with overdue_count, total_amount and invoices (vendor, amount,
+            days_overdue; most overdue first)
+        """
+        query = """
+        WITH date() AS today
+        MATCH (i:Invoice)
+        WITH i, coalesce(duration.inDays(i.due_date, today).days, 0) AS raw_days
+        WITH i, CASE WHEN raw_days > 365 THEN 365 ELSE raw_days END AS days_overdue
+        WHERE days_overdue > 0
+        ORDER BY days_overdue DESC
+        WITH count(i) AS overdue_count,
+             sum(coalesce(i.amount, 0)) AS total_amount,
+             collect({vendor: i.vendor, amount: coalesce(i.amount, 0),
+                      days_overdue: days_overdue}) AS invoices
+        RETURN overdue_count, total_amount, invoices[0..$limit] AS invoices
+        """
+        return self._read_one(query, limit=limit)
+
+    @_cached_read("Contract")
+    def get_contract_expiry_summary(self, within_days: int = 365, limit: int = 8) -> Dict[str, Any]:
+        """
+        Return active contract totals and the contracts expiring soonest.
+
+        Contracts without an end date count as active and not expiring, as in
+        get_all_contracts_raw.
+
+        Args:
+            within_days: Expiry window in days
+            limit: Maximum number of expiring contracts returned
+
+        Returns:
+            Dict with active_count, total_annual_value, expiring_count and
+            expiring (vendor, annual_value, days_until_expiry; soonest first)
+        """
+        query = """
+        WITH date() AS today
+        MATCH (c:Contract)
+        WITH c, coalesce(duration.inDays(today, c.end_date).days, 999) AS days_until_expiry
+        WHERE days_until_expiry >= 0
+        ORDER BY days_until_expiry
+        WITH count(c) AS active_count,
+             sum(coalesce(c.annual_value, 0)) AS total_annual_value,
+             [x IN collect({vendor: c.vendor, annual_value: coalesce(c.annual_value, 0),
+                            days_until_expiry: days_until_expiry})
+              WHERE 0 < x.days_until_expiry <= $within_days] AS expiring
+        RETURN active_count, total_annual_value,
+               size(expiring) AS expiring_count, expiring[0..$limit] AS expiring
+        """
+        return self._read_one(query, within_days=within_days, limit=limit)
+
+    def get_vendor_overdue_stats(self, min_invoices: int = 1) -> List[Dict[str, Any]]:
         """
-        with self.driver.session() as session:
-            result = session.run(query)
-            return [dict(r) for r in result]
+        Return overdue unpaid invoice count and average days overdue per vendor.
+
+        Days overdue are capped at 365, as in get_all_invoices_raw.
 
-    def create_budget_node(self, budget_item: Dict[str, Any]):
+        Args:
+            min_invoices: Only return vendors with at least this many overdue invoices
+
+        Returns:
+            Rows with vendor, overdue_count and avg_days_overdue, ordered by vendor
+        """
+        query = """
+        WITH date() AS today
+        MATCH (i:Invoice)
+        WHERE i.status = 'UNPAID' AND i.due_date IS NOT NULL
+        WITH i, duration.inDays(i.due_date, today).days AS raw_days
+        WITH i, CASE WHEN raw_days > 365 THEN 365 ELSE raw_days END AS days_overdue
+        WHERE days_overdue > 0
+        WITH i.vendor AS vendor, count(i) AS overdue_count, avg(days_overdue) AS avg_days_overdue
+        WHERE overdue_count >= $min_invoices
+        RETURN vendor, overdue_count, avg_days_overdue
+        ORDER BY vendor
+        """
+        return self._read(query, min_invoices=min_invoices)
+
+    def get_data_fingerprint(self, include_patterns: bool = False) -> str:
+        """
+        Return a cheap fingerprint of the financial data the detectors read.
+
+        Combines per-label node counts and latest updated_at stamps for
+        invoices, contracts and budgets with today's date (overdue and expiry
+        windows move daily). Equal fingerprints mean detection would see the
+        same input.
+
+        Args:
+            include_patterns: Also include the EpisodicMemory node count
+
+        Returns:
+            Hex digest identifying the current data state
+        """
+        query = """
+        OPTIONAL MATCH (i:Invoice)
+        WITH count(i) AS invoices, max(i.updated_at) AS invoices_updated
+        OPTIONAL MATCH (c:Contract)
+        WITH invoices, invoices_updated,
+             count(c) AS contracts, max(c.updated_at) AS contracts_updated
+        OPTIONAL MATCH (b:Budget)
+        WITH invoices, invoices_updated, contracts, contracts_updated,
+             count(b) AS budgets, max(b.updated_at) AS budgets_updated
+        OPTIONAL MATCH (m:EpisodicMemory)
+        RETURN invoices, invoices_updated, contracts, contracts_updated,
+               budgets, budgets_updated, count(m) AS patterns,
+               toString(date()) AS today
+        """
+        record = self._read_one(query)
+
+        if not include_patterns:
+            record.pop("patterns")
+        state = repr(sorted(record.items())).encode("utf-8")
+        return hashlib.sha1(state).hexdigest()
+
+    def create_budget_node(self, budget_item: Dict[str, Any], session: Optional[Session] = None):
         """
         Create budget node from ingestion pipeline data.
 
         Args:
             budget_item: Budget item with department, amounts, etc.
+            session: Session to run on (default: a new one)
         """
-        query = """
-        MERGE (b:Budget {department: $department, year: $year, category: $category})
-        SET b.budget = $budget,
-            b.actual = $actual,
-            b.variance = $variance
-        RETURN b
+        self.create_budget_nodes([budget_item], session=session)
+
+    def create_budget_nodes(
+        self,
+        budget_items: List[Dict[str, Any]],
+        batch_size: int = 1000,
+        session: Optional[Session] = None
+    ):
+        """
+        Create budget nodes for many rows in batched UNWIND writes.
+
+        Args:
+            budget_items: Budget items with department, amounts, etc.
+            batch_size: Rows per transaction
+            session: Session to run on (default: a new one)
+        """
+        body = """
+        MERGE (b:Budget {department: row.department, year: row.year, category: row.category})
+        SET b.budget = row.budget,
+            b.actual = row.actual,
+            b.variance = row.variance,
+            b.updated_at = timestamp()
+        """
+
+        rows = self._unique_rows(
+            [self._budget_row(item) for item in budget_items],
+            'department', 'year', 'category'
+        )
+        self._run_in_transactions(body, rows, batch_size, session)
+        self._invalidate("Budget")
+
+    @staticmethod
+    def _budget_row(budget_item: Dict[str, Any]) -> Dict[str, Any]:
         """
+        Normalize a pipeline budget item into Budget node properties.
+
+        Args:
+            budget_item: Budget item with department, amounts, etc.
 
+        Returns:
+            Dictionary with department, year, category, budget, actual, variance
+        """
         # Handle French field name "département" as well as English "department"
         department = (
             budget_item.get('department')
@@ -632,15 +1573,6 @@ class FinancialGraph:
         )
 
         # Calculate actual from quarterly values if not provided directly
-        def _parse_amount(v) -> float:
-            if v is None:
-                return 0.0
-            import re as _re
-            s = str(v).replace(',', '').strip()
-            # Extract leading numeric portion (handles "67100.10 EUR" etc.)
-            m = _re.match(r'[-+]?\d*\.?\d+', s)
-            return float(m.group()) if m else 0.0
-
         actual = budget_item.get('actual')
         if actual is None or actual == 0:
             actual = sum(
@@ -656,17 +1588,14 @@ class FinancialGraph:
         # Infer year from source_file if not present
         year = budget_item.get('year')
         if not year:
-            src = str(budget_item.get('source_file', ''))
-            import re
-            m = re.search(r'(\d{4})', src)
+            m = _YEAR_RE.search(str(budget_item.get('source_file', '')))
             year = int(m.group(1)) if m else 2024
 
-        with self.driver.session() as session:
-            session.run(query,
-                       department=department,
-                       year=int(year),
-                       category=budget_item.get('category', 'GENERAL'),
-                       budget=budget_amount,
-                       actual=actual,
-                       variance=variance
-                       )
+        return {
+            'department': department,
+            'year': int(year),
+            'category': budget_item.get('category', 'GENERAL'),
+            'budget': budget_amount,
+            'actual': actual,
+            'variance': variance
+        }
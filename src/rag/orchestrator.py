@@ -17,7 +17,61 @@ The orchestrator:
     6. Returns both the answer and the evidence used (grounded response)
 """
 
-from typing import List, Dict, Any, Optional
+import asyncio
+import re
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import List, Dict, Any, Callable, FrozenSet, Optional, Iterator, Set, Tuple
+
+
+# Question keywords (substrings of the lowercased question) -> context topic
+TOPIC_KEYWORDS: Dict[str, Tuple[str, ...]] = {
+    "budget": ("budget", "spend", "dépense", "overspend", "variance", "department",
+               "performance", "summarize", "summary"),
+    "invoice": ("invoice", "facture", "overdue", "payment", "paiement"),
+    "vendor": ("vendor", "q1", "q2", "q3", "q4", "quarter", "biggest", "largest",
+               "top vendor", "supplier"),
+    "contract": ("contract", "contrat", "expir", "vendor", "fournisseur"),
+    "weak_signals": ("signal", "risk", "stress", "weak", "alert", "concern", "worry"),
+    "recommendations": ("recommend", "suggest", "should", "action", "reduce", "optimize",
+                        "improve", "priority", "cost", "saving", "top"),
+}
+
+
+def _build_topic_matcher() -> Tuple["re.Pattern[str]", Dict[str, FrozenSet[str]]]:
+    """
+    Compile all topic keywords into one regex.
+
+    The pattern is a lookahead, so it tests every position of the question
+    and finds overlapping keywords. Longer keywords are tried first, and
+    each keyword maps to the topics of every keyword it contains ("top
+    vendor" also counts as "vendor" and "top"). One scan therefore finds
+    the same topics as a substring test per keyword.
+    """
+    keywords = {kw for kws in TOPIC_KEYWORDS.values() for kw in kws}
+    topics = {
+        kw: frozenset(topic for topic, kws in TOPIC_KEYWORDS.items() if any(k in kw for k in kws))
+        for kw in keywords
+    }
+    alternatives = "|".join(re.escape(kw) for kw in sorted(keywords, key=len, reverse=True))
+    return re.compile(f"(?=({alternatives}))"), topics
+
+
+_TOPIC_RE, _KEYWORD_TOPICS = _build_topic_matcher()
+
+
+@lru_cache(maxsize=256)
+def question_topics(q_lower: str) -> FrozenSet[str]:
+    """
+    Return the TOPIC_KEYWORDS topics mentioned in a lowercased question.
+
+    Cached, as one chat turn routes the same question more than once
+    (context sections, weak signals, recommendations).
+    """
+    found: Set[str] = set()
+    for match in _TOPIC_RE.finditer(q_lower):
+        found |= _KEYWORD_TOPICS[match.group(1)]
+    return frozenset(found)
 
 
 class RAGOrchestrator:
@@ -29,7 +83,7 @@ class RAGOrchestrator:
     financial graph enrichment.
     """
 
-    def __init__(self, graph, vectorstore, llm_fn, memory=None, decision_fusion=None, weak_signals=None, recommendations=None):
+    def __init__(self, graph, vectorstore, llm_fn, memory=None, decision_fusion=None, weak_signals=None, recommendations=None, llm_stream_fn=None):
         """
         Args:
             graph:           FinancialGraph instance (Neo4j)
@@ -39,10 +93,12 @@ class RAGOrchestrator:
             decision_fusion: DecisionFusion instance (optional)
             weak_signals:    WeakSignalDetector instance (optional)
             recommendations: RecommendationEngine instance (optional)
+            llm_stream_fn:   Callable(question, context) -> Iterator[str] (optional)
         """
         self.graph = graph
         self.vectorstore = vectorstore
         self.llm_fn = llm_fn
+        self.llm_stream_fn = llm_stream_fn
         self.memory = memory
         self.decision_fusion = decision_fusion
         self.weak_signals = weak_signals
@@ -121,6 +177,41 @@ class RAGOrchestrator:
         Returns:
             Dict with 'answer', 'context_used', 'sources'
         """
+        full_context, sources = self._build_context_sync(question)
+        answer = self.llm_fn(question, full_context)
+
+        return {
+            "answer": answer,
+            "context_used": full_context,
+            "sources": sources,
+            "vector_hits": 0,
+        }
+
+    def query_stream(self, question: str) -> Iterator[str]:
+        """
+        Streaming version of query_sync(): build the context, then stream the answer.
+
+        The context is gathered before this returns, so graph errors surface
+        to the caller instead of interrupting the stream.
+
+        Args:
+            question: Natural language question
+
+        Returns:
+            Iterator of answer text fragments
+        """
+        full_context, _ = self._build_context_sync(question)
+        if self.llm_stream_fn is None:
+            return iter((self.llm_fn(question, full_context),))
+        return self.llm_stream_fn(question, full_context)
+
+    def _build_context_sync(self, question: str) -> Tuple[str, List[Dict[str, Any]]]:
+        """
+        Gather graph, memory and intelligence context for a question.
+
+        Returns:
+            (full context string, sources used)
+        """
         context_parts: List[str] = []
         sources: List[Dict[str, Any]] = []
 
@@ -163,8 +254,8 @@ class RAGOrchestrator:
                 pass
 
         # Weak signals — injected when relevant keywords detected
-        q_lower = question.lower()
-        if self.weak_signals and any(w in q_lower for w in ["signal", "risk", "stress", "weak", "alert", "concern", "worry"]):
+        topics = question_topics(question.lower())
+        if self.weak_signals and "weak_signals" in topics:
             try:
                 ws_ctx = self._weak_signals_context()
                 if ws_ctx:
@@ -174,7 +265,7 @@ class RAGOrchestrator:
                 pass
 
         # Recommendations — injected when relevant keywords detected
-        if self.recommendations and any(w in q_lower for w in ["recommend", "suggest", "should", "action", "reduce", "optimize", "improve", "priority", "cost", "saving", "top"]):
+        if self.recommendations and "recommendations" in topics:
             try:
                 rec_ctx = self._recommendations_context()
                 if rec_ctx:
@@ -184,14 +275,7 @@ class RAGOrchestrator:
                 pass
 
         full_context = "\n\n".join(context_parts) if context_parts else "No relevant context found."
-        answer = self.llm_fn(question, full_context)
-
-        return {
-            "answer": answer,
-            "context_used": full_context,
-            "sources": sources,
-            "vector_hits": 0,
-        }
+        return full_context, sources
 
     # ============================================
     # Always-on Financial Health Snapshot
@@ -201,22 +285,20 @@ class RAGOrchestrator:
         """Compact summary of key financial metrics — always injected into LLM context."""
         lines = ["FINANCIAL HEALTH SNAPSHOT (live data):"]
         try:
-            budgets = self.graph.get_all_budgets_raw()
-            unique_depts = set(b.get("department") for b in budgets if b.get("department"))
-            over = [b for b in budgets if (b.get("actual") or 0) > (b.get("budget") or 0)]
-            over_depts = set(b.get("department") for b in over if b.get("department"))
-            total_variance = sum((b.get("actual", 0) or 0) - (b.get("budget", 0) or 0) for b in over)
+            # One row per department, aggregated in Cypher
+            departments = self.graph.get_budget_overrun_stats()
+            named = [d for d in departments if d["department"]]
+            over_depts = [d for d in named if d["over_periods"] > 0]
+            total_variance = sum(d["total_overrun"] for d in departments)
             lines.append(
-                f"  Budgets: {len(unique_depts)} departments, "
+                f"  Budgets: {len(named)} departments, "
                 f"{len(over_depts)} with at least one year over budget "
                 f"(total overrun across all years: {total_variance:+,.0f} EUR)"
             )
             # Surface persistent overspenders explicitly for the LLM
-            dept_years_over: Dict[str, int] = {}
-            for b in over:
-                d = b.get("department", "")
-                dept_years_over[d] = dept_years_over.get(d, 0) + 1
-            persistent = [(d, y) for d, y in dept_years_over.items() if y >= 2]
+            persistent = [
+                (d["department"], d["over_periods"]) for d in departments if d["over_periods"] >= 2
+            ]
             if persistent:
                 persistent.sort(key=lambda x: -x[1])
                 lines.append(
@@ -226,16 +308,17 @@ class RAGOrchestrator:
         except Exception:
             pass
         try:
-            invoices = self.graph.get_all_invoices_raw()
-            overdue = [i for i in invoices if (i.get("days_overdue") or 0) > 0]
-            overdue_value = sum(i.get("amount", 0) or 0 for i in overdue)
-            lines.append(f"  Invoices: {len(overdue)} overdue ({overdue_value:,.0f} EUR outstanding)")
+            invoices = self.graph.get_all_invoices_arrays()
+            overdue = invoices["days_overdue"] > 0
+            overdue_value = invoices["amount"][overdue].sum()
+            lines.append(f"  Invoices: {overdue.sum()} overdue ({overdue_value:,.0f} EUR outstanding)")
         except Exception:
             pass
         try:
-            contracts = self.graph.get_all_contracts_raw()
-            expiring_90 = [c for c in contracts if 0 < (c.get("days_until_expiry") or 999) <= 90]
-            lines.append(f"  Contracts: {len(contracts)} total, {len(expiring_90)} expiring within 90 days")
+            contracts = self.graph.get_all_contracts_arrays()
+            days_left = contracts["days_until_expiry"]
+            expiring_90 = (days_left > 0) & (days_left <= 90)
+            lines.append(f"  Contracts: {days_left.size} total, {expiring_90.sum()} expiring within 90 days")
         except Exception:
             pass
         return "\n".join(lines) if len(lines) > 1 else ""
@@ -311,129 +394,143 @@ class RAGOrchestrator:
     # ============================================
 
     async def _graph_context(self, question: str) -> str:
-        """Build financial context from live Neo4j data."""
-        return self._graph_context_sync(question)
+        """Build financial context from live Neo4j data, querying the matched sections concurrently."""
+        q_lower = question.lower()
+        sections = self._graph_context_sections(q_lower)
+        if not sections:
+            return ""
+        parts = await asyncio.gather(*(asyncio.to_thread(section, q_lower) for section in sections))
+        return "\n\n".join(part for part in parts if part)
 
     def _graph_context_sync(self, question: str) -> str:
-        """Synchronous graph context builder."""
-        parts = []
+        """Synchronous graph context builder; matched sections run on a thread pool."""
         q_lower = question.lower()
+        sections = self._graph_context_sections(q_lower)
+        if not sections:
+            return ""
+        if len(sections) > 1:
+            # Each section is an independent Neo4j round trip
+            with ThreadPoolExecutor(max_workers=len(sections)) as executor:
+                parts = list(executor.map(lambda section: section(q_lower), sections))
+        else:
+            parts = [section(q_lower) for section in sections]
+        return "\n\n".join(part for part in parts if part)
+
+    def _graph_context_sections(self, q_lower: str) -> List[Callable[[str], str]]:
+        """Return the graph context sections the question asks about, in output order."""
+        topics = question_topics(q_lower)
+        sections = [
+            ("budget", self._budget_context),
+            ("invoice", self._invoice_context),
+            ("vendor", self._vendor_context),
+            ("contract", self._contract_context),
+        ]
+        return [section for topic, section in sections if topic in topics]
+
+    def _budget_context(self, q_lower: str) -> str:
+        """Per-department budget totals across all years."""
+        try:
+            departments = self.graph.get_department_budget_totals()
+            if departments:
+                unique_depts = sum(1 for d in departments if d.get("department"))
+                total_rows = sum(d["periods"] for d in departments)
+                lines = [f"LIVE BUDGET DATA ({unique_depts} departments, {total_rows} budget rows across all years):"]
+                for d in departments:
+                    variance = d["actual"] - d["budget"]
+                    lines.append(
+                        f"  {d.get('department') or '?'}: total budget={d['budget']:,.0f}, "
+                        f"actual={d['actual']:,.0f}, "
+                        f"variance={variance:+,.0f} "
+                        f"({d['periods_over']} year(s) over budget)"
+                    )
+                return "\n".join(lines)
+        except Exception:
+            pass
+        return ""
 
-        # Budget context
-        if any(w in q_lower for w in ["budget", "spend", "dépense", "overspend", "variance", "department", "performance", "summarize", "summary"]):
-            try:
-                budgets = self.graph.get_all_budgets_raw()
-                if budgets:
-                    unique_depts = set(b.get("department") for b in budgets if b.get("department"))
-                    over = [b for b in budgets if (b.get("actual") or 0) > (b.get("budget") or 0)]
-                    lines = [f"LIVE BUDGET DATA ({len(unique_depts)} departments, {len(budgets)} budget rows across all years):"]
-                    # Aggregate by department
-                    dept_totals: Dict[str, Dict] = {}
-                    for b in budgets:
-                        d = b.get("department", "?")
-                        if d not in dept_totals:
-                            dept_totals[d] = {"budget": 0, "actual": 0, "years_over": 0}
-                        dept_totals[d]["budget"] += b.get("budget", 0) or 0
-                        dept_totals[d]["actual"] += b.get("actual", 0) or 0
-                        if (b.get("actual") or 0) > (b.get("budget") or 0):
-                            dept_totals[d]["years_over"] += 1
-                    for dept, totals in sorted(dept_totals.items()):
-                        variance = totals["actual"] - totals["budget"]
-                        lines.append(
-                            f"  {dept}: total budget={totals['budget']:,.0f}, "
-                            f"actual={totals['actual']:,.0f}, "
-                            f"variance={variance:+,.0f} "
-                            f"({totals['years_over']} year(s) over budget)"
-                        )
-                    parts.append("\n".join(lines))
-            except Exception:
-                pass
-
-        # Invoice context
-        if any(w in q_lower for w in ["invoice", "facture", "overdue", "payment", "paiement"]):
-            try:
-                invoices = self.graph.get_all_invoices_raw()
-                overdue = [i for i in invoices if (i.get("days_overdue") or 0) > 0]
-                if overdue:
-                    total = sum(i.get("amount", 0) or 0 for i in overdue)
-                    lines = [f"OVERDUE INVOICES ({len(overdue)} total, {total:,.0f} EUR outstanding):"]
-                    for inv in overdue[:5]:
-                        lines.append(
-                            f"  {inv.get('vendor','?')}: "
-                            f"{inv.get('amount',0):,.0f} EUR, "
-                            f"{inv.get('days_overdue',0)} days overdue"
-                        )
-                    parts.append("\n".join(lines))
-            except Exception:
-                pass
-
-        # Vendor / quarterly aggregation context
-        if any(w in q_lower for w in ["vendor", "q1", "q2", "q3", "q4", "quarter", "biggest", "largest", "top vendor", "supplier"]):
-            try:
-                # Detect which quarter is being asked about
-                quarter_map = {"q1": (1, 3), "q2": (4, 6), "q3": (7, 9), "q4": (10, 12),
-                               "first quarter": (1, 3), "second quarter": (4, 6),
-                               "third quarter": (7, 9), "fourth quarter": (10, 12)}
-                month_start, month_end = 1, 12  # default: full year
-                quarter_label = "full year"
-                for kw, (ms, me) in quarter_map.items():
-                    if kw in q_lower:
-                        month_start, month_end = ms, me
-                        quarter_label = kw.upper()
-                        break
-
-                query = """
-                MATCH (i:Invoice)
-                WHERE i.date IS NOT NULL
-                  AND i.date.month >= $month_start
-                  AND i.date.month <= $month_end
-                RETURN i.vendor AS vendor,
-                       count(i) AS invoice_count,
-                       sum(i.amount) AS total_amount
-                ORDER BY total_amount DESC
-                LIMIT 10
-                """
-                with self.graph.driver.session() as session:
-                    result = session.run(query, month_start=month_start, month_end=month_end)
-                    rows = [dict(r) for r in result]
-
-                if rows:
-                    lines = [f"VENDOR TOTALS ({quarter_label}, by invoice amount):"]
-                    for r in rows:
-                        lines.append(
-                            f"  {r.get('vendor','?')}: "
-                            f"{r.get('total_amount', 0):,.0f} EUR "
-                            f"({r.get('invoice_count', 0)} invoices)"
-                        )
-                    parts.append("\n".join(lines))
-            except Exception:
-                pass
-
-        # Contract context
-        if any(w in q_lower for w in ["contract", "contrat", "expir", "vendor", "fournisseur"]):
-            try:
-                contracts = self.graph.get_all_contracts_raw()
-                active = [c for c in contracts if (c.get("days_until_expiry") or 9999) > 0]
-                expiring_soon = [c for c in active if (c.get("days_until_expiry") or 9999) <= 365]
-                total_value = sum(c.get("annual_value", 0) or 0 for c in active)
+    def _invoice_context(self, q_lower: str) -> str:
+        """Overdue invoice count, total and the first few overdue invoices."""
+        try:
+            summary = self.graph.get_overdue_invoice_summary(limit=5)
+            if summary and summary["overdue_count"]:
                 lines = [
-                    f"CONTRACTS ({len(active)} active, total annual value: {total_value:,.0f} EUR):"
+                    f"OVERDUE INVOICES ({summary['overdue_count']} total, "
+                    f"{summary['total_amount']:,.0f} EUR outstanding):"
                 ]
-                if expiring_soon:
-                    lines.append(f"  Expiring within 365 days ({len(expiring_soon)} contracts):")
-                    for c in sorted(expiring_soon, key=lambda x: x.get("days_until_expiry", 999))[:8]:
-                        lines.append(
-                            f"    {c.get('vendor','?')}: "
-                            f"{c.get('annual_value',0):,.0f} EUR/yr, "
-                            f"expires in {c.get('days_until_expiry','?')} days"
-                        )
-                else:
-                    lines.append("  No contracts expiring within 365 days.")
-                parts.append("\n".join(lines))
-            except Exception:
-                pass
+                for inv in summary["invoices"]:
+                    lines.append(
+                        f"  {inv.get('vendor','?')}: "
+                        f"{inv.get('amount',0):,.0f} EUR, "
+                        f"{inv.get('days_overdue',0)} days overdue"
+                    )
+                return "\n".join(lines)
+        except Exception:
+            pass
+        return ""
 
-        return "\n\n".join(parts)
+    def _vendor_context(self, q_lower: str) -> str:
+        """Top vendors by invoice amount, for the quarter named in the question (default: full year)."""
+        try:
+            # Detect which quarter is being asked about
+            quarter_map = {"q1": (1, 3), "q2": (4, 6), "q3": (7, 9), "q4": (10, 12),
+                           "first quarter": (1, 3), "second quarter": (4, 6),
+                           "third quarter": (7, 9), "fourth quarter": (10, 12)}
+            month_start, month_end = 1, 12  # default: full year
+            quarter_label = "full year"
+            for kw, (ms, me) in quarter_map.items():
+                if kw in q_lower:
+                    month_start, month_end = ms, me
+                    quarter_label = kw.upper()
+                    break
+
+            query = """
+            MATCH (i:Invoice)
+            WHERE i.date IS NOT NULL
+              AND i.date.month >= $month_start
+              AND i.date.month <= $month_end
+            RETURN i.vendor AS vendor,
+                   count(i) AS invoice_count,
+                   sum(i.amount) AS total_amount
+            ORDER BY total_amount DESC
+            LIMIT 10
+            """
+            rows = self.graph.run_read(query, month_start=month_start, month_end=month_end)
+
+            if rows:
+                lines = [f"VENDOR TOTALS ({quarter_label}, by invoice amount):"]
+                for r in rows:
+                    lines.append(
+                        f"  {r.get('vendor','?')}: "
+                        f"{r.get('total_amount', 0):,.0f} EUR "
+                        f"({r.get('invoice_count', 0)} invoices)"
+                    )
+                return "\n".join(lines)
+        except Exception:
+            pass
+        return ""
+
+    def _contract_context(self, q_lower: str) -> str:
+        """Active contract value and contracts expiring within a year."""
+        try:
+            summary = self.graph.get_contract_expiry_summary(within_days=365, limit=8)
+            lines = [
+                f"CONTRACTS ({summary['active_count']} active, "
+                f"total annual value: {summary['total_annual_value']:,.0f} EUR):"
+            ]
+            if summary["expiring"]:
+                lines.append(f"  Expiring within 365 days ({summary['expiring_count']} contracts):")
+                for c in summary["expiring"]:
+                    lines.append(
+                        f"    {c.get('vendor','?')}: "
+                        f"{c.get('annual_value',0):,.0f} EUR/yr, "
+                        f"expires in {c.get('days_until_expiry','?')} days"
+                    )
+            else:
+                lines.append("  No contracts expiring within 365 days.")
+            return "\n".join(lines)
+        except Exception:
+            pass
+        return ""
 
     # ============================================
     # Graph Relationship Traversal
@@ -451,6 +548,7 @@ class RAGOrchestrator:
             Dict with contract data and list of invoice nodes
         """
         query = """
+        WITH date() AS today
         MATCH (c:Contract {id: $contract_id})
         OPTIONAL MATCH (c)-[:GENERATES]->(i:Invoice)
         RETURN c.id AS contract_id, c.vendor AS vendor,
@@ -460,14 +558,11 @@ class RAGOrchestrator:
                    amount: i.amount,
                    status: i.status,
                    days_overdue: CASE WHEN i.due_date IS NOT NULL
-                                 THEN duration.inDays(i.due_date, date()).days
+                                 THEN duration.inDays(i.due_date, today).days
                                  ELSE 0 END
                }) AS invoices
         """
-        with self.graph.driver.session() as session:
-            result = session.run(query, contract_id=contract_id)
-            record = result.single()
-            return dict(record) if record else {}
+        return self.graph.run_read_one(query, contract_id=contract_id) or {}
 
     def get_vendor_financial_summary(self, vendor: str) -> Dict[str, Any]:
         """
@@ -490,7 +585,4 @@ class RAGOrchestrator:
                sum(DISTINCT i.amount) AS total_invoiced,
                collect(DISTINCT m.description) AS patterns
         """
-        with self.graph.driver.session() as session:
-            result = session.run(query, vendor=vendor)
-            record = result.single()
-            return dict(record) if record else {}
+        return self.graph.run_read_one(query, vendor=vendor) or {}
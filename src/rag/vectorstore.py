@@ -5,6 +5,7 @@ This module handles vector embeddings and semantic search across financial docum
 """
 
 from typing import List, Dict, Any
+import hashlib
 import numpy as np
 from pathlib import Path
 import json
@@ -12,6 +13,18 @@ import json
 from sentence_transformers import SentenceTransformer
 from src.config import settings
 
+try:
+    from blake3 import blake3
+    HAS_BLAKE3 = True
+except ImportError:
+    HAS_BLAKE3 = False
+
+
+def _text_hash(text: str) -> str:
+    """Hash document text to detect unchanged content (blake3 when available, otherwise blake2b)."""
+    data = text.encode("utf-8")
+    return blake3(data).hexdigest() if HAS_BLAKE3 else hashlib.blake2b(data).hexdigest()
+
 
 class VectorStore:
     """Vector store for semantic search using FAISS."""
@@ -52,28 +65,84 @@ class VectorStore:
         """
         return self.model.encode(text, convert_to_numpy=True)
     
-    def add_document(self, doc_id: str, text: str, metadata: Dict[str, Any]):
+    def add_document(self, doc_id: str, text: str, metadata: Dict[str, Any]) -> bool:
         """
         Add a document to the vector store.
+
+        The embedding is only recomputed when the text or the embedding model
+        changed since the document was last added.
         
         Args:
             doc_id: Unique document identifier
             text: Document text content
             metadata: Additional metadata (type, date, etc.)
+
+        Returns:
+            True if a new embedding was computed, False if the stored one was reused
         """
-        # Generate embedding
-        embedding = self.embed_text(text)
-        
-        # Save embedding to disk
-        embedding_path = self.vector_path / f"{doc_id}.npy"
-        np.save(embedding_path, embedding)
-        
-        # Store metadata
-        self.metadata[doc_id] = {
-            "text": text[:500],  # Store first 500 chars
-            **metadata
-        }
+        return self.add_documents([doc_id], [text], [metadata]) == 1
+
+    def add_documents(
+        self,
+        doc_ids: List[str],
+        texts: List[str],
+        metadatas: List[Dict[str, Any]],
+        batch_size: int = 64
+    ) -> int:
+        """
+        Add several documents with a single batched model call.
+
+        Documents whose text and embedding model are unchanged keep their
+        stored embedding. Metadata is written to disk once for the whole batch,
+        after the new embeddings have been saved.
+
+        Args:
+            doc_ids: Unique document identifiers
+            texts: Document text contents
+            metadatas: Additional metadata per document
+            batch_size: Batch size passed to the embedding model
+
+        Returns:
+            Number of embeddings computed
+        """
+        to_embed = []
+        entries = {}
+
+        for doc_id, text, metadata in zip(doc_ids, texts, metadatas):
+            embedding_path = self.vector_path / f"{doc_id}.npy"
+            text_hash = _text_hash(text)
+
+            previous = self.metadata.get(doc_id, {})
+            reused = (
+                previous.get("text_hash") == text_hash
+                and previous.get("embedding_model") == settings.EMBEDDING_MODEL
+                and embedding_path.exists()
+            )
+            if not reused:
+                to_embed.append((embedding_path, text))
+
+            entries[doc_id] = {
+                "text": text[:500],  # Store first 500 chars
+                **metadata,
+                "text_hash": text_hash,
+                "embedding_model": settings.EMBEDDING_MODEL
+            }
+
+        if to_embed:
+            embeddings = self.model.encode(
+                [text for _, text in to_embed],
+                batch_size=batch_size,
+                convert_to_numpy=True
+            )
+            for (embedding_path, _), embedding in zip(to_embed, embeddings):
+                np.save(embedding_path, embedding)
+
+        # Record the new text hashes only once their vectors are on disk, so
+        # a failed encode or save never marks a stale embedding as current
+        self.metadata.update(entries)
         self._save_metadata()
+
+        return len(to_embed)
     
     async def search(self, query: str, limit: int = 10) -> List[Dict[str, Any]]:
         """
@@ -134,41 +134,38 @@ class AIScenarioGenerator:
         lines = ["=== CURRENT FINANCIAL CONTEXT ==="]
 
         try:
-            budgets = self.graph.get_all_budgets_raw()
-            if budgets:
-                over = [b for b in budgets if (b.get("actual") or 0) > (b.get("budget") or 0)]
-                total_overrun = sum(
-                    (b.get("actual", 0) or 0) - (b.get("budget", 0) or 0)
-                    for b in over
-                )
+            budgets = self.graph.get_all_budgets_arrays()
+            if budgets["budget"].size:
+                overruns = budgets["actual"] - budgets["budget"]
+                over = overruns > 0
                 lines.append(
-                    f"BUDGETS: {len(budgets)} departments tracked, "
-                    f"{len(over)} over budget, total overrun: {total_overrun:,.0f} EUR"
+                    f"BUDGETS: {budgets['budget'].size} departments tracked, "
+                    f"{over.sum()} over budget, total overrun: {overruns[over].sum():,.0f} EUR"
                 )
         except Exception:
             pass
 
         try:
-            invoices = self.graph.get_all_invoices_raw()
-            overdue = [i for i in invoices if (i.get("days_overdue") or 0) > 0]
-            total_overdue_amt = sum(i.get("amount", 0) or 0 for i in overdue)
-            if overdue:
+            invoices = self.graph.get_all_invoices_arrays()
+            days_overdue = invoices["days_overdue"]
+            overdue = days_overdue > 0
+            if overdue.any():
                 lines.append(
-                    f"INVOICES: {len(overdue)} overdue invoices, "
-                    f"total outstanding: {total_overdue_amt:,.0f} EUR, "
-                    f"oldest: {max(i.get('days_overdue', 0) or 0 for i in overdue)} days"
+                    f"INVOICES: {overdue.sum()} overdue invoices, "
+                    f"total outstanding: {invoices['amount'][overdue].sum():,.0f} EUR, "
+                    f"oldest: {days_overdue[overdue].max()} days"
                 )
         except Exception:
             pass
 
         try:
-            contracts = self.graph.get_all_contracts_raw()
-            expiring = [c for c in contracts if 0 < (c.get("days_until_expiry") or 999) <= 90]
-            total_contract_value = sum(c.get("annual_value", 0) or 0 for c in expiring)
-            if expiring:
+            contracts = self.graph.get_all_contracts_arrays()
+            days_left = contracts["days_until_expiry"]
+            expiring = (days_left > 0) & (days_left <= 90)
+            if expiring.any():
                 lines.append(
-                    f"CONTRACTS: {len(expiring)} expiring in <90 days, "
-                    f"total annual value at risk: {total_contract_value:,.0f} EUR"
+                    f"CONTRACTS: {expiring.sum()} expiring in <90 days, "
+                    f"total annual value at risk: {contracts['annual_value'][expiring].sum():,.0f} EUR"
                 )
         except Exception:
             pass
@@ -248,5 +245,5 @@ Ensure probabilities sum to approximately 1.0.
             s.source = $source
         RETURN s
         """
-        with self.graph.driver.session() as session:
-            session.run(query, **node_data)
+        with self.graph.session() as session:
+            session.run(query, **node_data).consume()
@@ -0,0 +1,54 @@
+"""Shared fixtures: a FinancialGraph wired to an in-memory fake Neo4j driver."""
+
+import pytest
+
+from src.rag.graph import FinancialGraph
+
+
+class FakeResult:
+    def consume(self):
+        return None
+
+
+class FakeSession:
+    """Records UNWIND writes; rows whose date is 'bad' fail like a server-side date() error."""
+
+    def __init__(self, driver):
+        self.driver = driver
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def run(self, query, **params):
+        rows = params.get('rows', [])
+        if any(row.get('date') == 'bad' for row in rows):
+            raise ValueError("Text cannot be parsed to a Date")
+        self.driver.written.extend(rows)
+        return FakeResult()
+
+
+class FakeDriver:
+    execute_query_bookmark_manager = None
+
+    def __init__(self):
+        self.written = []
+
+    def session(self, **config):
+        return FakeSession(self)
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def graph():
+    """FinancialGraph on a FakeDriver; written rows collect in graph.driver.written."""
+    fake = FinancialGraph.__new__(FinancialGraph)
+    fake.driver = FakeDriver()
+    fake._async_driver = None
+    fake._read_caches = {}
+    fake._tx_clause = None
+    return fake
@@ -0,0 +1,33 @@
+"""cached_query honours the CACHE_ENABLED setting."""
+
+from src.config import settings
+from src.memory.cache import TTLCache, cached_query
+
+
+class _Reader:
+    def __init__(self):
+        self._cache = TTLCache()
+        self.calls = 0
+
+    @cached_query
+    def read(self, key):
+        self.calls += 1
+        return [key]
+
+
+def test_cached_query_reuses_results():
+    reader = _Reader()
+
+    assert reader.read("a") == reader.read("a") == ["a"]
+    assert reader.calls == 1
+
+
+def test_cached_query_bypassed_when_cache_disabled(monkeypatch):
+    monkeypatch.setattr(settings, "CACHE_ENABLED", False)
+    reader = _Reader()
+
+    reader.read("a")
+    reader.read("a")
+
+    assert reader.calls == 2
+    assert reader._cache.get(("read", ("a",), ())) is None
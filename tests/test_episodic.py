@@ -0,0 +1,61 @@
+"""EpisodicMemory.run_pattern_detection isolates failing sources and writes."""
+
+from src.memory.episodic import EpisodicMemory
+
+
+class _Graph:
+    """Graph stub serving overdue stats for two vendors; one source query fails."""
+
+    def __init__(self, bad_pattern_id=None):
+        self.bad_pattern_id = bad_pattern_id
+        self.stored = []
+
+    def clear_cache(self):
+        pass
+
+    def get_data_fingerprint(self):
+        return "fp"
+
+    def get_vendor_invoice_stats(self, min_amount=0):
+        return []
+
+    def get_vendor_contract_monthly(self):
+        return []
+
+    def get_department_overspend_stats(self, overspend_ratio, min_periods):
+        raise RuntimeError("query timed out")
+
+    def get_vendor_overdue_stats(self, min_invoices):
+        return [
+            {"vendor": "ACME", "overdue_count": 3, "avg_days_overdue": 45},
+            {"vendor": "Globex", "overdue_count": 4, "avg_days_overdue": 60},
+        ]
+
+    def get_all_budgets_raw(self):
+        return []
+
+    def create_episodic_memory_nodes(self, patterns, last_updated=None):
+        if any(p["id"] == self.bad_pattern_id for p in patterns):
+            raise ValueError("constraint violation")
+        self.stored.extend(p["id"] for p in patterns)
+
+
+def test_failing_source_only_skips_its_detector(capsys):
+    graph = _Graph()
+    memory = EpisodicMemory(graph)
+
+    assert memory.run_pattern_detection() == 2
+    assert graph.stored == ["late_payment_ACME", "late_payment_Globex"]
+    assert "department overspend stats query failed" in capsys.readouterr().out
+    # The run was incomplete, so the next one must not be skipped
+    assert memory._last_fingerprint is None
+
+
+def test_failing_pattern_write_keeps_the_others(capsys):
+    graph = _Graph(bad_pattern_id="late_payment_ACME")
+    memory = EpisodicMemory(graph)
+
+    memory.run_pattern_detection()
+
+    assert graph.stored == ["late_payment_Globex"]
+    assert "could not store late_payment_ACME" in capsys.readouterr().out
@@ -0,0 +1,38 @@
+"""Tests for the batched pipeline document writes in src.rag.graph."""
+
+import pytest
+
+
+def _invoice(invoice_id, total_ttc=100.0, date='2024-01-01'):
+    return {
+        'document_type': 'invoice',
+        'invoice_id': invoice_id,
+        'date': date,
+        'due_date': '2024-02-01',
+        'vendor': {'name': 'ACME'},
+        'total_ttc': total_ttc,
+    }
+
+
+def test_create_invoice_nodes_skips_documents_that_cannot_be_normalized(graph):
+    documents = [_invoice('INV-1'), _invoice('INV-2', total_ttc=None), _invoice('INV-3')]
+
+    failures = graph.create_invoice_nodes(documents)
+
+    assert [index for index, _ in failures] == [1]
+    assert isinstance(failures[0][1], TypeError)
+    assert [row['id'] for row in graph.driver.written] == ['INV-1', 'INV-3']
+
+
+def test_create_invoice_nodes_retries_a_rejected_batch_row_by_row(graph):
+    documents = [_invoice('INV-1'), _invoice('INV-2', date='bad'), _invoice('INV-3'), _invoice('INV-4')]
+
+    failures = graph.create_invoice_nodes(documents, batch_size=2)
+
+    assert [index for index, _ in failures] == [1]
+    assert sorted(row['id'] for row in graph.driver.written) == ['INV-1', 'INV-3', 'INV-4']
+
+
+def test_create_invoice_node_raises_for_its_document(graph):
+    with pytest.raises(TypeError):
+        graph.create_invoice_node(_invoice('INV-1', total_ttc=None))
@@ -0,0 +1,123 @@
+"""Question routing and aggregate graph context of RAGOrchestrator."""
+
+import random
+
+import pytest
+
+from src.rag.orchestrator import TOPIC_KEYWORDS, RAGOrchestrator, question_topics
+
+
+def _substring_topics(q_lower):
+    """The per-keyword substring checks question_topics replaced."""
+    return {topic for topic, keywords in TOPIC_KEYWORDS.items() if any(kw in q_lower for kw in keywords)}
+
+
+@pytest.mark.parametrize("question", [
+    "",
+    "which vendor had the biggest q3 invoices?",
+    "show me the top vendor by spend",
+    "should we reduce costs in the it department?",
+    "contrats qui expirent bientôt",
+    "any weak signals or stress?",
+    "summarize overdue paiement",
+    "topvendors",
+    "hello there",
+])
+def test_question_topics_matches_substring_checks(question):
+    assert question_topics(question) == _substring_topics(question)
+
+
+def test_question_topics_matches_substring_checks_on_random_text():
+    # Glue keyword fragments together so keywords overlap and nest
+    keywords = [kw for kws in TOPIC_KEYWORDS.values() for kw in kws]
+    pieces = keywords + [kw[:3] for kw in keywords] + [kw[2:] for kw in keywords] + [" ", "x"]
+    rng = random.Random(0)
+    for _ in range(2000):
+        question = "".join(rng.choice(pieces) for _ in range(rng.randint(1, 6)))
+        assert question_topics(question) == _substring_topics(question), question
+
+
+class _Graph:
+    """Serves fixed aggregate rows in the shape of the FinancialGraph queries."""
+
+    def __init__(self, departments=(), overdue=None, contracts=None):
+        self.departments = list(departments)
+        self.overdue = overdue
+        self.contracts = contracts
+        self.calls = []
+
+    def get_department_budget_totals(self):
+        return self.departments
+
+    def get_overdue_invoice_summary(self, limit):
+        self.calls.append(("overdue", limit))
+        return self.overdue
+
+    def get_contract_expiry_summary(self, within_days, limit):
+        self.calls.append(("contracts", within_days, limit))
+        return self.contracts
+
+
+def _orchestrator(graph):
+    orchestrator = RAGOrchestrator.__new__(RAGOrchestrator)
+    orchestrator.graph = graph
+    return orchestrator
+
+
+def test_budget_context_formats_department_totals():
+    graph = _Graph(departments=[
+        {"department": "IT", "budget": 1000.0, "actual": 1200.0, "periods": 2, "periods_over": 1},
+        {"department": None, "budget": 500.0, "actual": 400.0, "periods": 1, "periods_over": 0},
+    ])
+
+    assert _orchestrator(graph)._budget_context("budget") == "\n".join([
+        "LIVE BUDGET DATA (1 departments, 3 budget rows across all years):",
+        "  IT: total budget=1,000, actual=1,200, variance=+200 (1 year(s) over budget)",
+        "  ?: total budget=500, actual=400, variance=-100 (0 year(s) over budget)",
+    ])
+    assert _orchestrator(_Graph())._budget_context("budget") == ""
+
+
+def test_invoice_context_formats_overdue_summary():
+    graph = _Graph(overdue={
+        "overdue_count": 7,
+        "total_amount": 12345.6,
+        "invoices": [
+            {"vendor": "ACME", "amount": 5000.0, "days_overdue": 90},
+            {"vendor": "Globex", "amount": 250.0, "days_overdue": 3},
+        ],
+    })
+
+    assert _orchestrator(graph)._invoice_context("overdue") == "\n".join([
+        "OVERDUE INVOICES (7 total, 12,346 EUR outstanding):",
+        "  ACME: 5,000 EUR, 90 days overdue",
+        "  Globex: 250 EUR, 3 days overdue",
+    ])
+    assert graph.calls == [("overdue", 5)]
+
+    empty = _Graph(overdue={"overdue_count": 0, "total_amount": 0.0, "invoices": []})
+    assert _orchestrator(empty)._invoice_context("overdue") == ""
+
+
+def test_contract_context_formats_expiry_summary():
+    graph = _Graph(contracts={
+        "active_count": 4,
+        "total_annual_value": 80000.0,
+        "expiring_count": 1,
+        "expiring": [{"vendor": "ACME", "annual_value": 20000.0, "days_until_expiry": 45}],
+    })
+
+    assert _orchestrator(graph)._contract_context("contract") == "\n".join([
+        "CONTRACTS (4 active, total annual value: 80,000 EUR):",
+        "  Expiring within 365 days (1 contracts):",
+        "    ACME: 20,000 EUR/yr, expires in 45 days",
+    ])
+    assert graph.calls == [("contracts", 365, 8)]
+
+    quiet = _Graph(contracts={
+        "active_count": 2, "total_annual_value": 1000.0, "expiring_count": 0, "expiring": [],
+    })
+    assert _orchestrator(quiet)._contract_context("contract") == "\n".join([
+        "CONTRACTS (2 active, total annual value: 1,000 EUR):",
+        "  No contracts expiring within 365 days.",
+    ])
@@ -0,0 +1,117 @@
+"""Tests for src.ingestion.pipeline."""
+
+from pathlib import Path
+
+import pytest
+
+from src.ingestion.pipeline import IngestionPipeline
+
+
+@pytest.fixture
+def pipeline(tmp_path):
+    (tmp_path / "input").mkdir()
+    pipeline = IngestionPipeline(tmp_path / "input", tmp_path / "output", use_multiprocessing=False)
+    pipeline.graph = None
+    pipeline.vectorstore = None
+    return pipeline
+
+
+def _file_info(tmp_path, name):
+    return {'path': tmp_path / "input" / name, 'type': 'invoice', 'format': 'json'}
+
+
+class _UnwritablePath:
+    def write_bytes(self, data):
+        raise TypeError("cannot write")
+
+
+def test_writer_survives_non_os_errors(pipeline, tmp_path):
+    failing = _file_info(tmp_path, "bad.json")
+    good = _file_info(tmp_path, "good.json")
+
+    pipeline._start_writer()
+    pipeline._write_queue.put((failing, _UnwritablePath(), b"{}"))
+    pipeline._save_document({'invoice_id': 'INV-1'}, good)
+    pipeline._counts['files_processed'] += 2
+    pipeline._stop_writer()
+
+    assert (tmp_path / "output" / "metadata" / "good_processed.json").exists()
+    assert pipeline._counts['files_processed'] == 1
+    assert pipeline._counts['files_failed'] == 1
+    assert pipeline.stats['errors'][-1]['file'] == str(failing['path'])
+
+
+def test_stop_writer_does_not_block_on_a_dead_writer(pipeline):
+    pipeline._start_writer()
+    pipeline._write_queue.put(None)
+    pipeline._writer.join()
+
+    pipeline._stop_writer()
+
+    assert pipeline._writer is None
+
+
+class _FailingVectorStore:
+    def add_documents(self, doc_ids, texts, metadatas):
+        raise RuntimeError("embedding model unavailable")
+
+
+class _VectorStore:
+    def add_documents(self, doc_ids, texts, metadatas):
+        return len(doc_ids)
+
+
+def _write_invoice(tmp_path, name='inv_0.json'):
+    invoices = tmp_path / "input" / "invoices"
+    invoices.mkdir(parents=True, exist_ok=True)
+    (invoices / name).write_text(
+        '{"invoice_id": "INV-0000", "date": "2024-01-02", "due_date": "2024-02-02",'
+        ' "vendor": {"name": "ACME"}, "total_ht": 100.0, "tax_rate": 0.2, "total_ttc": 120.0}'
+    )
+
+
+def test_fingerprint_is_not_cached_when_a_deferred_write_fails(pipeline, tmp_path):
+    _write_invoice(tmp_path)
+
+    pipeline.vectorstore = _FailingVectorStore()
+    pipeline.ingest()
+    assert pipeline.stats['files_skipped_cached'] == 0
+
+    pipeline.vectorstore = _VectorStore()
+    pipeline.ingest()
+    assert pipeline.stats['files_skipped_cached'] == 0
+
+    pipeline.ingest()
+    assert pipeline.stats['files_skipped_cached'] == 1
+
+
+def test_flush_graph_only_fails_the_bad_document(pipeline, graph, tmp_path):
+    pipeline.graph = graph
+    good = _file_info(tmp_path, "good.json")
+    bad = _file_info(tmp_path, "bad.pdf")
+    pipeline._add_to_graph(
+        {'document_type': 'invoice', 'invoice_id': 'INV-1', 'vendor': {'name': 'ACME'}, 'total_ttc': 10.0},
+        good
+    )
+    pipeline._add_to_graph(
+        {'document_type': 'invoice', 'invoice_id': 'INV-2', 'vendor': {'name': 'ACME'}, 'total_ttc': None},
+        bad
+    )
+
+    pipeline._flush_graph()
+
+    assert [row['id'] for row in graph.driver.written] == ['INV-1']
+    assert pipeline._incomplete_files == {str(bad['path'])}
+
+
+def test_existing_output_is_not_trusted_for_files_sharing_a_stem(pipeline, tmp_path):
+    first = _file_info(tmp_path, "a/report.json")
+    second = _file_info(tmp_path, "b/report.pdf")
+    unique = _file_info(tmp_path, "other.json")
+    metadata = tmp_path / "output" / "metadata"
+    (metadata / "report_processed.json").write_text("{}")
+    (metadata / "other_processed.json").write_text("{}")
+
+    outputs = pipeline._scan_existing_outputs([first, second, unique])
+
+    assert list(outputs) == [str(unique['path'])]
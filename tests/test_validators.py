@@ -0,0 +1,65 @@
+"""Tests for src.ingestion.validators."""
+
+import random
+from datetime import datetime, timezone
+
+from src.ingestion import validators
+from src.ingestion.validators import batch_validate, iter_duplicates
+
+
+def _invoice(invoice_id, date, due_date):
+    return {
+        'invoice_id': invoice_id,
+        'total_ttc': 100,
+        'vendor': {'name': f'Vendor {invoice_id}'},
+        'date': date,
+        'due_date': due_date,
+    }
+
+
+def test_batch_validate_mixed_timezone_awareness():
+    """A document mixing aware and naive dates is compared, not rejected with TypeError."""
+    documents = [
+        _invoice('INV-1', '2024-01-01T10:00:00+02:00', '2024-02-01'),
+        _invoice('INV-2', datetime(2024, 1, 1, tzinfo=timezone.utc), datetime(2024, 1, 31)),
+        _invoice('INV-3', '2024-03-01', '2024-02-01T00:00:00+00:00'),
+    ]
+
+    summary = batch_validate(documents, 'invoice')
+
+    assert summary['total_documents'] == 3
+    assert summary['valid_count'] == 2
+    assert summary['invalid_count'] == 1
+
+
+def test_batch_validate_does_not_modify_input_dates():
+    document = _invoice('INV-1', '2024-01-01T10:00:00+02:00', '2024-02-01')
+
+    batch_validate([document], 'invoice')
+
+    assert document['date'] == '2024-01-01T10:00:00+02:00'
+
+
+def _all_pairs(values, threshold):
+    n = len(values)
+    return ((i, j) for i in range(n) for j in range(i + 1, n))
+
+
+def test_iter_duplicates_blocking_matches_all_pairs(monkeypatch):
+    """Amount and q-gram blocking drop no pair that scoring every pair would find."""
+    rng = random.Random(0)
+    names = ['acme corp', 'acme corp.', 'acme', 'globex sarl', 'globex sas', 'x', '']
+    documents = []
+    for _ in range(60):
+        document = {'vendor': {'name': rng.choice(names)}, 'date': rng.choice(['2024-01-01', '2024-01-02'])}
+        if rng.random() < 0.7:
+            document['total_ttc'] = rng.choice([100, 100.5, 101, 250, None])
+        documents.append(document)
+
+    for key_fields in (None, ['vendor'], ['vendor', 'date'], ['vendor', 'total_ttc']):
+        for threshold in (0.9, 0.95, 0.99):
+            blocked = sorted(iter_duplicates(documents, threshold, key_fields))
+            with monkeypatch.context() as patched:
+                patched.setattr(validators, '_candidate_pairs', _all_pairs)
+                expected = sorted(iter_duplicates(documents, threshold, key_fields))
+            assert blocked == expected, (key_fields, threshold)
@@ -0,0 +1,51 @@
+"""WeakSignalDetector.run_detection only skips reruns after complete runs."""
+
+from src.intelligence.weak_signals import WeakSignalDetector
+
+
+class _Graph:
+    """Graph stub whose invoice query fails until `healthy` is set."""
+
+    def __init__(self):
+        self.healthy = False
+        self.invoice_reads = 0
+
+    def clear_cache(self):
+        pass
+
+    def get_data_fingerprint(self, include_patterns=False):
+        return "fp"
+
+    def get_all_budgets_raw(self):
+        return []
+
+    def get_all_invoices_raw(self):
+        self.invoice_reads += 1
+        if not self.healthy:
+            raise RuntimeError("connection reset")
+        return []
+
+    def get_all_contracts_raw(self):
+        return []
+
+    def get_episodic_memories(self):
+        return []
+
+
+def test_failed_source_does_not_record_fingerprint(capsys):
+    graph = _Graph()
+    detector = WeakSignalDetector(graph)
+
+    assert detector.run_detection() == []
+    assert "invoices query failed" in capsys.readouterr().out
+    assert detector._last_fingerprint is None
+
+    # Same fingerprint, but the failed run must be retried
+    graph.healthy = True
+    detector.run_detection()
+    assert graph.invoice_reads == 2
+    assert detector._last_fingerprint == "fp"
+
+    # Now complete, so an unchanged graph skips the run
+    detector.run_detection()
+    assert graph.invoice_reads == 2